@@ -0,0 +1,69 @@
+"""Replace full is_deleted indexes with partial soft-delete indexes
+
+Revision ID: soft_delete_partial_indexes
+Revises: update_user_ids_to_string
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "soft_delete_partial_indexes"
+down_revision = "update_user_ids_to_string"
+branch_labels = None
+depends_on = None
+
+
+# Every table inheriting BaseModel had a full index on is_deleted
+SOFT_DELETE_TABLES = [
+    "collections",
+    "users",
+    "products",
+    "files",
+    "product_variants",
+    "size_charts",
+    "technical_drawings",
+    "technical_specifications",
+    "product_images",
+]
+
+# Hot tables get partial indexes: live rows, and deleted rows for reports
+PARTIAL_INDEX_PREFIXES = {
+    "collections": "idx_collection",
+    "products": "idx_product",
+    "files": "idx_file",
+    "product_variants": "idx_variant",
+    "product_images": "idx_product_image",
+}
+
+
+def upgrade() -> None:
+    for table in SOFT_DELETE_TABLES:
+        op.drop_index(f"ix_{table}_is_deleted", table_name=table)
+
+    for table, prefix in PARTIAL_INDEX_PREFIXES.items():
+        op.create_index(
+            f"{prefix}_active",
+            table,
+            ["id"],
+            unique=False,
+            postgresql_where=sa.text("is_deleted = false"),
+        )
+        op.create_index(
+            f"{prefix}_deleted_at",
+            table,
+            ["deleted_at"],
+            unique=False,
+            postgresql_where=sa.text("deleted_at IS NOT NULL"),
+        )
+
+
+def downgrade() -> None:
+    for table, prefix in PARTIAL_INDEX_PREFIXES.items():
+        op.drop_index(f"{prefix}_deleted_at", table_name=table)
+        op.drop_index(f"{prefix}_active", table_name=table)
+
+    for table in SOFT_DELETE_TABLES:
+        op.create_index(f"ix_{table}_is_deleted", table, ["is_deleted"], unique=False)
@@ -0,0 +1,39 @@
+"""Drop redundant indexes on primary key id columns
+
+Revision ID: drop_redundant_id_indexes
+Revises: soft_delete_partial_indexes
+Create Date: 2026-10-16 09:15:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "drop_redundant_id_indexes"
+down_revision = "soft_delete_partial_indexes"
+branch_labels = None
+depends_on = None
+
+
+# The primary key constraint already indexes id on every BaseModel table
+TABLES = [
+    "collections",
+    "users",
+    "products",
+    "files",
+    "product_variants",
+    "size_charts",
+    "technical_drawings",
+    "technical_specifications",
+    "product_images",
+]
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.drop_index(f"ix_{table}_id", table_name=table)
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.create_index(f"ix_{table}_id", table, ["id"], unique=False)
@@ -0,0 +1,31 @@
+"""Store file content hashes as raw bytea digests
+
+Revision ID: file_hashes_bytea
+Revises: drop_redundant_id_indexes
+Create Date: 2026-10-16 09:30:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "file_hashes_bytea"
+down_revision = "drop_redundant_id_indexes"
+branch_labels = None
+depends_on = None
+
+
+HASH_COLUMNS = ["hash_md5", "hash_sha256"]
+
+
+def upgrade() -> None:
+    # The ix_files_hash_* indexes are rebuilt by the type change
+    for column in HASH_COLUMNS:
+        op.execute(
+            f"ALTER TABLE files ALTER COLUMN {column} TYPE bytea USING decode({column}, 'hex')"
+        )
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE files ALTER COLUMN hash_md5 TYPE varchar(32) USING encode(hash_md5, 'hex')")
+    op.execute("ALTER TABLE files ALTER COLUMN hash_sha256 TYPE varchar(64) USING encode(hash_sha256, 'hex')")
@@ -0,0 +1,40 @@
+"""Replace product collection/status index with a covering index
+
+Revision ID: product_listing_covering_index
+Revises: file_hashes_bytea
+Create Date: 2026-10-16 09:45:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "product_listing_covering_index"
+down_revision = "file_hashes_bytea"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_product_collection_status_cov",
+        "products",
+        ["collection_id", "status"],
+        unique=False,
+        postgresql_include=["name", "sku", "retail_price", "is_featured"],
+    )
+    op.drop_index("idx_product_collection_status", table_name="products")
+
+    # Index-only scans depend on an up-to-date visibility map. VACUUM can't
+    # run inside the migration transaction, so leave it to autovacuum or run
+    # VACUUM ANALYZE products after upgrading.
+
+
+def downgrade() -> None:
+    op.create_index(
+        "idx_product_collection_status",
+        "products",
+        ["collection_id", "status"],
+        unique=False,
+    )
+    op.drop_index("idx_product_collection_status_cov", table_name="products")
@@ -0,0 +1,64 @@
+"""Convert JSON columns to JSONB and add GIN indexes
+
+Revision ID: json_columns_to_jsonb
+Revises: product_listing_covering_index
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "json_columns_to_jsonb"
+down_revision = "product_listing_covering_index"
+branch_labels = None
+depends_on = None
+
+
+JSON_COLUMNS = {
+    "collections": ["extra_data"],
+    "products": ["sustainability_features", "care_instructions", "features", "extra_data"],
+    "product_variants": ["available_sizes", "extra_data"],
+    "files": ["tags", "extra_data"],
+    "size_charts": ["sizes"],
+    "technical_specifications": ["content"],
+}
+
+
+def upgrade() -> None:
+    for table, columns in JSON_COLUMNS.items():
+        for column in columns:
+            op.alter_column(
+                table,
+                column,
+                type_=postgresql.JSONB(),
+                existing_type=sa.JSON(),
+                postgresql_using=f"{column}::jsonb",
+            )
+
+    op.create_index("idx_file_tags_gin", "files", ["tags"], unique=False, postgresql_using="gin")
+    op.create_index(
+        "idx_tech_spec_content_gin",
+        "technical_specifications",
+        ["content"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"content": "jsonb_path_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_tech_spec_content_gin", table_name="technical_specifications")
+    op.drop_index("idx_file_tags_gin", table_name="files")
+
+    for table, columns in JSON_COLUMNS.items():
+        for column in columns:
+            op.alter_column(
+                table,
+                column,
+                type_=sa.JSON(),
+                existing_type=postgresql.JSONB(),
+                postgresql_using=f"{column}::json",
+            )
@@ -0,0 +1,39 @@
+"""Drop duplicate and composite-shadowed single-column indexes
+
+Revision ID: drop_duplicate_indexes
+Revises: json_columns_to_jsonb
+Create Date: 2026-10-16 10:15:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "drop_duplicate_indexes"
+down_revision = "json_columns_to_jsonb"
+branch_labels = None
+depends_on = None
+
+
+# (index name, table, columns)
+DUPLICATE_INDEXES = [
+    # Same column as the inline ix_files_* indexes
+    ("idx_file_content_type", "files", ["content_type"]),
+    ("idx_file_collection", "files", ["collection_id"]),
+    ("idx_file_product", "files", ["product_id"]),
+    # Same column as ix_product_variants_is_available
+    ("idx_variant_available", "product_variants", ["is_available"]),
+    # Leading column of idx_collection_season_year / idx_collection_status_published
+    ("ix_collections_season", "collections", ["season"]),
+    ("ix_collections_status", "collections", ["status"]),
+]
+
+
+def upgrade() -> None:
+    for name, table, _ in DUPLICATE_INDEXES:
+        op.drop_index(name, table_name=table)
+
+
+def downgrade() -> None:
+    for name, table, columns in DUPLICATE_INDEXES:
+        op.create_index(name, table, columns, unique=False)
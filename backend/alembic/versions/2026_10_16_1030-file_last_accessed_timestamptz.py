@@ -0,0 +1,46 @@
+"""Store files.last_accessed as timestamptz with a partial recency index
+
+Revision ID: file_last_accessed_timestamptz
+Revises: drop_duplicate_indexes
+Create Date: 2026-10-16 10:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "file_last_accessed_timestamptz"
+down_revision = "drop_duplicate_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "files",
+        "last_accessed",
+        type_=sa.DateTime(timezone=True),
+        existing_type=sa.String(length=50),
+        existing_nullable=True,
+        postgresql_using="NULLIF(last_accessed, '')::timestamptz",
+    )
+    op.create_index(
+        "idx_file_last_accessed",
+        "files",
+        ["last_accessed"],
+        unique=False,
+        postgresql_where=sa.text("last_accessed IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_file_last_accessed", table_name="files")
+    op.alter_column(
+        "files",
+        "last_accessed",
+        type_=sa.String(length=50),
+        existing_type=sa.DateTime(timezone=True),
+        existing_nullable=True,
+        postgresql_using="last_accessed::text",
+    )
@@ -0,0 +1,68 @@
+"""Constrain product currency codes and store collection seasons as an enum
+
+Revision ID: currency_char_season_enum
+Revises: file_last_accessed_timestamptz
+Create Date: 2026-10-16 10:45:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "currency_char_season_enum"
+down_revision = "file_last_accessed_timestamptz"
+branch_labels = None
+depends_on = None
+
+
+collection_season = postgresql.ENUM(
+    "Spring", "Summer", "Fall", "Winter", name="collection_season", create_type=False
+)
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "products",
+        "currency",
+        type_=sa.CHAR(length=3),
+        existing_type=sa.String(length=3),
+        existing_nullable=False,
+        server_default="EUR",
+    )
+    op.create_check_constraint(
+        "ck_product_currency_iso", "products", "currency ~ '^[A-Z]{3}$'"
+    )
+
+    collection_season.create(op.get_bind(), checkfirst=True)
+    op.alter_column(
+        "collections",
+        "season",
+        type_=collection_season,
+        existing_type=sa.String(length=20),
+        existing_nullable=False,
+        postgresql_using="season::collection_season",
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "collections",
+        "season",
+        type_=sa.String(length=20),
+        existing_type=collection_season,
+        existing_nullable=False,
+        postgresql_using="season::text",
+    )
+    collection_season.drop(op.get_bind(), checkfirst=True)
+
+    op.drop_constraint("ck_product_currency_iso", "products", type_="check")
+    op.alter_column(
+        "products",
+        "currency",
+        type_=sa.String(length=3),
+        existing_type=sa.CHAR(length=3),
+        existing_nullable=False,
+        server_default=None,
+    )
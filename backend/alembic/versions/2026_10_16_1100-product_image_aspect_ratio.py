@@ -0,0 +1,35 @@
+"""Add generated aspect_ratio column to product images
+
+Revision ID: product_image_aspect_ratio
+Revises: currency_char_season_enum
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "product_image_aspect_ratio"
+down_revision = "currency_char_season_enum"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "product_images",
+        sa.Column(
+            "aspect_ratio",
+            sa.Float(),
+            sa.Computed(
+                "CASE WHEN width <> 0 AND height <> 0 THEN width::float8 / height ELSE 1.0 END",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("product_images", "aspect_ratio")
@@ -0,0 +1,46 @@
+"""Add generated file_kind column to files
+
+Revision ID: file_kind_column
+Revises: product_image_aspect_ratio
+Create Date: 2026-10-16 11:15:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "file_kind_column"
+down_revision = "product_image_aspect_ratio"
+branch_labels = None
+depends_on = None
+
+
+FILE_KIND_SQL = (
+    "CASE"
+    " WHEN content_type LIKE 'image/%' THEN 'image'"
+    " WHEN content_type IN ('application/pdf', 'application/msword',"
+    " 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',"
+    " 'text/plain') THEN 'document'"
+    " WHEN content_type LIKE 'video/%' THEN 'video'"
+    " WHEN content_type LIKE 'audio/%' THEN 'audio'"
+    " ELSE 'other' END"
+)
+
+
+def upgrade() -> None:
+    op.add_column(
+        "files",
+        sa.Column(
+            "file_kind",
+            sa.String(length=10),
+            sa.Computed(FILE_KIND_SQL, persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index(op.f("ix_files_file_kind"), "files", ["file_kind"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_files_file_kind"), table_name="files")
+    op.drop_column("files", "file_kind")
@@ -0,0 +1,43 @@
+"""Add jsonb_path_ops GIN indexes on the remaining JSONB columns
+
+Revision ID: jsonb_gin_indexes
+Revises: file_kind_column
+Create Date: 2026-10-16 11:30:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "jsonb_gin_indexes"
+down_revision = "file_kind_column"
+branch_labels = None
+depends_on = None
+
+
+# (index name, table, column)
+GIN_INDEXES = [
+    ("idx_product_features_gin", "products", "features"),
+    ("idx_product_care_instructions_gin", "products", "care_instructions"),
+    ("idx_product_sustainability_gin", "products", "sustainability_features"),
+    ("idx_product_extra_data_gin", "products", "extra_data"),
+    ("idx_variant_available_sizes_gin", "product_variants", "available_sizes"),
+    ("idx_size_chart_sizes_gin", "size_charts", "sizes"),
+]
+
+
+def upgrade() -> None:
+    for name, table, column in GIN_INDEXES:
+        op.create_index(
+            name,
+            table,
+            [column],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={column: "jsonb_path_ops"},
+        )
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(GIN_INDEXES):
+        op.drop_index(name, table_name=table)
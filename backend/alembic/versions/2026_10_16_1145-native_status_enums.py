@@ -0,0 +1,64 @@
+"""Store status, role and type columns as native Postgres enums
+
+Revision ID: native_status_enums
+Revises: jsonb_gin_indexes
+Create Date: 2026-10-16 11:45:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "native_status_enums"
+down_revision = "jsonb_gin_indexes"
+branch_labels = None
+depends_on = None
+
+
+# (table, column, previous varchar length, enum name, enum values)
+ENUM_COLUMNS = [
+    ("collections", "status", 20, "collection_status", ("draft", "active", "archived")),
+    ("products", "status", 20, "product_status", ("active", "discontinued", "coming_soon")),
+    ("users", "role", 20, "user_role", ("admin", "user", "viewer")),
+    ("product_images", "type", 20, "product_image_type", ("main", "detail", "lifestyle", "thumbnail")),
+    ("size_charts", "chart_type", 20, "size_chart_type", ("standard", "plus_size", "kids", "maternity")),
+    ("technical_drawings", "view", 20, "technical_drawing_view", ("front", "back", "side", "detail")),
+    (
+        "technical_specifications",
+        "type",
+        30,
+        "technical_spec_type",
+        ("material", "construction", "care", "sizing", "sustainability"),
+    ),
+]
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    for table, column, length, enum_name, values in ENUM_COLUMNS:
+        enum_type = postgresql.ENUM(*values, name=enum_name, create_type=False)
+        enum_type.create(bind, checkfirst=True)
+        # Indexes on the column are rebuilt by ALTER TYPE
+        op.alter_column(
+            table,
+            column,
+            type_=enum_type,
+            existing_type=sa.String(length=length),
+            postgresql_using=f'"{column}"::{enum_name}',
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    for table, column, length, enum_name, values in reversed(ENUM_COLUMNS):
+        enum_type = postgresql.ENUM(*values, name=enum_name, create_type=False)
+        op.alter_column(
+            table,
+            column,
+            type_=sa.String(length=length),
+            existing_type=enum_type,
+            postgresql_using=f'"{column}"::text',
+        )
+        enum_type.drop(bind, checkfirst=True)
@@ -0,0 +1,53 @@
+"""Replace boolean flag indexes with partial indexes on the hot filters
+
+Revision ID: hot_filter_partial_indexes
+Revises: native_status_enums
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "hot_filter_partial_indexes"
+down_revision = "native_status_enums"
+branch_labels = None
+depends_on = None
+
+
+# (index name, table, columns, predicate)
+PARTIAL_INDEXES = [
+    ("idx_product_featured_partial", "products", ["category"], "is_featured = true"),
+    ("idx_variant_available_partial", "product_variants", ["product_id"], "is_available = true"),
+    ("idx_user_active_partial", "users", ["email"], "is_active = true"),
+]
+
+# Full single-column indexes on the same flags, superseded by the partial ones
+FLAG_INDEXES = [
+    ("ix_products_is_featured", "products", ["is_featured"]),
+    ("ix_product_variants_is_available", "product_variants", ["is_available"]),
+    ("ix_users_is_active", "users", ["is_active"]),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns, predicate in PARTIAL_INDEXES:
+        op.create_index(
+            name,
+            table,
+            columns,
+            unique=False,
+            postgresql_where=sa.text(predicate),
+        )
+
+    for name, table, _ in FLAG_INDEXES:
+        op.drop_index(name, table_name=table)
+
+
+def downgrade() -> None:
+    for name, table, columns in FLAG_INDEXES:
+        op.create_index(name, table, columns, unique=False)
+
+    for name, table, _, _ in PARTIAL_INDEXES:
+        op.drop_index(name, table_name=table)
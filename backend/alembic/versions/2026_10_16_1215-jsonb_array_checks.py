@@ -0,0 +1,44 @@
+"""Default JSONB list columns to empty arrays and enforce the array type
+
+Revision ID: jsonb_array_checks
+Revises: hot_filter_partial_indexes
+Create Date: 2026-10-16 12:15:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "jsonb_array_checks"
+down_revision = "hot_filter_partial_indexes"
+branch_labels = None
+depends_on = None
+
+
+# (constraint name, table, column)
+ARRAY_COLUMNS = [
+    ("ck_product_features_array", "products", "features"),
+    ("ck_product_care_instructions_array", "products", "care_instructions"),
+    ("ck_product_sustainability_array", "products", "sustainability_features"),
+    ("ck_variant_available_sizes_array", "product_variants", "available_sizes"),
+    ("ck_size_chart_sizes_array", "size_charts", "sizes"),
+    ("ck_file_tags_array", "files", "tags"),
+]
+
+
+def upgrade() -> None:
+    for name, table, column in ARRAY_COLUMNS:
+        # Anything that slipped in as a scalar or object becomes an empty list
+        op.execute(
+            f"UPDATE {table} SET {column} = '[]'::jsonb "
+            f"WHERE jsonb_typeof({column}) <> 'array'"
+        )
+        op.alter_column(table, column, server_default=sa.text("'[]'::jsonb"))
+        op.create_check_constraint(name, table, f"jsonb_typeof({column}) = 'array'")
+
+
+def downgrade() -> None:
+    for name, table, column in ARRAY_COLUMNS:
+        op.drop_constraint(name, table, type_="check")
+        op.alter_column(table, column, server_default=None)
@@ -0,0 +1,38 @@
+"""Compress long text columns with LZ4 instead of pglz
+
+Only values written after the upgrade use the new codec; existing rows keep
+pglz until they are rewritten.
+
+Revision ID: lz4_text_compression
+Revises: jsonb_array_checks
+Create Date: 2026-10-16 12:30:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "lz4_text_compression"
+down_revision = "jsonb_array_checks"
+branch_labels = None
+depends_on = None
+
+
+# (table, column) pairs large enough to be TOASTed
+LONG_TEXT_COLUMNS = [
+    ("products", "description"),
+    ("products", "seo_description"),
+    ("collections", "description"),
+    ("size_charts", "notes"),
+    ("technical_drawings", "description"),
+]
+
+
+def upgrade() -> None:
+    for table, column in LONG_TEXT_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET COMPRESSION lz4")
+
+
+def downgrade() -> None:
+    for table, column in LONG_TEXT_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET COMPRESSION pglz")
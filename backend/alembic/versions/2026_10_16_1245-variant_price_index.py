@@ -0,0 +1,30 @@
+"""Index live variant price adjustments per product
+
+Revision ID: variant_price_index
+Revises: lz4_text_compression
+Create Date: 2026-10-16 12:45:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "variant_price_index"
+down_revision = "lz4_text_compression"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_variant_price_expr",
+        "product_variants",
+        ["product_id", "price_adjustment"],
+        unique=False,
+        postgresql_where=sa.text("is_deleted = false"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_variant_price_expr", table_name="product_variants")
@@ -0,0 +1,40 @@
+"""Add BRIN indexes on created_at for time-range scans
+
+Revision ID: created_at_brin_indexes
+Revises: variant_price_index
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "created_at_brin_indexes"
+down_revision = "variant_price_index"
+branch_labels = None
+depends_on = None
+
+
+# Append-mostly tables whose created_at correlates with physical row order
+BRIN_INDEXES = {
+    "products": "idx_product_created_brin",
+    "product_variants": "idx_variant_created_brin",
+    "users": "idx_user_created_brin",
+}
+
+
+def upgrade() -> None:
+    for table, name in BRIN_INDEXES.items():
+        op.create_index(
+            name,
+            table,
+            ["created_at"],
+            unique=False,
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        )
+
+
+def downgrade() -> None:
+    for table, name in BRIN_INDEXES.items():
+        op.drop_index(name, table_name=table)
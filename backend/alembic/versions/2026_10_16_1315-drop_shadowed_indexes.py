@@ -0,0 +1,38 @@
+"""Drop single-column indexes shadowed by composite or unique indexes
+
+Revision ID: drop_shadowed_indexes
+Revises: created_at_brin_indexes
+Create Date: 2026-10-16 13:15:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "drop_shadowed_indexes"
+down_revision = "created_at_brin_indexes"
+branch_labels = None
+depends_on = None
+
+
+# (index name, table, columns)
+SHADOWED_INDEXES = [
+    # Leading column of idx_product_collection_status_cov
+    ("ix_products_collection_id", "products", ["collection_id"]),
+    # Leading column of idx_product_category_featured
+    ("ix_products_category", "products", ["category"]),
+    # Leading column of idx_user_role_active
+    ("ix_users_role", "users", ["role"]),
+    # email is already covered by the unique ix_users_email
+    ("idx_user_email_active", "users", ["email", "is_active"]),
+]
+
+
+def upgrade() -> None:
+    for name, table, _ in SHADOWED_INDEXES:
+        op.drop_index(name, table_name=table)
+
+
+def downgrade() -> None:
+    for name, table, columns in SHADOWED_INDEXES:
+        op.create_index(name, table, columns, unique=False)
@@ -0,0 +1,43 @@
+"""Widen the product listing covering index to the full summary column set
+
+Revision ID: product_listing_covering_full
+Revises: drop_shadowed_indexes
+Create Date: 2026-10-16 13:30:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "product_listing_covering_full"
+down_revision = "drop_shadowed_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_product_listing_covering",
+        "products",
+        ["collection_id", "status"],
+        unique=False,
+        postgresql_include=[
+            "id", "name", "sku", "category", "retail_price", "currency", "is_featured",
+        ],
+    )
+    op.drop_index("idx_product_collection_status_cov", table_name="products")
+
+    # Index-only scans depend on an up-to-date visibility map. VACUUM can't
+    # run inside the migration transaction, so leave it to autovacuum or run
+    # VACUUM ANALYZE products after upgrading.
+
+
+def downgrade() -> None:
+    op.create_index(
+        "idx_product_collection_status_cov",
+        "products",
+        ["collection_id", "status"],
+        unique=False,
+        postgresql_include=["name", "sku", "retail_price", "is_featured"],
+    )
+    op.drop_index("idx_product_listing_covering", table_name="products")
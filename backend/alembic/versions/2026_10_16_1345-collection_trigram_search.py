@@ -0,0 +1,43 @@
+"""Add pg_trgm GIN indexes for collection text search
+
+Revision ID: collection_trigram_search
+Revises: product_listing_covering_full
+Create Date: 2026-10-16 13:45:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "collection_trigram_search"
+down_revision = "product_listing_covering_full"
+branch_labels = None
+depends_on = None
+
+
+# One index per column so name OR description becomes a BitmapOr of two
+# index scans; trigram GIN indexes serve ILIKE '%term%' directly
+TRIGRAM_INDEXES = {
+    "idx_collection_name_trgm": "name",
+    "idx_collection_description_trgm": "description",
+}
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    for name, column in TRIGRAM_INDEXES.items():
+        op.create_index(
+            name,
+            "collections",
+            [column],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    # The extension is left installed; other objects may depend on it
+    for name in TRIGRAM_INDEXES:
+        op.drop_index(name, table_name="collections")
@@ -0,0 +1,53 @@
+"""Add partial indexes over live (not soft-deleted) rows
+
+Revision ID: live_row_partial_indexes
+Revises: collection_trigram_search
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "live_row_partial_indexes"
+down_revision = "collection_trigram_search"
+branch_labels = None
+depends_on = None
+
+
+LIVE = "is_deleted = false"
+
+# (name, table, columns, unique, predicate)
+PARTIAL_INDEXES = [
+    ("idx_collection_live_slug", "collections", ["slug"], True, LIVE),
+    ("idx_collection_live_year_name", "collections", [sa.text("year DESC"), "name", "id"], False, LIVE),
+    (
+        "idx_product_featured_live",
+        "products",
+        ["collection_id"],
+        False,
+        "is_featured = true AND status = 'active' AND is_deleted = false",
+    ),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns, unique, predicate in PARTIAL_INDEXES:
+        op.create_index(
+            name,
+            table,
+            columns,
+            unique=unique,
+            postgresql_where=sa.text(predicate),
+        )
+
+    # Slugs are now unique among live collections only
+    op.drop_index("ix_collections_slug", table_name="collections")
+
+
+def downgrade() -> None:
+    op.create_index("ix_collections_slug", "collections", ["slug"], unique=True)
+
+    for name, table, _, _, _ in PARTIAL_INDEXES:
+        op.drop_index(name, table_name=table)
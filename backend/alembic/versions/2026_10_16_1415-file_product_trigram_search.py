@@ -0,0 +1,50 @@
+"""Add pg_trgm GIN indexes for file and product text search
+
+Revision ID: file_product_trigram_search
+Revises: live_row_partial_indexes
+Create Date: 2026-10-16 14:15:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "file_product_trigram_search"
+down_revision = "live_row_partial_indexes"
+branch_labels = None
+depends_on = None
+
+
+# Columns matched with ILIKE '%term%' by search_files and search_products
+TRIGRAM_INDEXES = [
+    ("idx_file_filename_trgm", "files", "filename"),
+    ("idx_file_original_filename_trgm", "files", "original_filename"),
+    ("idx_file_description_trgm", "files", "description"),
+    ("idx_product_name_trgm", "products", "name"),
+    ("idx_product_description_trgm", "products", "description"),
+    ("idx_product_short_description_trgm", "products", "short_description"),
+]
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # Built concurrently so searches and writes keep running meanwhile
+    with op.get_context().autocommit_block():
+        for name, table, column in TRIGRAM_INDEXES:
+            op.create_index(
+                name,
+                table,
+                [column],
+                unique=False,
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in TRIGRAM_INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
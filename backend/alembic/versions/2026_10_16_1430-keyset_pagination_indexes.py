@@ -0,0 +1,49 @@
+"""Add (created_at, id) indexes backing keyset pagination
+
+Revision ID: keyset_pagination_indexes
+Revises: file_product_trigram_search
+Create Date: 2026-10-16 14:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "keyset_pagination_indexes"
+down_revision = "file_product_trigram_search"
+branch_labels = None
+depends_on = None
+
+
+# Newest-first listings seek on (created_at, id) over live rows; a backward
+# scan of an ascending index serves the DESC, DESC order
+KEYSET_INDEXES = {
+    "files": "idx_file_created_id",
+    "products": "idx_product_created_id",
+}
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table, name in KEYSET_INDEXES.items():
+            op.create_index(
+                name,
+                table,
+                ["created_at", "id"],
+                unique=False,
+                postgresql_where=sa.text("is_deleted = false"),
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+    # Every file listing filters live rows, so the new index supersedes it
+    op.drop_index("idx_file_created", table_name="files")
+
+
+def downgrade() -> None:
+    op.create_index("idx_file_created", "files", ["created_at"], unique=False)
+
+    with op.get_context().autocommit_block():
+        for table, name in KEYSET_INDEXES.items():
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
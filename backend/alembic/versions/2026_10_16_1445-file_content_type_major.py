@@ -0,0 +1,41 @@
+"""Add generated content_type_major column to files
+
+Revision ID: file_content_type_major
+Revises: keyset_pagination_indexes
+Create Date: 2026-10-16 14:45:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "file_content_type_major"
+down_revision = "keyset_pagination_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "files",
+        sa.Column(
+            "content_type_major",
+            sa.String(length=50),
+            sa.Computed("split_part(content_type, '/', 1)", persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "idx_file_type_major_size",
+        "files",
+        ["content_type_major"],
+        unique=False,
+        postgresql_include=["size"],
+        postgresql_where=sa.text("is_deleted = false"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_file_type_major_size", table_name="files")
+    op.drop_column("files", "content_type_major")
@@ -12,17 +12,55 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 from app.api.dependencies import get_current_user
-from app.services.collection import CollectionService
+from app.services.collection import CollectionService, COLLECTION_DETAIL_RELATIONS
 from app.schemas.collection import (
     CollectionCreate, CollectionUpdate, CollectionResponse,
     CollectionSummary, CollectionListFilters, CollectionPublishRequest,
     CollectionAnalytics
 )
 from app.schemas.base import PaginatedResponse, PaginationParams
+from app.utils.pagination import encode_cursor, decode_cursor
 
 router = APIRouter()
 
 
+def _collection_list_item(collection) -> CollectionResponse:
+    """
+    Build a list-view response without touching unloaded relationships.
+    
+    List queries only load the collection row (product_count is computed in
+    SQL), so products and files are left out rather than lazy loaded.
+    """
+    return CollectionResponse.model_validate({
+        "id": collection.id,
+        "name": collection.name,
+        "slug": collection.slug,
+        "season": collection.season,
+        "year": collection.year,
+        "description": collection.description,
+        "short_description": collection.short_description,
+        "order_start_date": collection.order_start_date,
+        "order_end_date": collection.order_end_date,
+        "seo_title": collection.seo_title,
+        "seo_description": collection.seo_description,
+        "metadata": collection.extra_data if isinstance(collection.extra_data, dict) else {},  # Map extra_data to metadata
+        "status": collection.status,
+        "is_published": collection.is_published,
+        "product_count": collection.product_count,
+        "is_order_period_active": collection.is_order_period_active,
+        "full_name": collection.full_name,
+        "created_at": collection.created_at,
+        "updated_at": collection.updated_at,
+        "created_by": collection.created_by,
+        "updated_by": collection.updated_by,
+        "is_deleted": collection.is_deleted,
+        "deleted_at": collection.deleted_at,
+        "notes": collection.notes,
+        "products": None,  # Don't include relationships for list
+        "files": None     # Don't include relationships for list
+    })
+
+
 @router.get(
     "/",
     response_model=PaginatedResponse[CollectionResponse],
@@ -32,6 +70,7 @@ router = APIRouter()
 async def list_collections(
     skip: int = Query(0, ge=0, description="Number of items to skip"),
     limit: int = Query(20, ge=1, le=100, description="Number of items to return"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page; replaces skip"),
     season: Optional[str] = Query(None, description="Filter by season"),
     year: Optional[int] = Query(None, description="Filter by year"),
     collection_status: Optional[str] = Query(None, description="Filter by status"),
@@ -43,6 +82,14 @@ async def list_collections(
 ):
     """List collections with pagination and filtering."""
     try:
+        try:
+            after = decode_cursor(cursor) if cursor else None
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Invalid pagination cursor"
+            )
+        
         service = CollectionService(db)
         
         # Build filters
@@ -60,47 +107,23 @@ async def list_collections(
             filters=filters,
             skip=skip,
             limit=limit,
-            user_id=current_user["uid"] if current_user else None
+            user_id=current_user["uid"] if current_user else None,
+            after=after
         )
         
-        # Convert to response models manually to avoid relationship access issues
-        collection_responses = []
-        for collection in collections:
-            response_data = {
-                "id": collection.id,
-                "name": collection.name,
-                "slug": collection.slug,
-                "season": collection.season,
-                "year": collection.year,
-                "description": collection.description,
-                "short_description": collection.short_description,
-                "order_start_date": collection.order_start_date,
-                "order_end_date": collection.order_end_date,
-                "seo_title": collection.seo_title,
-                "seo_description": collection.seo_description,
-                "metadata": collection.extra_data if isinstance(collection.extra_data, dict) else {},  # Map extra_data to metadata
-                "status": collection.status,
-                "is_published": collection.is_published,
-                "product_count": collection.product_count,
-                "is_order_period_active": collection.is_order_period_active,
-                "full_name": collection.full_name,
-                "created_at": collection.created_at,
-                "updated_at": collection.updated_at,
-                "created_by": collection.created_by,
-                "updated_by": collection.updated_by,
-                "is_deleted": collection.is_deleted,
-                "deleted_at": collection.deleted_at,
-                "notes": collection.notes,
-                "products": None,  # Don't include relationships for list
-                "files": None     # Don't include relationships for list
-            }
-            collection_responses.append(CollectionResponse.model_validate(response_data))
+        collection_responses = [_collection_list_item(collection) for collection in collections]
+        
+        next_cursor = None
+        if len(collections) == limit:
+            last = collections[-1]
+            next_cursor = encode_cursor(last.created_at, last.id)
         
         return PaginatedResponse.create(
             items=collection_responses,
             total=total,
             skip=skip,
-            limit=limit
+            limit=limit,
+            next_cursor=next_cursor
         )
         
     except HTTPException as e:
@@ -197,7 +220,8 @@ async def get_collection(
         
         collection = await service.get_by_id(
             id=collection_id,
-            user_id=UUID(current_user["uid"]) if current_user else None
+            user_id=UUID(current_user["uid"]) if current_user else None,
+            load_relations=COLLECTION_DETAIL_RELATIONS
         )
         
         return CollectionResponse.model_validate(collection)
@@ -379,10 +403,7 @@ async def get_featured_collections(
         
         collections = await service.get_featured_collections(limit=limit)
         
-        return [
-            CollectionResponse.model_validate(collection)
-            for collection in collections
-        ]
+        return [_collection_list_item(collection) for collection in collections]
         
     except HTTPException as e:
         raise HTTPException(status_code=e.status_code, detail=e.detail)
@@ -418,10 +439,7 @@ async def search_collections(
             limit=limit
         )
         
-        return [
-            CollectionResponse.model_validate(collection)
-            for collection in collections
-        ]
+        return [_collection_list_item(collection) for collection in collections]
         
     except HTTPException as e:
         raise HTTPException(status_code=e.status_code, detail=e.detail)
@@ -7,11 +7,11 @@ Handles CRUD operations, variants, images, specifications, and search.
 
 from typing import List, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File, Form
+from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File, Form, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
-from app.api.dependencies import get_current_user
+from app.api.dependencies import get_current_user, get_current_user_optional
 from app.services.product.service import ProductService
 from app.schemas.product import (
     ProductCreate, ProductUpdate, ProductResponse, ProductSummaryResponse,
@@ -49,7 +49,7 @@ async def list_products(
     has_images: Optional[bool] = Query(None, description="Filter products with/without images"),
     order_by: Optional[str] = Query(None, description="Field to order by"),
     db: AsyncSession = Depends(get_db),
-    current_user: Optional[dict] = Depends(get_current_user)
+    current_user: Optional[dict] = Depends(get_current_user_optional)
 ):
     """List products with pagination and filtering."""
     try:
@@ -84,13 +84,20 @@ async def list_products(
             for product in products
         ]
         
-        return PaginatedResponse.create(
+        page = PaginatedResponse[ProductSummaryResponse].create(
             items=product_responses,
             total=total,
             skip=skip,
             limit=limit
         )
         
+        # Serialize once here; returning a Response skips FastAPI's
+        # response_model re-validation of every item on this hot path
+        return Response(
+            content=page.model_dump_json(),
+            media_type="application/json"
+        )
+        
     except HTTPException as e:
         raise HTTPException(status_code=e.status_code, detail=e.detail)
     except Exception as e:
@@ -141,7 +148,7 @@ async def create_product(
 async def get_product(
     product_id: UUID,
     db: AsyncSession = Depends(get_db),
-    current_user: Optional[dict] = Depends(get_current_user)
+    current_user: Optional[dict] = Depends(get_current_user_optional)
 ):
     """Get a product by ID with full details."""
     try:
@@ -169,7 +176,7 @@ async def get_product(
 async def get_product_by_sku(
     sku: str,
     db: AsyncSession = Depends(get_db),
-    current_user: Optional[dict] = Depends(get_current_user)
+    current_user: Optional[dict] = Depends(get_current_user_optional)
 ):
     """Get a product by SKU."""
     try:
@@ -262,7 +269,7 @@ async def get_products_by_collection(
     skip: int = Query(0, ge=0, description="Number of items to skip"),
     limit: int = Query(50, ge=1, le=100, description="Number of items to return"),
     db: AsyncSession = Depends(get_db),
-    current_user: Optional[dict] = Depends(get_current_user)
+    current_user: Optional[dict] = Depends(get_current_user_optional)
 ):
     """Get products by collection."""
     try:
@@ -298,7 +305,7 @@ async def get_products_by_collection(
 async def get_featured_products(
     limit: int = Query(10, ge=1, le=50, description="Number of products to return"),
     db: AsyncSession = Depends(get_db),
-    current_user: Optional[dict] = Depends(get_current_user)
+    current_user: Optional[dict] = Depends(get_current_user_optional)
 ):
     """Get featured products."""
     try:
@@ -333,7 +340,7 @@ async def search_products(
     skip: int = Query(0, ge=0, description="Number of items to skip"),
     limit: int = Query(20, ge=1, le=100, description="Number of items to return"),
     db: AsyncSession = Depends(get_db),
-    current_user: Optional[dict] = Depends(get_current_user)
+    current_user: Optional[dict] = Depends(get_current_user_optional)
 ):
     """Search products."""
     try:
@@ -22,11 +22,26 @@ class Settings(BaseSettings):
     POSTGRES_PASSWORD: str
     
     # Database Pool Settings (optional - will use defaults if not set)
-    DB_POOL_SIZE: int = 5
-    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_SIZE: int = 25
+    DB_MAX_OVERFLOW: int = 25
+    DB_POOL_RECYCLE: int = 300
     DB_POOL_PRE_PING: bool = True
+    # Set when a transaction-pooling PgBouncer sits in front of PostgreSQL:
+    # the app then keeps no pool of its own and disables prepared statements
+    DB_USE_PGBOUNCER: bool = False
     DB_ECHO: bool = False
     DB_EXPIRE_ON_COMMIT: bool = False
+    DB_STATEMENT_CACHE_SIZE: int = 1024
+    DB_QUERY_CACHE_SIZE: int = 1200
+    DB_APPLICATION_NAME: str = "vshowroom"
+    # Make lazy loads that would emit SQL raise instead (catches N+1s and
+    # MissingGreenlet in development); off in production by default
+    SQLALCHEMY_RAISELOAD: bool = False
+
+    # Redis (set empty to disable response caching and rate limiting)
+    REDIS_URL: str = "redis://localhost:6379/0"
+    # How often download counts buffered in Redis are written to the database
+    DOWNLOAD_COUNT_FLUSH_SECONDS: int = 30
 
     # Firebase
     FIREBASE_SERVICE_ACCOUNT_PATH: str
@@ -1,27 +1,79 @@
-from typing import AsyncGenerator
+import asyncio
+import logging
+from typing import Any, AsyncGenerator, Awaitable, Callable, List
 
+import orjson
+from sqlalchemy.engine.interfaces import CacheStats
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.pool import NullPool
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
+# One pooled engine per process; sessions borrow connections from it. Behind
+# PgBouncer (or in tests) the app holds no connections of its own.
+if settings.ENV == "test" or settings.DB_USE_PGBOUNCER:
+    pool_options = {"poolclass": NullPool}
+else:
+    pool_options = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+
+# Prepared statements don't survive PgBouncer transaction pooling
+statement_cache_size = 0 if settings.DB_USE_PGBOUNCER else settings.DB_STATEMENT_CACHE_SIZE
+
+
+def _json_serializer(value: Any) -> str:
+    """Encode JSON/JSONB bind values with orjson (str, as the dialect expects)."""
+    # OPT_NON_STR_KEYS keeps stdlib json's handling of int/UUID dict keys
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 # Create async engine
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DB_ECHO,
     future=True,
-    poolclass=NullPool if settings.ENV == "test" else None,
     pool_pre_ping=settings.DB_POOL_PRE_PING,
-    pool_recycle=300,
+    # SQL compilation cache; sized above the number of distinct statements
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+    # JSONB columns encode/decode through orjson instead of stdlib json
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
+    **pool_options,
+    connect_args={
+        # Prepared statements amortize parse/plan cost across repeated queries
+        "statement_cache_size": statement_cache_size,
+        "prepared_statement_cache_size": statement_cache_size,
+        "server_settings": {
+            # JIT compilation only adds latency to short OLTP queries
+            "jit": "off",
+            "application_name": settings.DB_APPLICATION_NAME,
+        },
+    },
 )
 
+if settings.DEBUG:
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def _log_compiled_cache_stats(conn, cursor, statement, parameters, context, executemany):
+        """Report statements that miss or can't use the compiled cache."""
+        if context.cache_hit is CacheStats.NO_CACHE_KEY:
+            logger.warning("Statement is not cacheable, compiled on every execution: %s", statement)
+        elif context.cache_hit is CacheStats.CACHE_MISS and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Compiled cache miss: %s", statement)
+
 # Create sync engine for Alembic migrations
 sync_engine = create_engine(
     settings.DATABASE_URL.replace("+asyncpg", ""),  # Remove asyncpg driver for sync engine
     echo=settings.DB_ECHO,
     pool_pre_ping=settings.DB_POOL_PRE_PING,
-    pool_recycle=300,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
 )
 
 # Create async session factory
@@ -55,9 +107,36 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.rollback()
             raise
         finally:
+            # Request-scoped repository lookups (see BaseRepository) die here
+            session.info.pop("_repo_cache", None)
             await session.close()
 
 
+async def gather_with_sessions(
+    *operations: Callable[[AsyncSession], Awaitable[Any]]
+) -> List[Any]:
+    """
+    Run independent reads concurrently, each on its own session.
+    
+    One AsyncSession drives one connection, which executes a single statement
+    at a time, so repository calls sharing a session always wait on each
+    other's round trips. Each operation here gets a fresh session from the
+    pool, letting the round trips overlap. Nothing is committed: use it for
+    reads only, and keep the count well under the pool size.
+    
+    Args:
+        operations: Callables taking a session and returning an awaitable
+        
+    Returns:
+        Results in the order the operations were given
+    """
+    async def run(operation: Callable[[AsyncSession], Awaitable[Any]]) -> Any:
+        async with AsyncSessionLocal() as session:
+            return await operation(session)
+    
+    return list(await asyncio.gather(*(run(operation) for operation in operations)))
+
+
 async def init_db() -> None:
     """
     Initialize database tables.
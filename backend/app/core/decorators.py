@@ -1,16 +1,82 @@
 from functools import wraps
-from typing import Callable, Any
-from fastapi import HTTPException, status
+from typing import Callable, Any, Optional
+from fastapi import HTTPException, Request, Response, status
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from redis.exceptions import RedisError
+import hashlib
+import inspect
 import logging
+import time
+import orjson
 
-from .exceptions import (
-    AppBaseException, ValidationError, NotFoundError, 
-    ConflictError, BadRequestError, UnauthorizedError,
-    ForbiddenError, ExternalServiceError, InternalServerError
-)
+from .config import settings
+from .exceptions import AppBaseException, TooManyRequestsError
+from .redis import get_redis, get_rate_limit_script
+from ..utils.pagination import MAX_OFFSET, decode_cursor
 
 logger = logging.getLogger(__name__)
 
+# Log message templates; arguments are only interpolated if a handler
+# actually emits the record
+_SERVER_ERROR_MSG = "Server error in %s: %s"
+_CLIENT_ERROR_MSG = "Client error in %s: %s"
+_UNEXPECTED_ERROR_MSG = "Unexpected error in %s: %s"
+_API_CALL_MSG = "API call: %s"
+_API_RESPONSE_MSG = "API response: %s"
+_API_ERROR_MSG = "API error: %s: %s"
+_CACHE_READ_FAILED_MSG = "Response cache read failed for %s: %s"
+_CACHE_WRITE_FAILED_MSG = "Response cache write failed for %s: %s"
+_RATE_LIMIT_FAILED_MSG = "Rate limit check failed for %s: %s"
+
+
+def _app_exception_to_http(e: AppBaseException, func: Callable) -> HTTPException:
+    """Log an application exception and convert it to an HTTPException."""
+    # Every application exception carries its own HTTP status
+    http_status = e.status_code
+    
+    # Log error with context; the context dict and message are only built
+    # when a handler will actually receive the record
+    level = logging.ERROR if http_status >= 500 else logging.WARNING
+    if logger.isEnabledFor(level):
+        log_context = {
+            "error_type": type(e).__name__,
+            "error_code": e.error_code,
+            "detail": e.detail,
+            "context": e.context,
+            "function": func.__name__
+        }
+        if level == logging.ERROR:
+            logger.error(_SERVER_ERROR_MSG, func.__name__, e, extra=log_context)
+        else:
+            logger.warning(_CLIENT_ERROR_MSG, func.__name__, e, extra=log_context)
+    
+    # Create HTTP exception with structured error response
+    return HTTPException(
+        status_code=http_status,
+        detail={
+            "error_code": e.error_code,
+            "message": e.detail,
+            "context": e.context if e.context else None,
+            "timestamp": e.timestamp.isoformat() if e.timestamp else None
+        }
+    )
+
+
+def _unexpected_exception_to_http(e: Exception, func: Callable) -> HTTPException:
+    """Log an unexpected exception and convert it to a generic 500."""
+    logger.error(_UNEXPECTED_ERROR_MSG, func.__name__, e, exc_info=True)
+    
+    return HTTPException(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        detail={
+            "error_code": "INTERNAL_SERVER_ERROR",
+            "message": "An unexpected error occurred",
+            "context": None,
+            "timestamp": None
+        }
+    )
+
 
 def handle_service_exceptions(func: Callable) -> Callable:
     """
@@ -28,44 +94,7 @@ def handle_service_exceptions(func: Callable) -> Callable:
             return await func(*args, **kwargs)
             
         except AppBaseException as e:
-            # Map custom exceptions to HTTP exceptions
-            status_map = {
-                ValidationError: status.HTTP_422_UNPROCESSABLE_ENTITY,
-                NotFoundError: status.HTTP_404_NOT_FOUND,
-                ConflictError: status.HTTP_409_CONFLICT,
-                BadRequestError: status.HTTP_400_BAD_REQUEST,
-                UnauthorizedError: status.HTTP_401_UNAUTHORIZED,
-                ForbiddenError: status.HTTP_403_FORBIDDEN,
-                ExternalServiceError: status.HTTP_502_BAD_GATEWAY,
-                InternalServerError: status.HTTP_500_INTERNAL_SERVER_ERROR,
-            }
-            
-            http_status = status_map.get(type(e), status.HTTP_500_INTERNAL_SERVER_ERROR)
-            
-            # Log error with context
-            log_context = {
-                "error_type": type(e).__name__,
-                "error_code": e.error_code,
-                "detail": e.detail,
-                "context": e.context,
-                "function": func.__name__
-            }
-            
-            if http_status >= 500:
-                logger.error(f"Server error in {func.__name__}: {e}", extra=log_context)
-            else:
-                logger.warning(f"Client error in {func.__name__}: {e}", extra=log_context)
-            
-            # Create HTTP exception with structured error response
-            raise HTTPException(
-                status_code=http_status,
-                detail={
-                    "error_code": e.error_code,
-                    "message": e.detail,
-                    "context": e.context if e.context else None,
-                    "timestamp": getattr(e, 'timestamp', None).isoformat() if getattr(e, 'timestamp', None) else None
-                }
-            )
+            raise _app_exception_to_http(e, func)
             
         except HTTPException:
             # Re-raise HTTP exceptions as-is
@@ -73,19 +102,72 @@ def handle_service_exceptions(func: Callable) -> Callable:
             
         except Exception as e:
             # Handle unexpected exceptions
-            logger.error(f"Unexpected error in {func.__name__}: {str(e)}", exc_info=True)
-            
+            raise _unexpected_exception_to_http(e, func)
+    
+    return wrapper
+
+
+def _check_pagination(kwargs: dict) -> None:
+    """Validate skip/limit/cursor keyword arguments, raising a 422 when invalid."""
+    # Extract pagination parameters from kwargs
+    skip = kwargs.get('skip', 0)
+    limit = kwargs.get('limit', 100)
+    
+    # Validate parameters
+    if skip < 0:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail={
+                "error_code": "INVALID_PAGINATION",
+                "message": "Skip parameter cannot be negative",
+                "context": {"skip": skip}
+            }
+        )
+    
+    if limit <= 0:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail={
+                "error_code": "INVALID_PAGINATION", 
+                "message": "Limit parameter must be positive",
+                "context": {"limit": limit}
+            }
+        )
+    
+    if limit > 1000:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail={
+                "error_code": "INVALID_PAGINATION",
+                "message": "Limit parameter cannot exceed 1000", 
+                "context": {"limit": limit, "max_limit": 1000}
+            }
+        )
+    
+    # A cursor replaces deep offsets: it maps to an index seek on
+    # (created_at, id) instead of reading and discarding `skip` rows
+    cursor = kwargs.get('cursor')
+    if cursor:
+        try:
+            decode_cursor(cursor)
+        except ValueError:
             raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
                 detail={
-                    "error_code": "INTERNAL_SERVER_ERROR",
-                    "message": "An unexpected error occurred",
-                    "context": None,
-                    "timestamp": None
+                    "error_code": "INVALID_PAGINATION",
+                    "message": "Invalid pagination cursor",
+                    "context": {"cursor": cursor}
                 }
             )
-    
-    return wrapper
+    elif skip > MAX_OFFSET:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail={
+                "error_code": "INVALID_PAGINATION",
+                "message": f"Use cursor pagination beyond offset {MAX_OFFSET}",
+                "context": {"skip": skip, "max_offset": MAX_OFFSET}
+            }
+        )
 
 
 def validate_pagination(func: Callable) -> Callable:
@@ -103,41 +185,7 @@ def validate_pagination(func: Callable) -> Callable:
     """
     @wraps(func)
     async def wrapper(*args, **kwargs) -> Any:
-        # Extract pagination parameters from kwargs
-        skip = kwargs.get('skip', 0)
-        limit = kwargs.get('limit', 100)
-        
-        # Validate parameters
-        if skip < 0:
-            raise HTTPException(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail={
-                    "error_code": "INVALID_PAGINATION",
-                    "message": "Skip parameter cannot be negative",
-                    "context": {"skip": skip}
-                }
-            )
-        
-        if limit <= 0:
-            raise HTTPException(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail={
-                    "error_code": "INVALID_PAGINATION", 
-                    "message": "Limit parameter must be positive",
-                    "context": {"limit": limit}
-                }
-            )
-        
-        if limit > 1000:
-            raise HTTPException(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail={
-                    "error_code": "INVALID_PAGINATION",
-                    "message": "Limit parameter cannot exceed 1000", 
-                    "context": {"limit": limit, "max_limit": 1000}
-                }
-            )
-        
+        _check_pagination(kwargs)
         return await func(*args, **kwargs)
     
     return wrapper
@@ -160,15 +208,36 @@ def require_user_ownership(entity_param: str = "entity_id"):
             ...
     """
     def decorator(func: Callable) -> Callable:
-        @wraps(func)
-        async def wrapper(*args, **kwargs) -> Any:
-            # This decorator works in conjunction with service layer validation
-            # The actual ownership check is performed in the service layer
-            return await func(*args, **kwargs)
-        return wrapper
+        # This decorator works in conjunction with service layer validation.
+        # The actual ownership check is performed in the service layer, so
+        # the endpoint is returned as-is rather than wrapped
+        return func
     return decorator
 
 
+def _current_user_id(current_user: Any) -> Any:
+    """Get the user id from a Firebase token dict or a user model."""
+    if isinstance(current_user, dict):
+        return current_user.get("uid") or current_user.get("user_id")
+    return getattr(current_user, "id", None)
+
+
+def _api_call_log_data(func: Callable, args: tuple, kwargs: dict) -> dict:
+    """Build the structured log payload for an API call."""
+    log_data = {
+        "function": func.__name__,
+        "args_count": len(args),
+        "kwargs_keys": list(kwargs.keys())
+    }
+    
+    # Extract user info if available
+    current_user = kwargs.get('current_user')
+    if current_user:
+        log_data["user_id"] = _current_user_id(current_user)
+    
+    return log_data
+
+
 def log_api_call(include_response: bool = False):
     """
     Decorator to log API calls with request details.
@@ -186,24 +255,16 @@ def log_api_call(include_response: bool = False):
         @wraps(func)
         async def wrapper(*args, **kwargs) -> Any:
             # Log request
-            log_data = {
-                "function": func.__name__,
-                "args_count": len(args),
-                "kwargs_keys": list(kwargs.keys())
-            }
-            
-            # Extract user info if available
-            current_user = kwargs.get('current_user')
-            if current_user:
-                log_data["user_id"] = current_user.id
-            
-            logger.info(f"API call: {func.__name__}", extra=log_data)
+            log_data = None
+            if logger.isEnabledFor(logging.INFO):
+                log_data = _api_call_log_data(func, args, kwargs)
+                logger.info(_API_CALL_MSG, func.__name__, extra=log_data)
             
             try:
                 result = await func(*args, **kwargs)
                 
-                if include_response:
-                    logger.info(f"API response: {func.__name__}", extra={
+                if include_response and log_data is not None:
+                    logger.info(_API_RESPONSE_MSG, func.__name__, extra={
                         **log_data,
                         "response_type": type(result).__name__
                     })
@@ -211,19 +272,105 @@ def log_api_call(include_response: bool = False):
                 return result
                 
             except Exception as e:
-                logger.error(f"API error: {func.__name__}: {str(e)}", extra=log_data)
+                if logger.isEnabledFor(logging.ERROR):
+                    logger.error(
+                        _API_ERROR_MSG, func.__name__, e,
+                        extra=log_data or _api_call_log_data(func, args, kwargs)
+                    )
                 raise
         
         return wrapper
     return decorator
 
 
-def cache_response(ttl_seconds: int = 300):
+# Keyword arguments the wrappers receive the current request under; each
+# decorator uses its own so injected parameters don't collide when stacked
+_CACHE_REQUEST_KWARG = "_cache_request"
+_RATE_LIMIT_REQUEST_KWARG = "_rate_limit_request"
+
+
+def _inject_request(wrapper: Callable, func: Callable, name: str) -> None:
+    """Declare a keyword-only Request parameter on wrapper so FastAPI passes it in."""
+    signature = inspect.signature(func)
+    params = list(signature.parameters.values())
+    request_param = inspect.Parameter(name, inspect.Parameter.KEYWORD_ONLY, annotation=Request)
+    if params and params[-1].kind is inspect.Parameter.VAR_KEYWORD:
+        params.insert(len(params) - 1, request_param)
+    else:
+        params.append(request_param)
+    wrapper.__signature__ = signature.replace(parameters=params)
+
+
+def _response_adapter(func: Callable, response_model: Any) -> Optional[TypeAdapter]:
+    """Build the adapter that serializes results like the route's response_model."""
+    if response_model is None:
+        response_model = inspect.signature(func).return_annotation
+    if response_model is inspect.Signature.empty or isinstance(response_model, str):
+        return None
+    if inspect.isclass(response_model) and issubclass(response_model, Response):
+        return None
+    return TypeAdapter(response_model)
+
+
+def _cache_key(func: Callable, request: Request, user_id: str) -> str:
+    """Build a cache key from the endpoint, request path and full query string."""
+    target = request.url.path.encode() + b"?" + request.scope.get("query_string", b"")
+    digest = hashlib.blake2b(target, digest_size=16).hexdigest()
+    return f"rc:{func.__module__}.{func.__qualname__}:{digest}:{user_id}"
+
+
+def _response_body(result: Any, adapter: Optional[TypeAdapter]) -> bytes:
+    """Encode an endpoint result to JSON bytes, filtered through the response model."""
+    if isinstance(result, Response):
+        return result.body
+    if adapter is not None:
+        # Same validate-then-serialize step FastAPI applies for response_model,
+        # so fields outside the model never reach the cache
+        value = adapter.validate_python(result, from_attributes=True)
+        return adapter.dump_json(value, by_alias=True)
+    return orjson.dumps(jsonable_encoder(result))
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in header.split(","))
+
+
+def _cached_json_response(body: bytes, request: Request) -> Response:
+    """Wrap JSON bytes in a response tagged with a content ETag, or a 304 when it matches."""
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    if _etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": etag}
+    )
+
+
+def cache_response(ttl_seconds: int = 300, per_user: bool = False, response_model: Any = None):
     """
-    Decorator for response caching (placeholder for future Redis integration).
+    Decorator for Redis-backed response caching.
+    
+    The JSON body, serialized through the response model, is stored under
+    the request path and full query string, so a cache hit skips the
+    database, model serialization and JSON encoding entirely. Responses
+    carry a content ETag and a matching If-None-Match gets a 304. Endpoints
+    called with an authenticated user are not cached unless per_user is
+    set, in which case each user gets their own entry. Without Redis the
+    endpoint simply runs uncached.
     
     Args:
         ttl_seconds: Time to live for cached response
+        per_user: Cache responses for authenticated users, keyed by user
+        response_model: Model the body is serialized through; defaults to
+            the endpoint's return annotation, so pass the route's
+            response_model when the endpoint isn't annotated with it
     
     Usage:
         @router.get("/categories/stats")
@@ -232,22 +379,83 @@ def cache_response(ttl_seconds: int = 300):
             ...
     """
     def decorator(func: Callable) -> Callable:
+        # Nothing to cache into: skip the wrapper entirely
+        if ttl_seconds <= 0 or not settings.REDIS_URL:
+            return func
+        
+        adapter = _response_adapter(func, response_model)
+        
         @wraps(func)
         async def wrapper(*args, **kwargs) -> Any:
-            # TODO: Implement Redis caching when Redis is integrated
-            # For now, just execute the function
-            return await func(*args, **kwargs)
+            request = kwargs.pop(_CACHE_REQUEST_KWARG, None)
+            redis = get_redis()
+            if redis is None or request is None:
+                return await func(*args, **kwargs)
+            
+            current_user = kwargs.get('current_user')
+            if current_user is not None and not per_user:
+                # Never share a response that may contain user data
+                return await func(*args, **kwargs)
+            
+            user_id = str(_current_user_id(current_user)) if current_user is not None else "anon"
+            key = _cache_key(func, request, user_id)
+            
+            try:
+                cached = await redis.get(key)
+            except RedisError as e:
+                logger.warning(_CACHE_READ_FAILED_MSG, func.__name__, e)
+                cached = None
+            
+            if cached is not None:
+                return _cached_json_response(cached, request)
+            
+            result = await func(*args, **kwargs)
+            if isinstance(result, Response) and (
+                result.status_code != 200 or result.media_type != "application/json"
+            ):
+                return result
+            
+            body = _response_body(result, adapter)
+            try:
+                await redis.set(key, body, ex=ttl_seconds)
+            except RedisError as e:
+                logger.warning(_CACHE_WRITE_FAILED_MSG, func.__name__, e)
+            
+            return _cached_json_response(body, request)
+        
+        _inject_request(wrapper, func, _CACHE_REQUEST_KWARG)
         return wrapper
     return decorator
 
 
+def _rate_limit_identity(kwargs: dict, request: Optional[Request]) -> str:
+    """Identify the caller by user id, falling back to the client IP."""
+    current_user = kwargs.get('current_user')
+    if current_user is not None:
+        return f"user:{_current_user_id(current_user)}"
+    
+    if request is not None and request.client is not None:
+        return f"ip:{request.client.host}"
+    
+    return "anon"
+
+
 def rate_limit(requests_per_minute: int = 60):
     """
-    Decorator for rate limiting (placeholder for future rate limiting implementation).
+    Decorator for per-user rate limiting backed by Redis.
+    
+    Requests are counted per caller with a sliding window counter: the
+    current minute's count plus the previous minute's, weighted by how much
+    of it still falls within the last 60 seconds, in a single atomic Redis
+    call. Callers are identified by current_user, or by the client address
+    from the ASGI scope. Without Redis requests are not limited.
     
     Args:
         requests_per_minute: Maximum requests per minute per user
     
+    Raises:
+        TooManyRequestsError: When the caller exceeds the limit
+    
     Usage:
         @router.post("/expenses/ocr")
         @rate_limit(requests_per_minute=10)  # Limit OCR requests
@@ -255,11 +463,43 @@ def rate_limit(requests_per_minute: int = 60):
             ...
     """
     def decorator(func: Callable) -> Callable:
+        # No counter store configured: skip the wrapper entirely
+        if not settings.REDIS_URL:
+            return func
+        
+        endpoint = f"{func.__module__}.{func.__qualname__}"
+        
         @wraps(func)
         async def wrapper(*args, **kwargs) -> Any:
-            # TODO: Implement rate limiting when Redis is integrated
-            # For now, just execute the function
+            request = kwargs.pop(_RATE_LIMIT_REQUEST_KWARG, None)
+            script = get_rate_limit_script()
+            if script is None:
+                return await func(*args, **kwargs)
+            
+            now = time.time()
+            bucket, elapsed = divmod(now, 60)
+            prefix = f"rl:{endpoint}:{_rate_limit_identity(kwargs, request)}"
+            keys = [f"{prefix}:{int(bucket)}", f"{prefix}:{int(bucket) - 1}"]
+            try:
+                count = await script(keys=keys, args=[60, elapsed / 60])
+            except RedisError as e:
+                # Fail open: a Redis outage should not take the API down
+                logger.warning(_RATE_LIMIT_FAILED_MSG, func.__name__, e)
+                return await func(*args, **kwargs)
+            
+            if count > requests_per_minute:
+                raise TooManyRequestsError(
+                    detail="Rate limit exceeded, please retry later",
+                    error_code="RATE_LIMIT_EXCEEDED",
+                    context={
+                        "limit": requests_per_minute,
+                        "retry_after": 60 - int(elapsed)
+                    }
+                )
+            
             return await func(*args, **kwargs)
+        
+        _inject_request(wrapper, func, _RATE_LIMIT_REQUEST_KWARG)
         return wrapper
     return decorator
 
@@ -290,21 +530,41 @@ def api_endpoint(
             ...
     """
     def decorator(func: Callable) -> Callable:
-        # Apply decorators in reverse order (inside out)
-        decorated_func = func
-        
-        if require_ownership:
-            decorated_func = require_user_ownership(require_ownership)(decorated_func)
-        
-        if validate_pagination_params:
-            decorated_func = validate_pagination(decorated_func)
+        # require_ownership needs no wrapper: the ownership check itself is
+        # performed in the service layer (see require_user_ownership)
+        if not (handle_exceptions or validate_pagination_params or log_calls):
+            return func
         
-        if log_calls:
-            decorated_func = log_api_call()(decorated_func)
-        
-        if handle_exceptions:
-            decorated_func = handle_service_exceptions(decorated_func)
+        # One fused wrapper instead of a stack of nested ones: a single extra
+        # frame and coroutine per call, with each feature enabled or not at
+        # decoration time. Behaviour matches applying the individual
+        # decorators in the order exceptions -> logging -> pagination.
+        @wraps(func)
+        async def wrapper(*args, **kwargs) -> Any:
+            log_data = None
+            try:
+                if log_calls and logger.isEnabledFor(logging.INFO):
+                    log_data = _api_call_log_data(func, args, kwargs)
+                    logger.info(_API_CALL_MSG, func.__name__, extra=log_data)
+                
+                if validate_pagination_params:
+                    _check_pagination(kwargs)
+                
+                return await func(*args, **kwargs)
+            
+            except Exception as e:
+                if log_calls and logger.isEnabledFor(logging.ERROR):
+                    logger.error(
+                        _API_ERROR_MSG, func.__name__, e,
+                        extra=log_data or _api_call_log_data(func, args, kwargs)
+                    )
+                
+                if not handle_exceptions or isinstance(e, HTTPException):
+                    raise
+                if isinstance(e, AppBaseException):
+                    raise _app_exception_to_http(e, func)
+                raise _unexpected_exception_to_http(e, func)
         
-        return decorated_func
+        return wrapper
     
-    return decorator
\ No newline at end of file
+    return decorator
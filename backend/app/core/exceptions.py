@@ -1,4 +1,5 @@
 # Core exceptions - Global exceptions used across multiple modules
+from datetime import datetime
 from typing import Any, Dict, Optional
 
 
@@ -10,6 +11,11 @@ class AppBaseException(Exception):
     detail: str = "An unexpected error occurred"
     error_code: Optional[str] = None
     context: Optional[Dict[str, Any]] = None
+    timestamp: Optional[datetime] = None
+    
+    # Defaults live on the class and are only copied onto an instance when
+    # overridden, so raising with defaults never populates the instance dict.
+    # (__slots__ cannot help here: BaseException always provides a __dict__.)
     
     def __init__(
         self, 
@@ -4,7 +4,7 @@ Global exception handlers for the FastAPI application.
 
 import logging
 from fastapi import Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse as JSONResponse
 from .exceptions import AppBaseException
 
 # FastAPI exception handlers
@@ -14,15 +14,24 @@ from starlette.exceptions import HTTPException as StarletteHTTPException
 
 logger = logging.getLogger(__name__)
 
+# Log message templates; arguments are only interpolated if a handler
+# actually emits the record
+_APP_EXC_MSG = "Application exception: %s"
+_HTTP_EXC_MSG = "HTTP exception: %s - %s"
+_VALIDATION_ERROR_MSG = "Validation error: %s"
+_STARLETTE_EXC_MSG = "Starlette HTTP exception: %s - %s"
+_UNEXPECTED_ERROR_MSG = "Unexpected error: %s"
+
 
 async def global_exception_handler(request: Request, exc: AppBaseException) -> JSONResponse:
     """Global exception handler for custom application exceptions."""
-    logger.error(f"Application exception: {exc.detail}", extra={
-        "error_code": exc.error_code,
-        "context": exc.context,
-        "path": request.url.path,
-        "method": request.method
-    })
+    if logger.isEnabledFor(logging.ERROR):
+        logger.error(_APP_EXC_MSG, exc.detail, extra={
+            "error_code": exc.error_code,
+            "context": exc.context,
+            "path": request.url.path,
+            "method": request.method
+        })
     
     return JSONResponse(
         status_code=exc.status_code,
@@ -32,10 +41,11 @@ async def global_exception_handler(request: Request, exc: AppBaseException) -> J
 
 async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
     """Handle FastAPI HTTP exceptions."""
-    logger.warning(f"HTTP exception: {exc.status_code} - {exc.detail}", extra={
-        "path": request.url.path,
-        "method": request.method
-    })
+    if logger.isEnabledFor(logging.WARNING):
+        logger.warning(_HTTP_EXC_MSG, exc.status_code, exc.detail, extra={
+            "path": request.url.path,
+            "method": request.method
+        })
     
     return JSONResponse(
         status_code=exc.status_code,
@@ -49,27 +59,20 @@ async def http_exception_handler(request: Request, exc: HTTPException) -> JSONRe
 
 async def validation_exception_handler(request: Request, exc: RequestValidationError) -> JSONResponse:
     """Handle Pydantic validation errors."""
-    logger.warning(f"Validation error: {exc.errors()}", extra={
-        "path": request.url.path,
-        "method": request.method
-    })
+    errors = exc.errors()
     
-    # Process validation errors to ensure they're JSON serializable
-    errors = []
-    for error in exc.errors():
-        error_dict = {
-            "type": error.get("type", "unknown_error"),
-            "loc": error.get("loc", []),
-            "msg": str(error.get("msg", "Unknown error")),
-            "input": error.get("input")
-        }
-        # Handle ValueError in ctx
-        ctx = error.get("ctx", {})
-        if isinstance(ctx.get("error"), ValueError):
-            error_dict["ctx"] = {"error": str(ctx["error"])}
-        elif ctx:
-            error_dict["ctx"] = ctx
-        errors.append(error_dict)
+    if logger.isEnabledFor(logging.WARNING):
+        logger.warning(_VALIDATION_ERROR_MSG, errors, extra={
+            "path": request.url.path,
+            "method": request.method
+        })
+    
+    # FastAPI already collects these as plain dicts without docs URLs; only
+    # exceptions in ctx are not JSON serializable, so fix those in place
+    for error in errors:
+        ctx = error.get("ctx")
+        if ctx and isinstance(ctx.get("error"), Exception):
+            ctx["error"] = str(ctx["error"])
 
     return JSONResponse(
         status_code=422,
@@ -85,10 +88,11 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 
 async def starlette_http_exception_handler(request: Request, exc: StarletteHTTPException) -> JSONResponse:
     """Handle Starlette HTTP exceptions."""
-    logger.error(f"Starlette HTTP exception: {exc.status_code} - {exc.detail}", extra={
-        "path": request.url.path,
-        "method": request.method
-    })
+    if logger.isEnabledFor(logging.ERROR):
+        logger.error(_STARLETTE_EXC_MSG, exc.status_code, exc.detail, extra={
+            "path": request.url.path,
+            "method": request.method
+        })
     
     return JSONResponse(
         status_code=exc.status_code,
@@ -102,10 +106,11 @@ async def starlette_http_exception_handler(request: Request, exc: StarletteHTTPE
 
 async def generic_exception_handler(request: Request, exc: Exception) -> JSONResponse:
     """Generic exception handler for unexpected errors."""
-    logger.error(f"Unexpected error: {str(exc)}", exc_info=True, extra={
-        "path": request.url.path,
-        "method": request.method
-    })
+    if logger.isEnabledFor(logging.ERROR):
+        logger.error(_UNEXPECTED_ERROR_MSG, exc, exc_info=True, extra={
+            "path": request.url.path,
+            "method": request.method
+        })
     
     return JSONResponse(
         status_code=500,
@@ -1,6 +1,9 @@
+import hashlib
+import time
 from pathlib import Path
 
 import firebase_admin
+from cachetools import TTLCache
 from firebase_admin import credentials, auth
 
 from ..config import settings
@@ -12,10 +15,23 @@ def initialize_firebase():
     cred = credentials.Certificate(str(firebase_creds))
     firebase_admin.initialize_app(cred)
 
+# Decoded tokens by token digest, so repeat requests skip signature checks.
+# Only touched from the event loop thread, so no lock is needed.
+_token_cache: TTLCache = TTLCache(maxsize=10_000, ttl=300)
+
+
 async def verify_firebase_token(token: str) -> dict:
     """Verify Firebase ID token and return user info"""
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    decoded_token = _token_cache.get(key)
+    if decoded_token is not None:
+        if decoded_token.get("exp", 0) > time.time():
+            return decoded_token
+        _token_cache.pop(key, None)
+
     try:
         decoded_token = auth.verify_id_token(token)
+        _token_cache[key] = decoded_token
         return decoded_token
     except Exception as e:
         raise UnauthorizedError(
@@ -0,0 +1,64 @@
+from typing import Optional
+
+from redis.asyncio import Redis
+from redis.commands.core import AsyncScript
+
+from app.core.config import settings
+
+# Shared client, created in the application lifespan (see main.py)
+redis_client: Optional[Redis] = None
+
+# Sliding window counter: KEYS are the current and previous window counters,
+# ARGV the window length in seconds and the elapsed fraction of the current
+# window. The previous window's count is weighted by how much of it still
+# overlaps the last window-length of time.
+_RATE_LIMIT_LUA = (
+    "local v = redis.call('INCR', KEYS[1]) "
+    "if v == 1 then redis.call('EXPIRE', KEYS[1], tonumber(ARGV[1]) * 2) end "
+    "local p = tonumber(redis.call('GET', KEYS[2]) or '0') "
+    "return math.floor(p * (1 - tonumber(ARGV[2])) + v)"
+)
+rate_limit_script: Optional[AsyncScript] = None
+
+
+async def init_redis() -> Redis:
+    """
+    Create the shared Redis client.
+
+    Returns:
+        Redis: Connected client
+    """
+    global redis_client, rate_limit_script
+    redis_client = Redis.from_url(settings.REDIS_URL)
+    await redis_client.ping()
+    rate_limit_script = redis_client.register_script(_RATE_LIMIT_LUA)
+    return redis_client
+
+
+async def close_redis() -> None:
+    """Close the shared Redis client and its connection pool."""
+    global redis_client, rate_limit_script
+    rate_limit_script = None
+    if redis_client is not None:
+        await redis_client.aclose()
+        redis_client = None
+
+
+def get_redis() -> Optional[Redis]:
+    """
+    Get the shared Redis client.
+
+    Returns:
+        Redis client, or None when Redis is not initialized
+    """
+    return redis_client
+
+
+def get_rate_limit_script() -> Optional[AsyncScript]:
+    """
+    Get the registered rate limit counter script.
+
+    Returns:
+        Script callable, or None when Redis is not initialized
+    """
+    return rate_limit_script
@@ -1,19 +1,43 @@
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from .config import settings
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        response: Response = await call_next(request)
-        
-        # Security headers
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        
+
+class SecurityHeadersMiddleware:
+    """
+    Add security headers to every HTTP response.
+
+    Implemented as a pure ASGI middleware that edits the response start
+    message on its way out, avoiding BaseHTTPMiddleware's per-request task.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+        # Security headers, encoded once
+        headers = [
+            (b"x-content-type-options", b"nosniff"),
+            (b"x-frame-options", b"DENY"),
+            (b"x-xss-protection", b"1; mode=block"),
+            (b"referrer-policy", b"strict-origin-when-cross-origin"),
+        ]
         if settings.ENV == "production":
-            response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-        
-        return response
\ No newline at end of file
+            headers.append((b"strict-transport-security", b"max-age=31536000; includeSubDomains"))
+
+        self.headers = headers
+        self.header_names = frozenset(name for name, _ in headers)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Replace rather than duplicate headers the app already set
+                message["headers"] = [
+                    (name, value) for name, value in message.get("headers", ())
+                    if name.lower() not in self.header_names
+                ] + self.headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
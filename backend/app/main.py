@@ -1,23 +1,48 @@
-import os
+import asyncio
 import logging
+import queue
+import time
+from logging.handlers import QueueHandler, QueueListener
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
-from fastapi import FastAPI
+import orjson
+from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.middleware.httpsredirect import HTTPSRedirectMiddleware
 
 from .core.config import settings
 from .core.database import Base, engine, init_db
+from .core.redis import init_redis, close_redis
 from .core.firebase.auth import initialize_firebase
 from .core.exceptions_handler import setup_exception_handlers
+from .services.file import flush_download_counts, run_download_count_flusher
+
+# Environment flags, resolved once from settings
+IS_DEV = settings.ENV == "development"
+IS_PROD = settings.ENV == "production"
 
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
+
+# Hand records to a background thread so writing to the stream never
+# blocks the event loop. QueueHandler still formats each record on the
+# calling thread before enqueueing it; only the handler I/O moves off it.
+# The listener runs for the lifetime of the app (see lifespan), and records
+# logged before startup wait in the queue until then.
+_log_queue = queue.SimpleQueue()
+_root_logger = logging.getLogger()
+_log_handlers = list(_root_logger.handlers)
+for _handler in _log_handlers:
+    _root_logger.removeHandler(_handler)
+_root_logger.addHandler(QueueHandler(_log_queue))
+log_listener = QueueListener(_log_queue, *_log_handlers, respect_handler_level=True)
+
 logger = logging.getLogger(__name__)
 
 # Import models to register them with SQLAlchemy (when they are created)
@@ -35,6 +60,7 @@ from .models.product import (
 async def lifespan(app: FastAPI):
     """Application lifespan manager for startup and shutdown events."""
     # Startup
+    log_listener.start()
     logger.info("Starting up Virtual Showroom API...")
     
     # Initialize Firebase Admin SDK
@@ -53,23 +79,55 @@ async def lifespan(app: FastAPI):
         logger.error(f"Failed to initialize database: {str(e)}")
         raise
     
+    # Initialize Redis (response cache, rate limits); the API still works without it
+    app.state.redis = None
+    try:
+        if settings.REDIS_URL:
+            app.state.redis = await init_redis()
+            logger.info("Redis initialized successfully")
+    except Exception as e:
+        app.state.redis = None
+        await close_redis()
+        logger.warning(f"Redis unavailable, response caching and rate limiting disabled: {str(e)}")
+    
+    # Download counts are buffered in Redis and written back periodically
+    download_flusher = None
+    if app.state.redis is not None:
+        download_flusher = asyncio.create_task(
+            run_download_count_flusher(settings.DOWNLOAD_COUNT_FLUSH_SECONDS)
+        )
+    
     logger.info("Virtual Showroom API startup completed")
     
     yield
     
     # Shutdown
     logger.info("Shutting down Virtual Showroom API...")
-    # Add any cleanup logic here if needed
+    if download_flusher is not None:
+        download_flusher.cancel()
+        try:
+            await download_flusher
+        except asyncio.CancelledError:
+            pass
+        try:
+            await flush_download_counts()
+        except Exception as e:
+            logger.error(f"Failed to flush download counts on shutdown: {str(e)}")
+    await close_redis()
     logger.info("Virtual Showroom API shutdown completed")
+    
+    # Flush any queued log records
+    log_listener.stop()
 
 
 app = FastAPI(
     title="Virtual Showroom API",
     description="Backend API for the Virtual Showroom application",
     version="1.0.0",
-    docs_url="/docs" if settings.ENV == "development" else None,
-    redoc_url="/redoc" if settings.ENV == "development" else None,
-    lifespan=lifespan
+    docs_url="/docs" if IS_DEV else None,
+    redoc_url="/redoc" if IS_DEV else None,
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Setup global exception handlers
@@ -77,17 +135,13 @@ setup_exception_handlers(app)
 logger.info("Exception handlers configured")
 
 # Configure CORS
-cors_origins = settings.CORS_ORIGINS.copy() if settings.CORS_ORIGINS else []
-
 dev_origins = [
     "http://localhost:3000",
     "http://127.0.0.1:3000", 
     "https://localhost:3000"
 ]
 
-for origin in dev_origins:
-    if origin not in cors_origins:
-        cors_origins.append(origin)
+cors_origins = sorted(set(settings.CORS_ORIGINS or []) | set(dev_origins))
 
 logger.info(f"CORS Origins configured: {cors_origins}")
 logger.info(f"Environment: {settings.ENV}, Debug: {settings.DEBUG}")
@@ -113,7 +167,7 @@ app.add_middleware(
 app.add_middleware(TrustedHostMiddleware, allowed_hosts=["localhost", "127.0.0.1", "*.yourdomain.com"])
 
 # For production
-if settings.ENV == "production":
+if IS_PROD:
     app.add_middleware(HTTPSRedirectMiddleware)
 
 # Include API routes
@@ -122,65 +176,74 @@ app.include_router(api_router)
 
 
 # Health check and utility endpoints
+# The payloads never change while the process runs, so they are encoded once
+HEALTH_BYTES = orjson.dumps({
+    "status": "healthy",
+    "service": "Virtual Showroom API",
+    "version": "1.0.0",
+    "environment": settings.ENV
+})
+
+TEST_CORS_BYTES = orjson.dumps({
+    "message": "CORS test successful",
+    "cors_origins": cors_origins,
+    "environment": settings.ENV
+})
+
+ROOT_BYTES = orjson.dumps({
+    "message": "Welcome to Virtual Showroom API",
+    "version": "1.0.0",
+    "docs": "/docs" if IS_DEV else "Documentation disabled in production",
+    "health": "/health"
+})
+
+
 @app.get("/health", tags=["Health"])
 async def health_check():
     """Health check endpoint for monitoring."""
-    return {
-        "status": "healthy",
-        "service": "Virtual Showroom API",
-        "version": "1.0.0",
-        "environment": os.getenv("ENV", "development")
-    }
+    return Response(content=HEALTH_BYTES, media_type="application/json")
 
 
 @app.get("/test-cors", tags=["Health"])
 async def test_cors():
     """CORS test endpoint for development."""
-    return {
-        "message": "CORS test successful",
-        "cors_origins": cors_origins,
-        "environment": os.getenv("ENV", "development")
-    }
+    return Response(content=TEST_CORS_BYTES, media_type="application/json")
 
 
 @app.get("/", tags=["Root"])
 async def root():
     """Root endpoint with API information."""
-    return {
-        "message": "Welcome to Virtual Showroom API",
-        "version": "1.0.0",
-        "docs": "/docs" if os.getenv("ENV", "development") == "development" else "Documentation disabled in production",
-        "health": "/health"
-    }
+    return Response(content=ROOT_BYTES, media_type="application/json")
 
 
 # Add middleware for request logging in development
-if os.getenv("ENV", "development") == "development":
+if IS_DEV:
     
     @app.middleware("http")
     async def log_requests(request, call_next):
         """Log all requests in development mode."""
-        import time
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         # Log request
-        logger.info(f"Request: {request.method} {request.url}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Request: %s %s", request.method, request.url)
         
         # Process request
         response = await call_next(request)
         
         # Log response
-        process_time = time.time() - start_time
-        logger.info(
-            f"Response: {response.status_code} - "
-            f"Process time: {process_time:.4f}s"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            process_time = time.perf_counter() - start_time
+            logger.info(
+                "Response: %s - Process time: %.4fs",
+                response.status_code, process_time
+            )
         
         return response
 
 
 # Error handling verification endpoint (development only)
-if os.getenv("ENV", "development") == "development":
+if IS_DEV:
     
     @app.get("/test-exceptions", tags=["Development"])
     async def test_exceptions(exception_type: str = "validation"):
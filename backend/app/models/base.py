@@ -3,10 +3,15 @@ Base Database Model
 
 Provides common fields and functionality for all database models.
 Includes audit fields, soft deletion, and UUID primary keys.
+
+Models never create engines or connections themselves: all sessions come
+from the pooled engine in app.core.database.
 """
 
+import os
+import time
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any
 
 from sqlalchemy import Column, DateTime, Boolean, Text
@@ -15,10 +20,52 @@ from sqlalchemy.dialects.postgresql import UUID
 
 # Use UUID type for PostgreSQL, fallback to String for SQLite
 UUIDType = UUID(as_uuid=True)
-from sqlalchemy.ext.declarative import as_declarative, declared_attr
+from sqlalchemy.ext.declarative import as_declarative
 from sqlalchemy.sql import func
 
 
+_uuid7_last_ms = 0
+_uuid7_counter = 0
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUID version 7 (RFC 9562).
+    
+    Layout: 48-bit Unix millisecond timestamp, version, a 12-bit counter
+    (randomly seeded each millisecond) and 62 random bits. IDs generated
+    by this process are strictly increasing, so new rows append to the
+    right edge of the primary key index instead of landing on random pages,
+    and ordering by id matches creation order.
+    
+    Returns:
+        UUID version 7
+    """
+    global _uuid7_last_ms, _uuid7_counter
+    
+    ms = time.time_ns() // 1_000_000
+    if ms > _uuid7_last_ms:
+        _uuid7_last_ms = ms
+        # Leave headroom in the counter for IDs within the same millisecond
+        _uuid7_counter = int.from_bytes(os.urandom(2), "big") & 0x7FF
+    else:
+        _uuid7_counter += 1
+        if _uuid7_counter > 0xFFF:
+            # Counter exhausted: borrow the next millisecond
+            _uuid7_last_ms += 1
+            _uuid7_counter = 0
+    
+    rand_b = int.from_bytes(os.urandom(8), "big") & ((1 << 62) - 1)
+    value = (
+        (_uuid7_last_ms << 80)
+        | (0x7 << 76)
+        | (_uuid7_counter << 64)
+        | (0b10 << 62)
+        | rand_b
+    )
+    return uuid.UUID(int=value)
+
+
 @as_declarative()
 class Base:
     """Base class for all database models."""
@@ -26,10 +73,12 @@ class Base:
     id: Any
     __name__: str
     
-    # Generate __tablename__ automatically
-    @declared_attr
-    def __tablename__(cls) -> str:
-        return cls.__name__.lower() + "s"
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        # Generate __tablename__ once, when the class is created, unless the
+        # model declares its own (abstract bases don't get a table)
+        if "__tablename__" not in cls.__dict__ and not cls.__dict__.get("__abstract__", False):
+            cls.__tablename__ = cls.__name__.lower() + "s"
+        super().__init_subclass__(**kwargs)
 
 
 class BaseModel(Base):
@@ -44,12 +93,11 @@ class BaseModel(Base):
     """
     __abstract__ = True
     
-    # Primary key
+    # Primary key (time-ordered; the primary key constraint provides the index)
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
-        index=True,
+        default=uuid7,
         doc="Unique identifier"
     )
     
@@ -83,11 +131,12 @@ class BaseModel(Base):
     )
     
     # Soft deletion
+    # Not indexed here: hot tables declare partial indexes on live rows
+    # (is_deleted = false) instead of a full index dominated by one value
     is_deleted = Column(
         Boolean,
         default=False,
         nullable=False,
-        index=True,
         doc="Soft deletion flag"
     )
     
@@ -116,7 +165,9 @@ class BaseModel(Base):
             user_id: ID of user performing the deletion
         """
         self.is_deleted = True
-        self.deleted_at = datetime.utcnow()
+        # A concrete value: a SQL expression here would leave the attribute
+        # expired after flush, and lazy loading it fails under asyncio
+        self.deleted_at = datetime.now(timezone.utc)
         self.updated_by = user_id
     
     def restore(self, user_id: uuid.UUID = None) -> None:
@@ -1,13 +1,16 @@
 from datetime import date
 from typing import List, TYPE_CHECKING
 
-from sqlalchemy import Column, String, Integer, Text, Date, JSON, Boolean, Index
-from sqlalchemy.orm import relationship, Mapped
+from sqlalchemy import Column, String, Integer, Text, Date, Boolean, Enum, Index, text, select, func, and_
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.ext.mutable import MutableDict
+from sqlalchemy.orm import relationship, Mapped, column_property
 
 from app.models.base import BaseModel
+from app.models.product.product import Product
 
 if TYPE_CHECKING:
-    from app.models.product.product import Product
     from app.models.file import File
 
 
@@ -30,16 +33,13 @@ class Collection(BaseModel):
     
     slug = Column(
         String(120),
-        unique=True,
         nullable=False,
-        index=True,
-        doc="URL-friendly slug for the collection"
+        doc="URL-friendly slug for the collection (unique among live collections)"
     )
     
     season = Column(
-        String(20),
+        Enum("Spring", "Summer", "Fall", "Winter", name="collection_season"),
         nullable=False,
-        index=True,
         doc="Season (Spring, Summer, Fall, Winter)"
     )
     
@@ -78,10 +78,9 @@ class Collection(BaseModel):
     
     # Status and Visibility
     status = Column(
-        String(20),
+        Enum("draft", "active", "archived", name="collection_status"),
         default="draft",
         nullable=False,
-        index=True,
         doc="Collection status (draft, active, archived)"
     )
     
@@ -95,7 +94,7 @@ class Collection(BaseModel):
     
     # Metadata and Settings
     extra_data = Column(
-        JSON,
+        MutableDict.as_mutable(JSONB),
         default=dict,
         nullable=True,
         doc="Additional collection metadata and settings"
@@ -118,8 +117,10 @@ class Collection(BaseModel):
     products: Mapped[List["Product"]] = relationship(
         "Product",
         back_populates="collection",
-        cascade="all, delete-orphan",
-        lazy="selectin"
+        # ON DELETE CASCADE removes the rows; the ORM never loads them to delete
+        cascade="save-update, merge",
+        passive_deletes="all",
+        lazy="select"  # Loaded explicitly by the queries that need it
     )
     
     files: Mapped[List["File"]] = relationship(
@@ -133,6 +134,15 @@ class Collection(BaseModel):
         Index("idx_collection_season_year", "season", "year"),
         Index("idx_collection_status_published", "status", "is_published"),
         Index("idx_collection_order_dates", "order_start_date", "order_end_date"),
+        Index("idx_collection_active", "id", postgresql_where=text("is_deleted = false")),
+        # Live-row indexes: slug lookups and the (year DESC, name) listing order;
+        # a deleted collection frees its slug, matching check_slug_exists
+        Index("idx_collection_live_slug", "slug", unique=True, postgresql_where=text("is_deleted = false")),
+        Index("idx_collection_live_year_name", year.desc(), name, "id", postgresql_where=text("is_deleted = false")),
+        Index("idx_collection_deleted_at", "deleted_at", postgresql_where=text("deleted_at IS NOT NULL")),
+        # Trigram indexes (pg_trgm) let search's ILIKE '%term%' use an index
+        Index("idx_collection_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+        Index("idx_collection_description_trgm", "description", postgresql_using="gin", postgresql_ops={"description": "gin_trgm_ops"}),
     )
     
     def __repr__(self) -> str:
@@ -143,7 +153,7 @@ class Collection(BaseModel):
         """Get full collection name with season and year."""
         return f"{self.name} - {self.season} {self.year}"
     
-    @property
+    @hybrid_property
     def is_order_period_active(self) -> bool:
         """Check if the collection is currently in its order period."""
         if not self.order_start_date or not self.order_end_date:
@@ -152,7 +162,24 @@ class Collection(BaseModel):
         today = date.today()
         return self.order_start_date <= today <= self.order_end_date
     
-    @property
-    def product_count(self) -> int:
-        """Get the number of products in this collection."""
-        return len(self.products) if self.products else 0
\ No newline at end of file
+    @is_order_period_active.expression
+    def is_order_period_active(cls):
+        """SQL form of the order period check, usable in WHERE clauses."""
+        return and_(
+            cls.order_start_date.isnot(None),
+            cls.order_end_date.isnot(None),
+            func.current_date().between(cls.order_start_date, cls.order_end_date)
+        )
+
+
+# Number of live products, computed in SQL as a correlated subquery so that
+# counting never loads the products themselves. Every collection response
+# includes it, so it is loaded with the row rather than deferred (a deferred
+# load on access isn't possible under the async session anyway).
+Collection.product_count = column_property(
+    select(func.count(Product.id))
+    .where(and_(Product.collection_id == Collection.id, Product.is_deleted == False))
+    .correlate_except(Product)
+    .scalar_subquery(),
+    doc="Number of products in this collection"
+)
\ No newline at end of file
@@ -6,8 +6,10 @@ Represents uploaded files and their metadata.
 
 from typing import List, Optional, TYPE_CHECKING
 
-from sqlalchemy import Column, String, Integer, Text, JSON, ForeignKey, Index
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Integer, Text, DateTime, ForeignKey, Index, LargeBinary, Computed, CheckConstraint, text, func
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.ext.mutable import MutableDict, MutableList
 from sqlalchemy.orm import relationship, Mapped
 
 from app.models.base import BaseModel
@@ -17,6 +19,32 @@ if TYPE_CHECKING:
     from app.models.product.product import Product
 
 
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+DOCUMENT_CONTENT_TYPES = (
+    'application/pdf',
+    'application/msword',
+    'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    'text/plain',
+)
+
+# Derived by PostgreSQL from content_type so kind filters can use an index
+_FILE_KIND_SQL = (
+    "CASE"
+    " WHEN content_type LIKE 'image/%' THEN 'image'"
+    " WHEN content_type IN (" + ", ".join(f"'{t}'" for t in DOCUMENT_CONTENT_TYPES) + ") THEN 'document'"
+    " WHEN content_type LIKE 'video/%' THEN 'video'"
+    " WHEN content_type LIKE 'audio/%' THEN 'audio'"
+    " ELSE 'other' END"
+)
+
+
+def _human_readable_size(size: int) -> str:
+    """Format a byte count, picking the unit from the bit length."""
+    exponent = min(max(0, (size.bit_length() - 1) // 10), len(_SIZE_UNITS) - 1)
+    return f"{size / (1 << (exponent * 10)):.1f} {_SIZE_UNITS[exponent]}"
+
+
 class File(BaseModel):
     """
     File Model
@@ -47,6 +75,19 @@ class File(BaseModel):
         doc="MIME content type"
     )
     
+    file_kind = Column(
+        String(10),
+        Computed(_FILE_KIND_SQL, persisted=True),
+        index=True,
+        doc="File kind derived from content type (image, document, video, audio, other)"
+    )
+    
+    content_type_major = Column(
+        String(50),
+        Computed("split_part(content_type, '/', 1)", persisted=True),
+        doc="Top-level MIME type (e.g. 'image' for 'image/png'), for storage breakdowns"
+    )
+    
     size = Column(
         Integer,
         nullable=False,
@@ -66,19 +107,19 @@ class File(BaseModel):
         doc="Storage path on disk or cloud"
     )
     
-    # File Integrity
+    # File Integrity (raw digests; see hash_md5_hex/hash_sha256_hex)
     hash_md5 = Column(
-        String(32),
+        LargeBinary(16),
         nullable=True,
         index=True,
-        doc="MD5 hash of file content"
+        doc="MD5 digest of file content"
     )
     
     hash_sha256 = Column(
-        String(64),
+        LargeBinary(32),
         nullable=True,
         index=True,
-        doc="SHA256 hash of file content"
+        doc="SHA256 digest of file content"
     )
     
     # Metadata and Description
@@ -89,14 +130,15 @@ class File(BaseModel):
     )
     
     tags = Column(
-        JSON,
+        MutableList.as_mutable(JSONB),
         default=list,
+        server_default=text("'[]'::jsonb"),
         nullable=True,
         doc="File tags for categorization"
     )
     
     extra_data = Column(
-        JSON,
+        MutableDict.as_mutable(JSONB),
         default=dict,
         nullable=True,
         doc="Additional file metadata (dimensions, EXIF, etc.)"
@@ -111,7 +153,7 @@ class File(BaseModel):
     )
     
     last_accessed = Column(
-        String(50),
+        DateTime(timezone=True),
         nullable=True,
         doc="Last access timestamp"
     )
@@ -146,11 +188,25 @@ class File(BaseModel):
     
     # Indexes for performance
     __table_args__ = (
-        Index("idx_file_content_type", "content_type"),
         Index("idx_file_size", "size"),
-        Index("idx_file_collection", "collection_id"),
-        Index("idx_file_product", "product_id"),
-        Index("idx_file_created", "created_at"),
+        # Storage breakdown by type aggregates from the index alone
+        Index(
+            "idx_file_type_major_size",
+            "content_type_major",
+            postgresql_include=["size"],
+            postgresql_where=text("is_deleted = false")
+        ),
+        # Keyset pagination seeks on (created_at, id) over live files
+        Index("idx_file_created_id", "created_at", "id", postgresql_where=text("is_deleted = false")),
+        Index("idx_file_tags_gin", "tags", postgresql_using="gin"),
+        # Trigram indexes (pg_trgm) serve search_files' ILIKE '%term%'
+        Index("idx_file_filename_trgm", "filename", postgresql_using="gin", postgresql_ops={"filename": "gin_trgm_ops"}),
+        Index("idx_file_original_filename_trgm", "original_filename", postgresql_using="gin", postgresql_ops={"original_filename": "gin_trgm_ops"}),
+        Index("idx_file_description_trgm", "description", postgresql_using="gin", postgresql_ops={"description": "gin_trgm_ops"}),
+        CheckConstraint("jsonb_typeof(tags) = 'array'", name="ck_file_tags_array"),
+        Index("idx_file_last_accessed", "last_accessed", postgresql_where=text("last_accessed IS NOT NULL")),
+        Index("idx_file_active", "id", postgresql_where=text("is_deleted = false")),
+        Index("idx_file_deleted_at", "deleted_at", postgresql_where=text("deleted_at IS NOT NULL")),
     )
     
     def __repr__(self) -> str:
@@ -159,43 +215,57 @@ class File(BaseModel):
     @property
     def file_extension(self) -> str:
         """Get file extension from filename."""
-        return self.original_filename.split('.')[-1].lower() if '.' in self.original_filename else ''
+        _, dot, extension = self.original_filename.rpartition('.')
+        return extension.lower() if dot else ''
     
-    @property
+    @hybrid_property
     def is_image(self) -> bool:
         """Check if file is an image."""
         return self.content_type.startswith('image/')
     
-    @property
+    @is_image.expression
+    def is_image(cls):
+        return cls.file_kind == 'image'
+    
+    @hybrid_property
     def is_document(self) -> bool:
         """Check if file is a document."""
-        document_types = [
-            'application/pdf',
-            'application/msword',
-            'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
-            'text/plain'
-        ]
-        return self.content_type in document_types
+        return self.content_type in DOCUMENT_CONTENT_TYPES
+    
+    @is_document.expression
+    def is_document(cls):
+        return cls.file_kind == 'document'
+    
+    @hybrid_property
+    def hash_md5_hex(self) -> Optional[str]:
+        """Get the MD5 digest as a hex string."""
+        return self.hash_md5.hex() if self.hash_md5 is not None else None
+    
+    @hash_md5_hex.expression
+    def hash_md5_hex(cls):
+        return func.encode(cls.hash_md5, 'hex')
+    
+    @hybrid_property
+    def hash_sha256_hex(self) -> Optional[str]:
+        """Get the SHA256 digest as a hex string."""
+        return self.hash_sha256.hex() if self.hash_sha256 is not None else None
+    
+    @hash_sha256_hex.expression
+    def hash_sha256_hex(cls):
+        return func.encode(cls.hash_sha256, 'hex')
     
     @property
     def human_readable_size(self) -> str:
         """Get human readable file size."""
-        size = self.size
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size < 1024:
-                return f"{size:.1f} {unit}"
-            size /= 1024
-        return f"{size:.1f} TB"
+        return _human_readable_size(self.size)
     
     def get_tags_list(self) -> List[str]:
         """Get tags as list of strings."""
-        if isinstance(self.tags, list):
-            return self.tags
-        return []
+        return self.tags or []
     
     def add_tag(self, tag: str) -> None:
         """Add a tag to the file."""
-        if not self.tags:
+        if self.tags is None:
             self.tags = []
         if tag not in self.tags:
             self.tags.append(tag)
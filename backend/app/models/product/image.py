@@ -7,7 +7,7 @@ Supports the frontend image display requirements.
 
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Column, String, Integer, ForeignKey, Index
+from sqlalchemy import Column, String, Integer, Float, Computed, Enum, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship, Mapped
 
@@ -58,7 +58,7 @@ class ProductImage(BaseModel):
     )
     
     type = Column(
-        String(20),
+        Enum("main", "detail", "lifestyle", "thumbnail", name="product_image_type"),
         nullable=False,
         index=True,
         doc="Image type: main, detail, lifestyle, thumbnail"
@@ -95,6 +95,15 @@ class ProductImage(BaseModel):
         doc="Image format (jpg, png, webp)"
     )
     
+    aspect_ratio = Column(
+        Float,
+        Computed(
+            "CASE WHEN width <> 0 AND height <> 0 THEN width::float8 / height ELSE 1.0 END",
+            persisted=True
+        ),
+        doc="Aspect ratio (width/height), 1.0 when dimensions are unknown"
+    )
+    
     # Relationships
     product: Mapped["Product"] = relationship(
         "Product",
@@ -110,6 +119,8 @@ class ProductImage(BaseModel):
     __table_args__ = (
         Index("idx_product_image_type_order", "product_id", "type", "sort_order"),
         Index("idx_variant_image_type_order", "variant_id", "type", "sort_order"),
+        Index("idx_product_image_active", "id", postgresql_where=text("is_deleted = false")),
+        Index("idx_product_image_deleted_at", "deleted_at", postgresql_where=text("deleted_at IS NOT NULL")),
     )
     
     def __repr__(self) -> str:
@@ -119,10 +130,3 @@ class ProductImage(BaseModel):
     def is_main_image(self) -> bool:
         """Check if this is a main product image."""
         return self.type == "main"
-    
-    @property
-    def aspect_ratio(self) -> float:
-        """Calculate aspect ratio if dimensions are available."""
-        if self.width and self.height:
-            return self.width / self.height
-        return 1.0
\ No newline at end of file
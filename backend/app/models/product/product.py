@@ -4,22 +4,22 @@ Enhanced Product Database Model
 Updated to support all frontend component requirements with proper relationships.
 """
 
-from decimal import Decimal
 from typing import List, TYPE_CHECKING
 
 from sqlalchemy import (
-    Column, String, Text, JSON, ForeignKey, 
-    DECIMAL, Boolean, Integer, Index
+    Column, String, Text, ForeignKey, 
+    DECIMAL, Boolean, Integer, Enum, Index, CHAR, CheckConstraint, text, select, func, and_
 )
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship, Mapped
+from sqlalchemy.dialects.postgresql import JSONB, UUID, aggregate_order_by
+from sqlalchemy.ext.mutable import MutableDict, MutableList
+from sqlalchemy.orm import relationship, Mapped, column_property
 
 from app.models.base import BaseModel
+from app.models.product.image import ProductImage
+from app.models.product.variant import ProductVariant
 
 if TYPE_CHECKING:
     from app.models.collection import Collection
-    from app.models.product.variant import ProductVariant
-    from app.models.product.image import ProductImage
     from app.models.product.technical_specification import TechnicalSpecification
     from app.models.product.technical_drawing import TechnicalDrawing
     from app.models.product.size_chart import SizeChart
@@ -57,7 +57,6 @@ class Product(BaseModel):
     category = Column(
         String(50),
         nullable=False,
-        index=True,
         doc="Product category (bikini, one-piece, accessory)"
     )
     
@@ -79,7 +78,6 @@ class Product(BaseModel):
         UUID(as_uuid=True),
         ForeignKey("collections.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
         doc="Reference to parent collection"
     )
     
@@ -97,8 +95,9 @@ class Product(BaseModel):
     )
     
     currency = Column(
-        String(3),
+        CHAR(3),
         default="EUR",
+        server_default="EUR",
         nullable=False,
         doc="Price currency code (ISO 4217)"
     )
@@ -111,22 +110,25 @@ class Product(BaseModel):
     )
     
     sustainability_features = Column(
-        JSON,
+        MutableList.as_mutable(JSONB),
         default=list,
+        server_default=text("'[]'::jsonb"),
         nullable=True,
         doc="Sustainability features list"
     )
     
     care_instructions = Column(
-        JSON,
+        MutableList.as_mutable(JSONB),
         default=list,
+        server_default=text("'[]'::jsonb"),
         nullable=True,
         doc="Care instructions list"
     )
     
     features = Column(
-        JSON,
+        MutableList.as_mutable(JSONB),
         default=list,
+        server_default=text("'[]'::jsonb"),
         nullable=True,
         doc="Product features list for display"
     )
@@ -139,7 +141,7 @@ class Product(BaseModel):
     
     # Product Status
     status = Column(
-        String(20),
+        Enum("active", "discontinued", "coming_soon", name="product_status"),
         default="active",
         nullable=False,
         index=True,
@@ -150,7 +152,6 @@ class Product(BaseModel):
         Boolean,
         default=False,
         nullable=False,
-        index=True,
         doc="Whether product is featured"
     )
     
@@ -169,7 +170,7 @@ class Product(BaseModel):
     
     # Additional Metadata
     extra_data = Column(
-        JSON,
+        MutableDict.as_mutable(JSONB),
         default=dict,
         nullable=True,
         doc="Additional product metadata"
@@ -184,28 +185,35 @@ class Product(BaseModel):
     variants: Mapped[List["ProductVariant"]] = relationship(
         "ProductVariant",
         back_populates="product",
-        cascade="all, delete-orphan",
-        lazy="selectin"
+        # ON DELETE CASCADE removes the rows; the ORM never loads them to delete
+        cascade="save-update, merge",
+        passive_deletes="all",
+        order_by="ProductVariant.sort_order",
+        # Opt-in per query: an unloaded access raises instead of emitting SQL
+        lazy="raise_on_sql"
     )
     
     images: Mapped[List["ProductImage"]] = relationship(
         "ProductImage",
         back_populates="product",
-        cascade="all, delete-orphan",
+        cascade="save-update, merge",
+        passive_deletes="all",
         order_by="ProductImage.sort_order"
     )
     
     specifications: Mapped[List["TechnicalSpecification"]] = relationship(
         "TechnicalSpecification",
         back_populates="product",
-        cascade="all, delete-orphan",
+        cascade="save-update, merge",
+        passive_deletes="all",
         order_by="TechnicalSpecification.sort_order"
     )
     
     technical_drawings: Mapped[List["TechnicalDrawing"]] = relationship(
         "TechnicalDrawing",
         back_populates="product",
-        cascade="all, delete-orphan",
+        cascade="save-update, merge",
+        passive_deletes="all",
         order_by="TechnicalDrawing.sort_order"
     )
     
@@ -213,7 +221,8 @@ class Product(BaseModel):
         "SizeChart",
         back_populates="product",
         uselist=False,
-        cascade="all, delete-orphan"
+        cascade="save-update, merge",
+        passive_deletes="all"
     )
     
     files: Mapped[List["File"]] = relationship(
@@ -224,77 +233,141 @@ class Product(BaseModel):
     
     # Indexes for performance
     __table_args__ = (
-        Index("idx_product_collection_status", "collection_id", "status"),
+        # Covers the collection listing columns for index-only scans
+        Index(
+            "idx_product_listing_covering",
+            "collection_id",
+            "status",
+            postgresql_include=["id", "name", "sku", "category", "retail_price", "currency", "is_featured"]
+        ),
         Index("idx_product_category_featured", "category", "is_featured"),
+        # Featured products are a small slice; a boolean index would cover every row
+        Index("idx_product_featured_partial", "category", postgresql_where=text("is_featured = true")),
+        # Collections with live featured products (get_featured_collections)
+        Index(
+            "idx_product_featured_live",
+            "collection_id",
+            postgresql_where=text("is_featured = true AND status = 'active' AND is_deleted = false")
+        ),
+        # Containment (@>) lookups on the JSONB list/metadata columns
+        Index("idx_product_features_gin", "features", postgresql_using="gin", postgresql_ops={"features": "jsonb_path_ops"}),
+        Index("idx_product_care_instructions_gin", "care_instructions", postgresql_using="gin", postgresql_ops={"care_instructions": "jsonb_path_ops"}),
+        Index("idx_product_sustainability_gin", "sustainability_features", postgresql_using="gin", postgresql_ops={"sustainability_features": "jsonb_path_ops"}),
+        Index("idx_product_extra_data_gin", "extra_data", postgresql_using="gin", postgresql_ops={"extra_data": "jsonb_path_ops"}),
+        # Trigram indexes (pg_trgm) for search_products' substring matching
+        Index("idx_product_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+        Index("idx_product_description_trgm", "description", postgresql_using="gin", postgresql_ops={"description": "gin_trgm_ops"}),
+        Index("idx_product_short_description_trgm", "short_description", postgresql_using="gin", postgresql_ops={"short_description": "gin_trgm_ops"}),
+        CheckConstraint("currency ~ '^[A-Z]{3}$'", name="ck_product_currency_iso"),
+        # List columns always hold JSON arrays (or NULL), so accessors need no type guard
+        CheckConstraint("jsonb_typeof(features) = 'array'", name="ck_product_features_array"),
+        CheckConstraint("jsonb_typeof(care_instructions) = 'array'", name="ck_product_care_instructions_array"),
+        CheckConstraint("jsonb_typeof(sustainability_features) = 'array'", name="ck_product_sustainability_array"),
+        # created_at follows insertion order, so a tiny BRIN serves time-range scans
+        Index("idx_product_created_brin", "created_at", postgresql_using="brin", postgresql_with={"pages_per_range": 32}),
+        Index("idx_product_created_id", "created_at", "id", postgresql_where=text("is_deleted = false")),
+        Index("idx_product_active", "id", postgresql_where=text("is_deleted = false")),
+        Index("idx_product_deleted_at", "deleted_at", postgresql_where=text("deleted_at IS NOT NULL")),
     )
     
     def __repr__(self) -> str:
         return f"<Product(name='{self.name}', sku='{self.sku}')>"
     
-    @property
-    def variant_count(self) -> int:
-        """Get the number of variants for this product."""
-        return len(self.variants) if self.variants else 0
-    
     @property
     def main_image(self) -> "ProductImage":
         """Get the main product image."""
         if self.images:
-            main_images = [img for img in self.images if img.type == "main"]
-            if main_images:
-                return main_images[0]
-            return self.images[0]  # Fallback to first image
+            # First main image, falling back to the first image
+            return next((img for img in self.images if img.type == "main"), self.images[0])
         return None
     
     @property
     def primary_variant(self) -> "ProductVariant":
-        """Get the primary/first variant."""
+        """Get the primary variant (lowest sort_order, ordered by the loader)."""
         return self.variants[0] if self.variants else None
     
-    @property
-    def available_colors(self) -> List[str]:
-        """Get list of available colors from variants."""
-        if self.variants:
-            return [variant.color for variant in self.variants]
-        return []
-    
     @property
     def price_range(self) -> dict:
         """Get price range considering variant adjustments."""
-        base_price = self.retail_price or Decimal('0')
-        
-        if not self.variants:
-            return {
-                "min": base_price,
-                "max": base_price,
-                "currency": self.currency
-            }
-        
-        prices = []
-        for variant in self.variants:
-            variant_price = base_price + (variant.price_adjustment or Decimal('0'))
-            prices.append(variant_price)
-        
         return {
-            "min": min(prices),
-            "max": max(prices),
+            "min": self.price_range_min,
+            "max": self.price_range_max,
             "currency": self.currency
         }
     
     def get_features_list(self) -> List[str]:
         """Get features as list of strings."""
-        if isinstance(self.features, list):
-            return self.features
-        return []
+        return self.features or []
     
     def get_care_instructions_list(self) -> List[str]:
         """Get care instructions as list of strings."""
-        if isinstance(self.care_instructions, list):
-            return self.care_instructions
-        return []
+        return self.care_instructions or []
     
     def get_sustainability_features_list(self) -> List[str]:
         """Get sustainability features as list of strings."""
-        if isinstance(self.sustainability_features, list):
-            return self.sustainability_features
-        return []
+        return self.sustainability_features or []
+
+
+# The subquery properties below are deferred so that only the queries which
+# render them (the product summary and detail selects) pay for the extra
+# subqueries; those queries undefer them explicitly.
+
+# Number of live variants, computed in SQL as a correlated subquery so that
+# counting never loads the variants themselves
+Product.variant_count = column_property(
+    select(func.count(ProductVariant.id))
+    .where(and_(ProductVariant.product_id == Product.id, ProductVariant.is_deleted == False))
+    .correlate_except(ProductVariant)
+    .scalar_subquery(),
+    deferred=True,
+    doc="Number of variants for this product"
+)
+
+
+# URL of the main image (falling back to the first image), so listings can
+# show a thumbnail without loading the images collection
+Product.main_image_url = column_property(
+    select(ProductImage.url)
+    .where(and_(ProductImage.product_id == Product.id, ProductImage.is_deleted == False))
+    .correlate_except(ProductImage)
+    .order_by(ProductImage.type != "main", ProductImage.sort_order)
+    .limit(1)
+    .scalar_subquery(),
+    deferred=True,
+    doc="URL of the main product image"
+)
+
+# Variant colors in display order, aggregated in SQL. Only the detail
+# response renders them.
+Product.available_colors = column_property(
+    select(func.array_agg(aggregate_order_by(ProductVariant.color, ProductVariant.sort_order)))
+    .where(and_(ProductVariant.product_id == Product.id, ProductVariant.is_deleted == False))
+    .correlate_except(ProductVariant)
+    .scalar_subquery(),
+    deferred=True,
+    doc="Available colors from the product variants"
+)
+
+
+def _variant_price_bound(aggregate):
+    """Retail price plus the min/max live variant adjustment, in SQL."""
+    adjustment = (
+        select(aggregate(func.coalesce(ProductVariant.price_adjustment, 0)))
+        .where(and_(ProductVariant.product_id == Product.id, ProductVariant.is_deleted == False))
+        .correlate_except(ProductVariant)
+        .scalar_subquery()
+    )
+    return func.coalesce(Product.retail_price, 0) + func.coalesce(adjustment, 0)
+
+
+# Price range bounds, aggregated by PostgreSQL instead of iterating variants
+Product.price_range_min = column_property(
+    _variant_price_bound(func.min),
+    deferred=True,
+    doc="Lowest variant price (retail price plus adjustment)"
+)
+Product.price_range_max = column_property(
+    _variant_price_bound(func.max),
+    deferred=True,
+    doc="Highest variant price (retail price plus adjustment)"
+)
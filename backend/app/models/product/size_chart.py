@@ -7,8 +7,8 @@ Supports the TechnicalFilesViewer component size chart requirements.
 
 from typing import TYPE_CHECKING, List, Dict, Any
 
-from sqlalchemy import Column, String, Text, JSON, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Text, Enum, ForeignKey, Index, CheckConstraint, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship, Mapped
 
 from app.models.base import BaseModel
@@ -43,15 +43,16 @@ class SizeChart(BaseModel):
     )
     
     chart_type = Column(
-        String(20),
+        Enum("standard", "plus_size", "kids", "maternity", name="size_chart_type"),
         default="standard",
         doc="Chart type: standard, plus_size, kids, maternity"
     )
     
     # Size Data (JSON structure)
     sizes = Column(
-        JSON,
+        JSONB,
         nullable=False,
+        server_default=text("'[]'::jsonb"),
         doc="Array of size objects with measurements"
     )
     # Example structure:
@@ -86,14 +87,18 @@ class SizeChart(BaseModel):
         back_populates="size_chart"
     )
     
+    # Indexes for performance
+    __table_args__ = (
+        Index("idx_size_chart_sizes_gin", "sizes", postgresql_using="gin", postgresql_ops={"sizes": "jsonb_path_ops"}),
+        CheckConstraint("jsonb_typeof(sizes) = 'array'", name="ck_size_chart_sizes_array"),
+    )
+    
     def __repr__(self) -> str:
         return f"<SizeChart(product_id='{self.product_id}', type='{self.chart_type}')>"
     
     def get_sizes_list(self) -> List[Dict[str, Any]]:
         """Get sizes as list of dictionaries."""
-        if isinstance(self.sizes, list):
-            return self.sizes
-        return []
+        return self.sizes or []
     
     def get_available_sizes(self) -> List[str]:
         """Get list of available size names."""
@@ -108,9 +113,9 @@ class SizeChart(BaseModel):
                 return size
         return {}
     
-    @classmethod
-    def create_standard_chart(cls, product_id: str) -> 'SizeChart':
-        """Helper to create standard international size chart."""
+    @staticmethod
+    def standard_chart_row(product_id: str) -> Dict[str, Any]:
+        """Column values for the standard international size chart."""
         standard_sizes = [
             {"size": "XS", "uk": "6", "eu": "34", "us": "2", "bust": "32", "waist": "24", "hip": "34"},
             {"size": "S", "uk": "8", "eu": "36", "us": "4", "bust": "34", "waist": "26", "hip": "36"},
@@ -119,11 +124,16 @@ class SizeChart(BaseModel):
             {"size": "XL", "uk": "14", "eu": "42", "us": "10", "bust": "40", "waist": "32", "hip": "42"}
         ]
         
-        return cls(
-            product_id=product_id,
-            name="International Sizing",
-            chart_type="standard",
-            sizes=standard_sizes,
-            measurement_unit="inches",
-            notes="All measurements are in inches. Model is 5'8\" wearing size S."
-        )
\ No newline at end of file
+        return {
+            "product_id": product_id,
+            "name": "International Sizing",
+            "chart_type": "standard",
+            "sizes": standard_sizes,
+            "measurement_unit": "inches",
+            "notes": "All measurements are in inches. Model is 5'8\" wearing size S."
+        }
+    
+    @classmethod
+    def create_standard_chart(cls, product_id: str) -> 'SizeChart':
+        """Helper to create standard international size chart."""
+        return cls(**cls.standard_chart_row(product_id))
\ No newline at end of file
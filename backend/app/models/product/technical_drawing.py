@@ -5,9 +5,9 @@ Handles technical drawings for products (front, back, side views).
 Supports the TechnicalFilesViewer component requirements.
 """
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Dict, List
 
-from sqlalchemy import Column, String, Text, Integer, ForeignKey, Index, Boolean
+from sqlalchemy import Column, String, Text, Integer, Enum, ForeignKey, Index, Boolean
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship, Mapped
 
@@ -37,7 +37,7 @@ class TechnicalDrawing(BaseModel):
     
     # Drawing Information
     view = Column(
-        String(20),
+        Enum("front", "back", "side", "detail", name="technical_drawing_view"),
         nullable=False,
         index=True,
         doc="Drawing view: front, back, side, detail"
@@ -128,9 +128,9 @@ class TechnicalDrawing(BaseModel):
             return self.width / self.height
         return 1.0
     
-    @classmethod
-    def create_standard_views(cls, product_id: str, base_url: str) -> list['TechnicalDrawing']:
-        """Helper to create standard technical drawing views."""
+    @staticmethod
+    def standard_view_rows(product_id: str, base_url: str) -> List[Dict[str, Any]]:
+        """Column values for the standard technical drawing views."""
         views = [
             {
                 "view": "front",
@@ -150,16 +150,19 @@ class TechnicalDrawing(BaseModel):
             }
         ]
         
-        drawings = []
-        for view_data in views:
-            drawing = cls(
-                product_id=product_id,
-                view=view_data["view"],
-                title=view_data["title"],
-                image_url=f"{base_url}/technical-drawings/{view_data['view']}.svg",
-                sort_order=view_data["sort_order"],
-                is_featured=view_data.get("is_featured", False)
-            )
-            drawings.append(drawing)
-        
-        return drawings
\ No newline at end of file
+        return [
+            {
+                "product_id": product_id,
+                "view": view_data["view"],
+                "title": view_data["title"],
+                "image_url": f"{base_url}/technical-drawings/{view_data['view']}.svg",
+                "sort_order": view_data["sort_order"],
+                "is_featured": view_data.get("is_featured", False)
+            }
+            for view_data in views
+        ]
+    
+    @classmethod
+    def create_standard_views(cls, product_id: str, base_url: str) -> list['TechnicalDrawing']:
+        """Helper to create standard technical drawing views."""
+        return [cls(**row) for row in cls.standard_view_rows(product_id, base_url)]
\ No newline at end of file
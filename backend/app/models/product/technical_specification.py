@@ -7,8 +7,8 @@ Supports the SpecificationPanel component requirements.
 
 from typing import TYPE_CHECKING, Dict, Any
 
-from sqlalchemy import Column, String, JSON, Integer, Boolean, ForeignKey, Index
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Integer, Boolean, Enum, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship, Mapped
 
 from app.models.base import BaseModel
@@ -37,7 +37,7 @@ class TechnicalSpecification(BaseModel):
     
     # Specification Information
     type = Column(
-        String(30),
+        Enum("material", "construction", "care", "sizing", "sustainability", name="technical_spec_type"),
         nullable=False,
         index=True,
         doc="Specification type (material, construction, care, sizing, sustainability)"
@@ -50,7 +50,7 @@ class TechnicalSpecification(BaseModel):
     )
     
     content = Column(
-        JSON,
+        JSONB,
         nullable=False,
         doc="Structured specification content"
     )
@@ -83,6 +83,12 @@ class TechnicalSpecification(BaseModel):
     __table_args__ = (
         Index("idx_tech_spec_product_type", "product_id", "type"),
         Index("idx_tech_spec_sort", "product_id", "sort_order"),
+        Index(
+            "idx_tech_spec_content_gin",
+            "content",
+            postgresql_using="gin",
+            postgresql_ops={"content": "jsonb_path_ops"}
+        ),
     )
     
     def __repr__(self) -> str:
@@ -8,10 +8,11 @@ from decimal import Decimal
 from typing import List, TYPE_CHECKING
 
 from sqlalchemy import (
-    Column, String, JSON, ForeignKey, 
-    DECIMAL, Boolean, Integer, Index
+    Column, String, ForeignKey, 
+    DECIMAL, Boolean, Integer, Index, CheckConstraint, text
 )
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.ext.mutable import MutableDict, MutableList
 from sqlalchemy.orm import relationship, Mapped
 
 from app.models.base import BaseModel
@@ -73,14 +74,14 @@ class ProductVariant(BaseModel):
         Boolean,
         default=True,
         nullable=False,
-        index=True,
         doc="Whether variant is available"
     )
     
     # Size Information (Enhanced)
     available_sizes = Column(
-        JSON,
+        MutableList.as_mutable(JSONB),
         default=list,
+        server_default=text("'[]'::jsonb"),
         nullable=True,
         doc="Available sizes for this variant ['XS', 'S', 'M', 'L', 'XL']"
     )
@@ -102,7 +103,7 @@ class ProductVariant(BaseModel):
     
     # Metadata
     extra_data = Column(
-        JSON,
+        MutableDict.as_mutable(JSONB),
         default=dict,
         nullable=True,
         doc="Additional variant metadata"
@@ -117,29 +118,35 @@ class ProductVariant(BaseModel):
     images: Mapped[List["ProductImage"]] = relationship(
         "ProductImage",
         back_populates="variant",
-        cascade="all, delete-orphan",
+        # ON DELETE CASCADE removes the rows; the ORM never loads them to delete
+        cascade="save-update, merge",
+        passive_deletes="all",
         order_by="ProductImage.sort_order"
     )
     
     # Indexes
     __table_args__ = (
         Index("idx_variant_product_color", "product_id", "color"),
-        Index("idx_variant_available", "is_available"),
         Index("idx_variant_sort", "product_id", "sort_order"),
+        Index("idx_variant_available_partial", "product_id", postgresql_where=text("is_available = true")),
+        # Index-only scans for the Product.price_range_min/max aggregates
+        Index("idx_variant_price_expr", "product_id", "price_adjustment", postgresql_where=text("is_deleted = false")),
+        Index("idx_variant_available_sizes_gin", "available_sizes", postgresql_using="gin", postgresql_ops={"available_sizes": "jsonb_path_ops"}),
+        CheckConstraint("jsonb_typeof(available_sizes) = 'array'", name="ck_variant_available_sizes_array"),
+        Index("idx_variant_created_brin", "created_at", postgresql_using="brin", postgresql_with={"pages_per_range": 32}),
+        Index("idx_variant_active", "id", postgresql_where=text("is_deleted = false")),
+        Index("idx_variant_deleted_at", "deleted_at", postgresql_where=text("deleted_at IS NOT NULL")),
     )
     
     def __repr__(self) -> str:
-        product_name = self.product.name if self.product else 'Unknown'
-        return f"<ProductVariant(product='{product_name}', color='{self.color}')>"
+        return f"<ProductVariant(sku='{self.sku}', color='{self.color}')>"
     
     @property
     def main_image(self) -> "ProductImage":
         """Get the main image for this variant."""
         if self.images:
-            main_images = [img for img in self.images if img.type == "main"]
-            if main_images:
-                return main_images[0]
-            return self.images[0]  # Fallback to first image
+            # First main image, falling back to the first image
+            return next((img for img in self.images if img.type == "main"), self.images[0])
         return None
     
     @property
@@ -151,9 +158,7 @@ class ProductVariant(BaseModel):
     
     def get_available_sizes_list(self) -> List[str]:
         """Get available sizes as list of strings."""
-        if isinstance(self.available_sizes, list):
-            return self.available_sizes
-        return []
+        return self.available_sizes or []
     
     def is_size_available(self, size: str) -> bool:
         """Check if a specific size is available for this variant."""
@@ -5,9 +5,10 @@ Represents user accounts and authentication information.
 """
 
 from datetime import datetime
+from functools import cached_property
 from typing import Optional
 
-from sqlalchemy import Column, String, Boolean, DateTime, Integer, Index
+from sqlalchemy import Column, String, Boolean, DateTime, Enum, Integer, Index, event, text
 from sqlalchemy.dialects.postgresql import UUID
 
 from app.models.base import BaseModel
@@ -60,10 +61,9 @@ class User(BaseModel):
     
     # Authorization and Status
     role = Column(
-        String(20),
+        Enum("admin", "user", "viewer", name="user_role"),
         default="user",
         nullable=False,
-        index=True,
         doc="User role (admin, user, viewer)"
     )
     
@@ -71,7 +71,6 @@ class User(BaseModel):
         Boolean,
         default=True,
         nullable=False,
-        index=True,
         doc="Whether user account is active"
     )
     
@@ -91,8 +90,9 @@ class User(BaseModel):
     
     # Indexes for performance
     __table_args__ = (
-        Index("idx_user_email_active", "email", "is_active"),
         Index("idx_user_role_active", "role", "is_active"),
+        Index("idx_user_active_partial", "email", postgresql_where=text("is_active = true")),
+        Index("idx_user_created_brin", "created_at", postgresql_using="brin", postgresql_with={"pages_per_range": 32}),
     )
     
     def __repr__(self) -> str:
@@ -103,9 +103,9 @@ class User(BaseModel):
         """Check if user has admin role."""
         return self.role == "admin"
     
-    @property
+    @cached_property
     def full_profile(self) -> dict:
-        """Get full user profile information."""
+        """Get full user profile information (cached until a field changes)."""
         return {
             "id": str(self.id),
             "email": self.email,
@@ -119,3 +119,21 @@ class User(BaseModel):
             "created_at": self.created_at.isoformat(),
             "updated_at": self.updated_at.isoformat()
         }
+
+
+# Columns rendered by full_profile; changing any of them drops the cached dict
+_PROFILE_FIELDS = (
+    "id", "email", "display_name", "photo_url", "phone_number", "role",
+    "is_active", "last_login", "login_count", "created_at", "updated_at",
+)
+
+
+def _invalidate_full_profile(target: User, *args) -> None:
+    target.__dict__.pop("full_profile", None)
+
+
+for _event_name in ("refresh", "refresh_flush", "expire"):
+    event.listen(User, _event_name, _invalidate_full_profile)
+
+for _field in _PROFILE_FIELDS:
+    event.listen(getattr(User, _field), "set", _invalidate_full_profile)
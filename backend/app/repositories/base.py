@@ -5,21 +5,43 @@ Provides common database operations with proper separation of concerns.
 All business logic should be in services, not repositories or models.
 """
 
+import operator
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar, Type, Optional, List, Dict, Any
+from datetime import datetime
+from typing import Generic, TypeVar, Type, Optional, List, Dict, Any, Callable, Iterable, Tuple, AsyncIterator
 from uuid import UUID
 
-from sqlalchemy import select, update, delete, func, and_, or_
+import orjson
+from sqlalchemy import Column, select, insert, update, delete, exists, func, and_, or_, inspect, bindparam, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload, joinedload
+from sqlalchemy.orm import selectinload, joinedload, raiseload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.util import identity_key
+from sqlalchemy.types import JSON
 from sqlalchemy.sql import Select
 
+from app.core.config import settings
 from app.models.base import BaseModel
 from app.core.exceptions import NotFoundError, ValidationError
 
 # Generic type for model classes
 ModelType = TypeVar("ModelType", bound=BaseModel)
 
+# Batches of at least this many rows are streamed with COPY by bulk_create
+COPY_THRESHOLD = 500
+
+# Appended to repository queries so any relationship not eager loaded raises
+# on access instead of lazy loading; sql_only lets identity-map hits through
+RAISELOAD_OPTIONS = (raiseload("*", sql_only=True),) if settings.SQLALCHEMY_RAISELOAD else ()
+
+# Statements for the fixed-shape lookups, built once per (model, shape) with
+# bound parameters. Reusing the same Select skips rebuilding it and
+# regenerating its cache key; the SQL comes from the engine's compiled cache.
+_STATEMENT_CACHE: Dict[tuple, Any] = {}
+
+# Suffix on a load_relations segment that requests joinedload, e.g. "collection!joined"
+JOINED_SUFFIX = "!joined"
+
 
 class BaseRepository(Generic[ModelType], ABC):
     """
@@ -29,6 +51,17 @@ class BaseRepository(Generic[ModelType], ABC):
     clean separation between data access and business logic.
     """
 
+    # Advanced filter operators, e.g. {"retail_price": {"gte": 100}}
+    _FILTER_OPS: Dict[str, Callable[[Any, Any], Any]] = {
+        'gte': operator.ge,
+        'lte': operator.le,
+        'gt': operator.gt,
+        'lt': operator.lt,
+        'in': lambda field, value: field.in_(value),
+        'like': lambda field, value: field.like(f"%{value}%"),
+        'ilike': lambda field, value: field.ilike(f"%{value}%"),
+    }
+
     def __init__(self, db: AsyncSession, model: Type[ModelType]):
         """
         Initialize repository with database session and model class.
@@ -39,6 +72,53 @@ class BaseRepository(Generic[ModelType], ABC):
         """
         self.db = db
         self.model = model
+        # Optional BaseModel columns, resolved once instead of per query
+        self._soft_delete_col = getattr(model, 'is_deleted', None)
+        self._created_at_col = getattr(model, 'created_at', None)
+        self._created_by_col = getattr(model, 'created_by', None)
+        self._updated_by_col = getattr(model, 'updated_by', None)
+        # Eagerly loaded column_property expressions; RETURNING only carries
+        # table columns, so writes load these with a follow-up SELECT
+        self._expression_attrs = [
+            prop for prop in inspect(model).column_attrs
+            if not prop.deferred and not isinstance(prop.expression, Column)
+        ]
+        # Request-scoped lookup cache shared by every repository on this
+        # session; it lives in session.info and is dropped with the session
+        self._cache: Dict[tuple, Any] = db.info.setdefault("_repo_cache", {})
+
+    def _cache_get(self, key: tuple) -> Optional[ModelType]:
+        """Return a cached instance unless it was expired since it was cached."""
+        instance = self._cache.get(key)
+        if instance is not None and not inspect(instance).expired_attributes:
+            return instance
+        return None
+
+    def _statement(self, shape: tuple, build: Callable[[], Any]) -> Any:
+        """Return the statement for this model and query shape, building it once."""
+        key = (self.model,) + shape
+        statement = _STATEMENT_CACHE.get(key)
+        if statement is None:
+            statement = _STATEMENT_CACHE[key] = build()
+        return statement
+
+    async def _load_expressions(self, instances: List[ModelType]) -> None:
+        """Load column_property values for rows that came back from RETURNING."""
+        if not self._expression_attrs or not instances:
+            return
+        by_id = {instance.id: instance for instance in instances}
+        query = select(
+            self.model.id, *(getattr(self.model, prop.key) for prop in self._expression_attrs)
+        ).where(self.model.id.in_(by_id))
+        for row in await self.db.execute(query):
+            instance = by_id[row[0]]
+            for prop, value in zip(self._expression_attrs, row[1:]):
+                set_committed_value(instance, prop.key, value)
+
+    def _invalidate_cache(self) -> None:
+        """Drop cached lookups for this repository's model after a write."""
+        for key in [key for key in self._cache if key[1] is self.model]:
+            del self._cache[key]
 
     async def get_by_id(
         self, 
@@ -57,18 +137,77 @@ class BaseRepository(Generic[ModelType], ABC):
         Returns:
             Model instance or None if not found
         """
-        query = select(self.model).where(self.model.id == id)
+        cache_key = ("id", self.model, id, include_deleted, tuple(load_relations or ()))
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
+        # A row this session already loaded (and that hasn't been expired)
+        # is served from the identity map without a round trip
+        if not load_relations:
+            instance = self.db.identity_map.get(identity_key(self.model, id))
+            if instance is not None and not inspect(instance).expired_attributes:
+                if include_deleted or not getattr(instance, 'is_deleted', False):
+                    return instance
+                return None
+        
+        relations = tuple(load_relations or ())
+        
+        def build() -> Select:
+            query = select(self.model).where(self.model.id == bindparam("id"))
+            
+            # Apply soft deletion filter
+            if not include_deleted and self._soft_delete_col is not None:
+                query = query.where(self._soft_delete_col == False)
+            
+            # Apply eager loading
+            return self._apply_eager_loading(query, list(relations))
+        
+        query = self._statement(("get_by_id", include_deleted, relations), build)
+        result = await self.db.execute(query, {"id": id})
+        instance = result.scalar_one_or_none()
+        if instance is not None:
+            self._cache[cache_key] = instance
+        return instance
+
+    async def get_many_by_ids(
+        self,
+        ids: Iterable[UUID],
+        include_deleted: bool = False
+    ) -> Dict[UUID, ModelType]:
+        """
+        Get several records by ID with a single query.
         
-        # Apply soft deletion filter
-        if not include_deleted and hasattr(self.model, 'is_deleted'):
-            query = query.where(self.model.is_deleted == False)
+        Rows already loaded in this session are taken from the identity map;
+        the rest are fetched with one SELECT ... WHERE id IN (...).
         
-        # Apply eager loading
-        if load_relations:
-            query = self._apply_eager_loading(query, load_relations)
+        Args:
+            ids: Record UUIDs
+            include_deleted: Whether to include soft-deleted records
+            
+        Returns:
+            Dictionary mapping ID to model instance; missing IDs are absent
+        """
+        found: Dict[UUID, ModelType] = {}
+        missing = []
+        for id in set(ids):
+            instance = self.db.identity_map.get(identity_key(self.model, id))
+            if instance is not None and not inspect(instance).expired_attributes:
+                if include_deleted or not getattr(instance, 'is_deleted', False):
+                    found[id] = instance
+            else:
+                missing.append(id)
+        
+        if missing:
+            query = select(self.model).where(self.model.id.in_(missing))
+            if not include_deleted and self._soft_delete_col is not None:
+                query = query.where(self._soft_delete_col == False)
+            query = self._apply_eager_loading(query, [])
+            
+            result = await self.db.execute(query)
+            found.update((instance.id, instance) for instance in result.scalars())
         
-        result = await self.db.execute(query)
-        return result.scalar_one_or_none()
+        return found
 
     async def get_by_field(
         self,
@@ -89,16 +228,19 @@ class BaseRepository(Generic[ModelType], ABC):
         Returns:
             Model instance or None if not found
         """
-        field = getattr(self.model, field_name)
-        query = select(self.model).where(field == field_value)
+        relations = tuple(load_relations or ())
         
-        if not include_deleted and hasattr(self.model, 'is_deleted'):
-            query = query.where(self.model.is_deleted == False)
+        def build() -> Select:
+            field = getattr(self.model, field_name)
+            query = select(self.model).where(field == bindparam("value"))
+            
+            if not include_deleted and self._soft_delete_col is not None:
+                query = query.where(self._soft_delete_col == False)
             
-        if load_relations:
-            query = self._apply_eager_loading(query, load_relations)
+            return self._apply_eager_loading(query, list(relations))
         
-        result = await self.db.execute(query)
+        query = self._statement(("get_by_field", field_name, include_deleted, relations), build)
+        result = await self.db.execute(query, {"value": field_value})
         return result.scalar_one_or_none()
 
     async def get_all(
@@ -108,11 +250,16 @@ class BaseRepository(Generic[ModelType], ABC):
         include_deleted: bool = False,
         load_relations: Optional[List[str]] = None,
         order_by: Optional[str] = None,
-        filters: Optional[Dict[str, Any]] = None
+        filters: Optional[Dict[str, Any]] = None,
+        after: Optional[Tuple[datetime, UUID]] = None
     ) -> List[ModelType]:
         """
         Get multiple records with pagination and filtering.
         
+        When after is given, pages by keyset instead of offset: rows are
+        ordered by (created_at, id) descending and start right after that
+        position, so skip and order_by are ignored.
+        
         Args:
             skip: Number of records to skip
             limit: Maximum number of records to return
@@ -120,6 +267,7 @@ class BaseRepository(Generic[ModelType], ABC):
             load_relations: List of relationships to eager load
             order_by: Field name to order by (prefix with '-' for desc)
             filters: Dictionary of field filters
+            after: (created_at, id) of the last row of the previous page
             
         Returns:
             List of model instances
@@ -127,34 +275,83 @@ class BaseRepository(Generic[ModelType], ABC):
         query = select(self.model)
         
         # Apply soft deletion filter
-        if not include_deleted and hasattr(self.model, 'is_deleted'):
-            query = query.where(self.model.is_deleted == False)
+        if not include_deleted and self._soft_delete_col is not None:
+            query = query.where(self._soft_delete_col == False)
         
         # Apply custom filters
         if filters:
             query = self._apply_filters(query, filters)
         
-        # Apply ordering
-        if order_by:
-            query = self._apply_ordering(query, order_by)
+        if after is not None:
+            if self._created_at_col is None:
+                raise ValidationError("Model does not support cursor pagination")
+            query = self._page_newest_first(query, skip, limit, after)
         else:
-            # Default ordering by created_at desc
-            if hasattr(self.model, 'created_at'):
-                query = query.order_by(self.model.created_at.desc())
-        
-        # Apply pagination
-        query = query.offset(skip).limit(limit)
+            # Apply ordering
+            if order_by:
+                query = self._apply_ordering(query, order_by)
+            else:
+                # Default ordering by created_at desc, id breaking ties so
+                # the first page lines up with cursor pages
+                if self._created_at_col is not None:
+                    query = query.order_by(self._created_at_col.desc(), self.model.id.desc())
+            
+            # Apply pagination
+            query = query.offset(skip).limit(limit)
         
         # Apply eager loading
-        if load_relations:
-            query = self._apply_eager_loading(query, load_relations)
+        query = self._apply_eager_loading(query, load_relations or [])
         
         result = await self.db.execute(query)
-        # Use unique() when eager loading to handle JOINs properly
-        if load_relations:
+        # Only explicitly joined-loaded relations can duplicate parent rows
+        if load_relations and any(JOINED_SUFFIX in relation for relation in load_relations):
             return result.scalars().unique().all()
-        else:
-            return result.scalars().all()
+        return result.scalars().all()
+
+    async def iter_all(
+        self,
+        include_deleted: bool = False,
+        order_by: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        batch_size: int = 500
+    ) -> AsyncIterator[ModelType]:
+        """
+        Stream matching records without loading the whole result set.
+        
+        Rows are read from a server-side cursor in batches of batch_size,
+        for exports and backfills where get_all's pages would be too small
+        or the full list too large to hold in memory.
+        
+        Args:
+            include_deleted: Whether to include soft-deleted records
+            order_by: Field name to order by (prefix with '-' for desc)
+            filters: Dictionary of field filters
+            batch_size: Rows fetched per round trip
+            
+        Yields:
+            Model instances
+        """
+        query = select(self.model)
+        
+        if not include_deleted and self._soft_delete_col is not None:
+            query = query.where(self._soft_delete_col == False)
+        
+        if filters:
+            query = self._apply_filters(query, filters)
+        
+        if order_by:
+            query = self._apply_ordering(query, order_by)
+        
+        query = self._apply_eager_loading(query, [])
+        
+        result = await self.db.stream_scalars(
+            query, execution_options={"yield_per": batch_size}
+        )
+        try:
+            async for instance in result:
+                yield instance
+        finally:
+            await result.close()
 
     async def count(
         self,
@@ -171,10 +368,13 @@ class BaseRepository(Generic[ModelType], ABC):
         Returns:
             Number of matching records
         """
-        query = select(func.count(self.model.id))
+        def build() -> Select:
+            query = select(func.count(self.model.id))
+            if not include_deleted and self._soft_delete_col is not None:
+                query = query.where(self._soft_delete_col == False)
+            return query
         
-        if not include_deleted and hasattr(self.model, 'is_deleted'):
-            query = query.where(self.model.is_deleted == False)
+        query = self._statement(("count", include_deleted), build)
         
         if filters:
             query = self._apply_filters(query, filters)
@@ -186,6 +386,11 @@ class BaseRepository(Generic[ModelType], ABC):
         """
         Create a new record.
         
+        The row is written with INSERT ... RETURNING, so server-generated
+        column values (created_at) arrive with the insert instead of through
+        a flush followed by a refresh SELECT. Column properties are not
+        table columns and are loaded by a SELECT of just those expressions.
+        
         Args:
             data: Dictionary of field values
             user_id: ID of user creating the record
@@ -194,14 +399,14 @@ class BaseRepository(Generic[ModelType], ABC):
             Created model instance
         """
         # Add audit fields if they exist
-        if hasattr(self.model, 'created_by') and user_id:
+        if self._created_by_col is not None and user_id:
             data['created_by'] = user_id
         
-        instance = self.model(**data)
-        self.db.add(instance)
-        await self.db.flush()  # Get the ID without committing
-        await self.db.refresh(instance)  # Refresh to get all computed fields
-        
+        query = insert(self.model).values(**data).returning(self.model)
+        result = await self.db.execute(query, execution_options={"populate_existing": True})
+        self._invalidate_cache()
+        instance = result.scalar_one()
+        await self._load_expressions([instance])
         return instance
 
     async def update(
@@ -222,26 +427,27 @@ class BaseRepository(Generic[ModelType], ABC):
             Updated model instance or None if not found
         """
         # Add audit fields if they exist
-        if hasattr(self.model, 'updated_by') and user_id:
+        if self._updated_by_col is not None and user_id:
             data['updated_by'] = user_id
         
         query = (
             update(self.model)
             .where(self.model.id == id)
             .values(**data)
-            .returning(self.model.id)
+            .returning(self.model)
         )
         
         # Apply soft deletion filter
-        if hasattr(self.model, 'is_deleted'):
-            query = query.where(self.model.is_deleted == False)
-        
-        result = await self.db.execute(query)
-        updated_id = result.scalar_one_or_none()
-        
-        if updated_id:
-            return await self.get_by_id(updated_id)
-        return None
+        if self._soft_delete_col is not None:
+            query = query.where(self._soft_delete_col == False)
+        
+        # RETURNING hydrates the instance; overwrite any stale copy in the session
+        result = await self.db.execute(query, execution_options={"populate_existing": True})
+        self._invalidate_cache()
+        instance = result.scalar_one_or_none()
+        if instance is not None:
+            await self._load_expressions([instance])
+        return instance
 
     async def delete(self, id: UUID, user_id: Optional[UUID] = None, soft: bool = True) -> bool:
         """
@@ -255,14 +461,13 @@ class BaseRepository(Generic[ModelType], ABC):
         Returns:
             True if record was deleted, False if not found
         """
-        if soft and hasattr(self.model, 'is_deleted'):
-            # Soft delete
-            from datetime import datetime
+        if soft and self._soft_delete_col is not None:
+            # Soft delete, stamped with the database clock like updated_at
             update_data = {
                 'is_deleted': True,
-                'deleted_at': datetime.utcnow()
+                'deleted_at': func.now()
             }
-            if hasattr(self.model, 'updated_by') and user_id:
+            if self._updated_by_col is not None and user_id:
                 update_data['updated_by'] = user_id
             
             result = await self.update(id, update_data, user_id)
@@ -271,6 +476,7 @@ class BaseRepository(Generic[ModelType], ABC):
             # Hard delete
             query = delete(self.model).where(self.model.id == id)
             result = await self.db.execute(query)
+            self._invalidate_cache()
             return result.rowcount > 0
 
     async def restore(self, id: UUID, user_id: Optional[UUID] = None) -> Optional[ModelType]:
@@ -284,29 +490,29 @@ class BaseRepository(Generic[ModelType], ABC):
         Returns:
             Restored model instance or None if not found
         """
-        if not hasattr(self.model, 'is_deleted'):
+        if self._soft_delete_col is None:
             raise ValidationError("Model does not support soft deletion")
         
         update_data = {
             'is_deleted': False,
             'deleted_at': None
         }
-        if hasattr(self.model, 'updated_by') and user_id:
+        if self._updated_by_col is not None and user_id:
             update_data['updated_by'] = user_id
         
         query = (
             update(self.model)
-            .where(and_(self.model.id == id, self.model.is_deleted == True))
+            .where(and_(self.model.id == id, self._soft_delete_col == True))
             .values(**update_data)
-            .returning(self.model.id)
+            .returning(self.model)
         )
         
-        result = await self.db.execute(query)
-        restored_id = result.scalar_one_or_none()
-        
-        if restored_id:
-            return await self.get_by_id(restored_id)
-        return None
+        result = await self.db.execute(query, execution_options={"populate_existing": True})
+        self._invalidate_cache()
+        instance = result.scalar_one_or_none()
+        if instance is not None:
+            await self._load_expressions([instance])
+        return instance
 
     async def exists(
         self, 
@@ -323,14 +529,14 @@ class BaseRepository(Generic[ModelType], ABC):
         Returns:
             True if record exists, False otherwise
         """
-        query = select(func.count(self.model.id)).where(self.model.id == id)
-        
-        if not include_deleted and hasattr(self.model, 'is_deleted'):
-            query = query.where(self.model.is_deleted == False)
-        
-        result = await self.db.execute(query)
-        count = result.scalar()
-        return count > 0
+        def build() -> Select:
+            conditions = [self.model.id == bindparam("id")]
+            if not include_deleted and self._soft_delete_col is not None:
+                conditions.append(self._soft_delete_col == False)
+            return select(exists().where(and_(*conditions)))
+        
+        query = self._statement(("exists", include_deleted), build)
+        return await self.db.scalar(query, {"id": id})
 
     async def bulk_create(
         self, 
@@ -340,29 +546,80 @@ class BaseRepository(Generic[ModelType], ABC):
         """
         Create multiple records in bulk.
         
+        Rows are inserted with one batched INSERT ... RETURNING, so
+        server-generated values come back without a refresh per row.
+        
         Args:
-            data_list: List of dictionaries with field values
+            data_list: List of dictionaries with column values
             user_id: ID of user creating the records
             
         Returns:
-            List of created model instances
+            List of created model instances, in input order
         """
-        instances = []
+        if not data_list:
+            return []
         
-        for data in data_list:
-            if hasattr(self.model, 'created_by') and user_id:
+        if self._created_by_col is not None and user_id:
+            for data in data_list:
                 data['created_by'] = user_id
-            
-            instance = self.model(**data)
-            instances.append(instance)
         
-        self.db.add_all(instances)
-        await self.db.flush()
+        self._invalidate_cache()
+        if len(data_list) >= COPY_THRESHOLD:
+            ids = await self._copy_rows(data_list)
+            result = await self.db.execute(select(self.model).where(self.model.id.in_(ids)))
+            by_id = {instance.id: instance for instance in result.scalars()}
+            return [by_id[id] for id in ids]
+        
+        stmt = insert(self.model).returning(self.model, sort_by_parameter_order=True)
+        result = await self.db.execute(stmt, data_list)
+        instances = result.scalars().all()
+        await self._load_expressions(instances)
+        return instances
+
+    async def _copy_rows(self, data_list: List[Dict[str, Any]]) -> List[UUID]:
+        """
+        Stream rows into the model's table with COPY.
         
-        for instance in instances:
-            await self.db.refresh(instance)
+        Python-side column defaults (including the primary key) are applied
+        here since COPY bypasses the ORM; columns that only have a server
+        default, and generated columns, are left to the database.
         
-        return instances
+        Args:
+            data_list: List of dictionaries with column values
+            
+        Returns:
+            IDs of the copied rows, in input order
+        """
+        columns = [
+            column for column in self.model.__table__.columns
+            if column.computed is None
+            and (column.default is not None or any(column.key in data for data in data_list))
+        ]
+        
+        def value(column, data):
+            if column.key in data:
+                raw = data[column.key]
+            elif column.default.is_callable:
+                raw = column.default.arg(None)
+            else:
+                raw = column.default.arg
+            # asyncpg's binary COPY takes json/jsonb as text
+            if raw is not None and isinstance(column.type, JSON):
+                return orjson.dumps(raw, option=orjson.OPT_NON_STR_KEYS).decode()
+            return raw
+        
+        records = [tuple(value(column, data) for column in columns) for data in data_list]
+        
+        connection = await self.db.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            self.model.__tablename__,
+            records=records,
+            columns=[column.name for column in columns],
+        )
+        
+        id_index = columns.index(self.model.__table__.c.id)
+        return [record[id_index] for record in records]
 
     def _apply_filters(self, query: Select, filters: Dict[str, Any]) -> Select:
         """
@@ -374,29 +631,21 @@ class BaseRepository(Generic[ModelType], ABC):
             
         Returns:
             Updated query with filters applied
+            
+        Raises:
+            ValidationError: If an advanced filter uses an unknown operator
         """
         for field_name, field_value in filters.items():
-            if hasattr(self.model, field_name):
-                field = getattr(self.model, field_name)
-                
+            field = getattr(self.model, field_name, None)
+            if field is not None:
                 # Handle different filter types
                 if isinstance(field_value, dict):
                     # Advanced filters like {"gte": 100}, {"in": [1,2,3]}
                     for op, value in field_value.items():
-                        if op == 'gte':
-                            query = query.where(field >= value)
-                        elif op == 'lte':
-                            query = query.where(field <= value)
-                        elif op == 'gt':
-                            query = query.where(field > value)
-                        elif op == 'lt':
-                            query = query.where(field < value)
-                        elif op == 'in':
-                            query = query.where(field.in_(value))
-                        elif op == 'like':
-                            query = query.where(field.like(f"%{value}%"))
-                        elif op == 'ilike':
-                            query = query.where(field.ilike(f"%{value}%"))
+                        apply_op = self._FILTER_OPS.get(op)
+                        if apply_op is None:
+                            raise ValidationError(f"Unsupported filter operator '{op}' for field '{field_name}'")
+                        query = query.where(apply_op(field, value))
                 elif isinstance(field_value, list):
                     # List means "in" filter
                     query = query.where(field.in_(field_value))
@@ -406,6 +655,36 @@ class BaseRepository(Generic[ModelType], ABC):
         
         return query
 
+    def _page_newest_first(
+        self,
+        query: Select,
+        skip: int,
+        limit: int,
+        after: Optional[Tuple[datetime, UUID]]
+    ) -> Select:
+        """
+        Order by (created_at, id) descending and take one page.
+        
+        With after set the page starts right past that row: the row
+        comparison is an index range scan, so deep pages cost the same as
+        the first. Without it the page is taken by offset.
+        
+        Args:
+            query: SQLAlchemy select query
+            skip: Number of records to skip (offset pages only)
+            limit: Maximum number of records to return
+            after: (created_at, id) of the last row of the previous page
+            
+        Returns:
+            Ordered and paginated query
+        """
+        query = query.order_by(self._created_at_col.desc(), self.model.id.desc())
+        if after is not None:
+            query = query.where(tuple_(self._created_at_col, self.model.id) < tuple_(*after))
+        else:
+            query = query.offset(skip)
+        return query.limit(limit)
+
     def _apply_ordering(self, query: Select, order_by: str) -> Select:
         """
         Apply ordering to query.
@@ -437,23 +716,38 @@ class BaseRepository(Generic[ModelType], ABC):
         load_relations: List[str]
     ) -> Select:
         """
-        Apply eager loading to query.
+        Apply eager loading to query, plus the raiseload safety net when
+        SQLALCHEMY_RAISELOAD is enabled.
         
         Args:
             query: SQLAlchemy select query
-            load_relations: List of relationships to eager load
+            load_relations: List of relationships to eager load; nested
+                relationships use dotted paths (e.g. "products.variants").
+                Relationships load with selectinload unless a segment ends
+                with "!joined" (e.g. "collection!joined").
             
         Returns:
             Updated query with eager loading applied
         """
         for relation in load_relations:
-            if hasattr(self.model, relation):
-                relationship_attr = getattr(self.model, relation)
+            loader = None
+            model = self.model
+            
+            for segment in relation.split('.'):
+                name = segment.removesuffix(JOINED_SUFFIX)
+                if not hasattr(model, name):
+                    loader = None
+                    break
+                relationship_attr = getattr(model, name)
                 
-                # Use selectinload for collections, joinedload for single relations
-                if hasattr(relationship_attr.property, 'collection') and relationship_attr.property.collection:
-                    query = query.options(selectinload(relationship_attr))
+                # selectinload avoids multiplying parent rows; JOINs are opt-in
+                if segment.endswith(JOINED_SUFFIX):
+                    loader = loader.joinedload(relationship_attr) if loader else joinedload(relationship_attr)
                 else:
-                    query = query.options(joinedload(relationship_attr))
+                    loader = loader.selectinload(relationship_attr) if loader else selectinload(relationship_attr)
+                model = relationship_attr.property.mapper.class_
+            
+            if loader is not None:
+                query = query.options(loader)
         
-        return query
\ No newline at end of file
+        return query.options(*RAISELOAD_OPTIONS)
\ No newline at end of file
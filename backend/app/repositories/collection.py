@@ -5,16 +5,37 @@ Data access layer for Collection entity.
 Pure data access operations without business logic.
 """
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
-from sqlalchemy import select, and_, or_
+from sqlalchemy import select, and_, or_, exists, func, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.collection import Collection
 from app.models.product.product import Product
 from app.models.product.variant import ProductVariant
-from app.repositories.base import BaseRepository
+from app.repositories.base import BaseRepository, RAISELOAD_OPTIONS
+from app.repositories.product.repository import SUMMARY_COLUMN_OPTIONS
+
+# Listing order for collections: newest year first, then by name
+_LISTING_ORDER = (Collection.year.desc(), Collection.name, Collection.id)
+
+
+def _seek_after(query, after: Optional[Tuple[int, str, UUID]]):
+    """
+    Apply listing order and, for keyset pages, start after the given row.
+    
+    Year descends while name and id ascend, so the seek is spelled out
+    rather than written as a single row comparison.
+    """
+    if after is not None:
+        year, name, id = after
+        query = query.where(or_(
+            Collection.year < year,
+            and_(Collection.year == year, tuple_(Collection.name, Collection.id) > tuple_(name, id))
+        ))
+    return query.order_by(*_LISTING_ORDER)
 
 
 class CollectionRepository(BaseRepository[Collection]):
@@ -41,9 +62,14 @@ class CollectionRepository(BaseRepository[Collection]):
         query = (
             select(Collection)
             .options(
-                selectinload(Collection.products)
-                .selectinload(Product.variants)
-                .selectinload(ProductVariant.images)
+                selectinload(Collection.products).options(
+                    *SUMMARY_COLUMN_OPTIONS,
+                    selectinload(Product.variants)
+                    # Few images per variant: JOIN them onto the variants query
+                    # instead of spending a fourth round trip
+                    .joinedload(ProductVariant.images)
+                ),
+                *RAISELOAD_OPTIONS
             )
             .where(and_(Collection.id == collection_id, Collection.is_deleted == False))
         )
@@ -51,17 +77,30 @@ class CollectionRepository(BaseRepository[Collection]):
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
 
-    async def get_by_slug(self, slug: str) -> Optional[Collection]:
+    async def get_by_slug(
+        self,
+        slug: str,
+        load_relations: Optional[List[str]] = None
+    ) -> Optional[Collection]:
         """
         Get collection by URL slug.
         
         Args:
             slug: Collection slug
+            load_relations: List of relationships to eager load
             
         Returns:
             Collection or None if not found
         """
-        return await self.get_by_field("slug", slug)
+        cache_key = ("slug", Collection, slug, tuple(load_relations or ()))
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
+        collection = await self.get_by_field("slug", slug, load_relations=load_relations)
+        if collection is not None:
+            self._cache[cache_key] = collection
+        return collection
 
     async def get_published_collections(
         self,
@@ -69,24 +108,26 @@ class CollectionRepository(BaseRepository[Collection]):
         limit: int = 20,
         season: Optional[str] = None,
         year: Optional[int] = None,
-        published_only: bool = True
+        published_only: bool = True,
+        after: Optional[Tuple[int, str, UUID]] = None
     ) -> List[Collection]:
         """
         Get published collections with optional filtering.
         
         Args:
-            skip: Number of records to skip
+            skip: Number of records to skip (ignored when after is given)
             limit: Maximum records to return
             season: Optional season filter
             year: Optional year filter
             published_only: Whether to only return published collections
+            after: (year, name, id) of the last row of the previous page
             
         Returns:
             List of published collections
         """
         query = (
             select(Collection)
-            .options(selectinload(Collection.products))
+            .options(*RAISELOAD_OPTIONS)
             .where(Collection.is_deleted == False)
         )
         
@@ -100,16 +141,60 @@ class CollectionRepository(BaseRepository[Collection]):
         if published_only:
             query = query.where(Collection.is_published == True)
         
-        query = query.order_by(Collection.year.desc(), Collection.name)
-        query = query.offset(skip).limit(limit)
+        query = _seek_after(query, after)
+        if after is None:
+            query = query.offset(skip)
+        query = query.limit(limit)
         
         result = await self.db.execute(query)
         return result.scalars().all()
 
+    async def create_unless_slug_taken(
+        self,
+        data: Dict[str, Any],
+        user_id: Optional[str] = None  # Firebase UID
+    ) -> Optional[Collection]:
+        """
+        Insert a collection unless a live collection already has its slug.
+        
+        The uniqueness check happens inside the INSERT (ON CONFLICT against
+        idx_collection_live_slug), so there is no window between checking
+        and inserting, and the row comes back in the same round trip.
+        
+        Args:
+            data: Column values, including slug
+            user_id: ID of user creating the collection
+            
+        Returns:
+            Created collection, or None if the slug is taken
+        """
+        if user_id:
+            data['created_by'] = user_id
+        
+        stmt = (
+            pg_insert(Collection)
+            .values(**data)
+            .on_conflict_do_nothing(
+                index_elements=[Collection.slug],
+                index_where=Collection.is_deleted == False
+            )
+            .returning(Collection)
+        )
+        result = await self.db.execute(stmt, execution_options={"populate_existing": True})
+        self._invalidate_cache()
+        collection = result.scalar_one_or_none()
+        if collection is not None:
+            # product_count isn't a table column, so RETURNING leaves it unloaded
+            await self._load_expressions([collection])
+        return collection
+
     async def check_slug_exists(self, slug: str, exclude_id: Optional[UUID] = None) -> bool:
         """
         Check if slug already exists.
         
+        Creation relies on create_unless_slug_taken instead; this serves
+        slug generation and update checks.
+        
         Args:
             slug: Slug to check
             exclude_id: Collection ID to exclude from check (for updates)
@@ -117,16 +202,11 @@ class CollectionRepository(BaseRepository[Collection]):
         Returns:
             True if slug exists, False otherwise
         """
-        query = select(Collection).where(and_(
-            Collection.slug == slug,
-            Collection.is_deleted == False
-        ))
-        
+        conditions = [Collection.slug == slug, Collection.is_deleted == False]
         if exclude_id:
-            query = query.where(Collection.id != exclude_id)
+            conditions.append(Collection.id != exclude_id)
         
-        result = await self.db.execute(query)
-        return result.scalar_one_or_none() is not None
+        return await self.db.scalar(select(exists().where(and_(*conditions))))
 
     async def get_featured_collections(self, limit: int = 6) -> List[Collection]:
         """
@@ -138,21 +218,28 @@ class CollectionRepository(BaseRepository[Collection]):
         Returns:
             List of collections with featured products
         """
-        from app.models.product import Product
+        # EXISTS stops at the first featured product per collection,
+        # where JOIN + DISTINCT had to dedupe the whole joined rowset
+        has_featured = (
+            select(Product.id)
+            .where(and_(
+                Product.collection_id == Collection.id,
+                Product.is_featured == True,
+                Product.status == "active",
+                Product.is_deleted == False
+            ))
+            .exists()
+        )
         
         query = (
             select(Collection)
-            .options(selectinload(Collection.products))
-            .join(Product, Collection.id == Product.collection_id)
+            .options(*RAISELOAD_OPTIONS)
             .where(and_(
                 Collection.is_published == True,
                 Collection.is_deleted == False,
-                Product.is_featured == True,
-                Product.status == "active",
-                Product.is_deleted == False
+                has_featured
             ))
-            .distinct()
-            .order_by(Collection.year.desc(), Collection.name)
+            .order_by(*_LISTING_ORDER)
             .limit(limit)
         )
         
@@ -175,22 +262,22 @@ class CollectionRepository(BaseRepository[Collection]):
         Returns:
             List of dictionaries with collection data and stats
         """
-        from sqlalchemy import func
-        
-        query = (
-            select(
-                Collection,
-                func.count(Product.id).label('product_count'),
-                func.count(
-                    case((Product.status == 'active', Product.id), else_=None)
-                ).label('active_product_count')
-            )
-            .outerjoin(Product, and_(
-                Collection.id == Product.collection_id,
+        # Collection.product_count is already a correlated count on the row
+        active_product_count = (
+            select(func.count(Product.id))
+            .where(and_(
+                Product.collection_id == Collection.id,
+                Product.status == 'active',
                 Product.is_deleted == False
             ))
+            .correlate(Collection)
+            .scalar_subquery()
+            .label('active_product_count')
+        )
+        
+        query = (
+            select(Collection, active_product_count)
             .where(Collection.is_deleted == False)
-            .group_by(Collection.id)
             .order_by(Collection.year.desc(), Collection.name)
             .offset(skip)
             .limit(limit)
@@ -199,15 +286,11 @@ class CollectionRepository(BaseRepository[Collection]):
         result = await self.db.execute(query)
         
         collections_with_stats = []
-        for row in result:
-            collection = row[0]
-            product_count = row[1]
-            active_product_count = row[2]
-            
+        for collection, active_count in result:
             collections_with_stats.append({
                 'collection': collection,
-                'product_count': product_count,
-                'active_product_count': active_product_count
+                'product_count': collection.product_count,
+                'active_product_count': active_count
             })
         
         return collections_with_stats
@@ -217,7 +300,8 @@ class CollectionRepository(BaseRepository[Collection]):
         search_term: str,
         published_only: bool = True,
         skip: int = 0,
-        limit: int = 20
+        limit: int = 20,
+        after: Optional[Tuple[int, str, UUID]] = None
     ) -> List[Collection]:
         """
         Search collections by name or description.
@@ -225,17 +309,19 @@ class CollectionRepository(BaseRepository[Collection]):
         Args:
             search_term: Text to search for
             published_only: Whether to only return published collections
-            skip: Number of records to skip
+            skip: Number of records to skip (ignored when after is given)
             limit: Maximum records to return
+            after: (year, name, id) of the last row of the previous page
             
         Returns:
             List of matching collections
         """
+        # Substring match; served by the name/description trigram indexes
         search_pattern = f"%{search_term}%"
         
         query = (
             select(Collection)
-            .options(selectinload(Collection.products))
+            .options(*RAISELOAD_OPTIONS)
             .where(and_(
                 Collection.is_deleted == False,
                 or_(
@@ -248,10 +334,10 @@ class CollectionRepository(BaseRepository[Collection]):
         if published_only:
             query = query.where(Collection.is_published == True)
         
-        query = (query
-                .order_by(Collection.year.desc(), Collection.name)
-                .offset(skip)
-                .limit(limit))
+        query = _seek_after(query, after)
+        if after is None:
+            query = query.offset(skip)
+        query = query.limit(limit)
         
         result = await self.db.execute(query)
         return result.scalars().all()
@@ -275,7 +361,7 @@ class CollectionRepository(BaseRepository[Collection]):
         """
         query = (
             select(Collection)
-            .options(selectinload(Collection.products))
+            .options(*RAISELOAD_OPTIONS)
             .where(and_(
                 Collection.season == season,
                 Collection.year == year,
@@ -5,15 +5,39 @@ Data access layer for File entity.
 Handles file metadata and storage references.
 """
 
-from typing import List, Optional, Dict, Any
+import logging
+import time
+from datetime import datetime, timezone
+from typing import List, Optional, Dict, Any, Tuple
 from uuid import UUID
-from sqlalchemy import select, and_, or_, func, desc
-from sqlalchemy.orm import selectinload
+
+import orjson
+from redis.exceptions import RedisError
+from sqlalchemy import select, update, and_, or_, func, desc, values, column, Integer, DateTime, event
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Session, SessionTransaction, selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.util import await_only
 
+from app.core.redis import get_redis
 from app.models.file import File
 from app.repositories.base import BaseRepository
 
+logger = logging.getLogger(__name__)
+
+# Storage statistics change slowly; dashboards read them from Redis and
+# writes that add or remove files drop the entry once they commit
+STORAGE_STATS_CACHE_KEY = "file:stats:global"
+STORAGE_STATS_TTL_SECONDS = 60
+
+# Session.info flag marking a transaction whose commit must drop the entry
+STORAGE_STATS_STALE_FLAG = "file_storage_stats_stale"
+
+# Downloads are counted in Redis hashes keyed by file ID (pending increments
+# and last access epoch seconds) and written back in batches
+DOWNLOAD_COUNTS_KEY = "file:dl:pending"
+DOWNLOAD_ACCESS_KEY = "file:dl:last_access"
+
 
 class FileRepository(BaseRepository[File]):
     """
@@ -24,6 +48,36 @@ class FileRepository(BaseRepository[File]):
         """Initialize with File model."""
         super().__init__(db, File)
 
+    async def create(self, data: Dict[str, Any], user_id: Optional[str] = None) -> File:
+        """Create a file record and drop the cached storage statistics."""
+        file_record = await super().create(data, user_id)
+        self._invalidate_storage_statistics()
+        return file_record
+
+    async def bulk_create(
+        self,
+        data_list: List[Dict[str, Any]],
+        user_id: Optional[UUID] = None
+    ) -> List[File]:
+        """Create file records in bulk and drop the cached storage statistics."""
+        file_records = await super().bulk_create(data_list, user_id)
+        self._invalidate_storage_statistics()
+        return file_records
+
+    async def delete(self, id: UUID, user_id: Optional[UUID] = None, soft: bool = True) -> bool:
+        """Delete a file record and drop the cached storage statistics."""
+        deleted = await super().delete(id, user_id, soft)
+        if deleted:
+            self._invalidate_storage_statistics()
+        return deleted
+
+    async def restore(self, id: UUID, user_id: Optional[UUID] = None) -> Optional[File]:
+        """Restore a file record and drop the cached storage statistics."""
+        file_record = await super().restore(id, user_id)
+        if file_record is not None:
+            self._invalidate_storage_statistics()
+        return file_record
+
     async def get_by_filename(self, filename: str) -> Optional[File]:
         """
         Get file by filename.
@@ -36,12 +90,12 @@ class FileRepository(BaseRepository[File]):
         """
         return await self.get_by_field("filename", filename)
 
-    async def get_by_hash(self, hash_value: str, hash_type: str = "md5") -> Optional[File]:
+    async def get_by_hash(self, hash_value: bytes, hash_type: str = "md5") -> Optional[File]:
         """
         Get file by hash value.
         
         Args:
-            hash_value: Hash value
+            hash_value: Raw digest bytes
             hash_type: Hash type (md5 or sha256)
             
         Returns:
@@ -54,15 +108,17 @@ class FileRepository(BaseRepository[File]):
         self,
         collection_id: UUID,
         skip: int = 0,
-        limit: int = 50
+        limit: int = 50,
+        after: Optional[Tuple[datetime, UUID]] = None
     ) -> List[File]:
         """
         Get files associated with a collection.
         
         Args:
             collection_id: Collection UUID
-            skip: Number of records to skip
+            skip: Number of records to skip (ignored when after is given)
             limit: Maximum records to return
+            after: (created_at, id) of the last file of the previous page
             
         Returns:
             List of files for the collection
@@ -73,10 +129,8 @@ class FileRepository(BaseRepository[File]):
                 File.collection_id == collection_id,
                 File.is_deleted == False
             ))
-            .order_by(File.created_at.desc())
-            .offset(skip)
-            .limit(limit)
         )
+        query = self._page_newest_first(query, skip, limit, after)
         
         result = await self.db.execute(query)
         return result.scalars().all()
@@ -85,15 +139,17 @@ class FileRepository(BaseRepository[File]):
         self,
         product_id: UUID,
         skip: int = 0,
-        limit: int = 50
+        limit: int = 50,
+        after: Optional[Tuple[datetime, UUID]] = None
     ) -> List[File]:
         """
         Get files associated with a product.
         
         Args:
             product_id: Product UUID
-            skip: Number of records to skip
+            skip: Number of records to skip (ignored when after is given)
             limit: Maximum records to return
+            after: (created_at, id) of the last file of the previous page
             
         Returns:
             List of files for the product
@@ -104,10 +160,8 @@ class FileRepository(BaseRepository[File]):
                 File.product_id == product_id,
                 File.is_deleted == False
             ))
-            .order_by(File.created_at.desc())
-            .offset(skip)
-            .limit(limit)
         )
+        query = self._page_newest_first(query, skip, limit, after)
         
         result = await self.db.execute(query)
         return result.scalars().all()
@@ -116,15 +170,17 @@ class FileRepository(BaseRepository[File]):
         self,
         content_type: str,
         skip: int = 0,
-        limit: int = 50
+        limit: int = 50,
+        after: Optional[Tuple[datetime, UUID]] = None
     ) -> List[File]:
         """
         Get files by content type.
         
         Args:
             content_type: MIME content type
-            skip: Number of records to skip
+            skip: Number of records to skip (ignored when after is given)
             limit: Maximum records to return
+            after: (created_at, id) of the last file of the previous page
             
         Returns:
             List of files with matching content type
@@ -135,10 +191,8 @@ class FileRepository(BaseRepository[File]):
                 File.content_type.startswith(content_type),
                 File.is_deleted == False
             ))
-            .order_by(File.created_at.desc())
-            .offset(skip)
-            .limit(limit)
         )
+        query = self._page_newest_first(query, skip, limit, after)
         
         result = await self.db.execute(query)
         return result.scalars().all()
@@ -148,7 +202,8 @@ class FileRepository(BaseRepository[File]):
         search_term: str,
         content_type_filter: Optional[str] = None,
         skip: int = 0,
-        limit: int = 50
+        limit: int = 50,
+        after: Optional[Tuple[datetime, UUID]] = None
     ) -> List[File]:
         """
         Search files by filename or description.
@@ -156,8 +211,9 @@ class FileRepository(BaseRepository[File]):
         Args:
             search_term: Text to search for
             content_type_filter: Optional content type filter
-            skip: Number of records to skip
+            skip: Number of records to skip (ignored when after is given)
             limit: Maximum records to return
+            after: (created_at, id) of the last file of the previous page
             
         Returns:
             List of matching files
@@ -179,7 +235,7 @@ class FileRepository(BaseRepository[File]):
         if content_type_filter:
             query = query.where(File.content_type.startswith(content_type_filter))
         
-        query = query.order_by(File.created_at.desc()).offset(skip).limit(limit)
+        query = self._page_newest_first(query, skip, limit, after)
         
         result = await self.db.execute(query)
         return result.scalars().all()
@@ -188,15 +244,17 @@ class FileRepository(BaseRepository[File]):
         self,
         filters: Dict[str, Any],
         skip: int = 0,
-        limit: int = 50
+        limit: int = 50,
+        after: Optional[Tuple[datetime, UUID]] = None
     ) -> List[File]:
         """
         Get files with advanced filtering.
         
         Args:
             filters: Dictionary of filters to apply
-            skip: Number of records to skip
+            skip: Number of records to skip (ignored when after is given)
             limit: Maximum records to return
+            after: (created_at, id) of the last file of the previous page
             
         Returns:
             List of filtered files
@@ -207,6 +265,9 @@ class FileRepository(BaseRepository[File]):
         if filters.get('content_type'):
             query = query.where(File.content_type.startswith(filters['content_type']))
         
+        if filters.get('file_type'):
+            query = query.where(File.file_kind == filters['file_type'])
+        
         if filters.get('collection_id'):
             query = query.where(File.collection_id == filters['collection_id'])
         
@@ -237,7 +298,7 @@ class FileRepository(BaseRepository[File]):
         if filters.get('date_to'):
             query = query.where(File.created_at <= filters['date_to'])
         
-        query = query.order_by(File.created_at.desc()).offset(skip).limit(limit)
+        query = self._page_newest_first(query, skip, limit, after)
         
         result = await self.db.execute(query)
         return result.scalars().all()
@@ -246,9 +307,43 @@ class FileRepository(BaseRepository[File]):
         """
         Get storage usage statistics.
         
+        Served from Redis for up to STORAGE_STATS_TTL_SECONDS; the
+        aggregation only runs on a miss or when Redis is unavailable.
+        
         Returns:
             Dictionary with storage statistics
         """
+        redis = get_redis()
+        if redis is not None:
+            try:
+                cached = await redis.get(STORAGE_STATS_CACHE_KEY)
+            except RedisError as e:
+                logger.warning("Storage statistics cache read failed: %s", e)
+                cached = None
+            if cached is not None:
+                return orjson.loads(cached)
+        
+        stats = await self._aggregate_storage_statistics()
+        
+        if redis is not None:
+            try:
+                await redis.set(STORAGE_STATS_CACHE_KEY, orjson.dumps(stats), ex=STORAGE_STATS_TTL_SECONDS)
+            except RedisError as e:
+                logger.warning("Storage statistics cache write failed: %s", e)
+        
+        return stats
+
+    def _invalidate_storage_statistics(self) -> None:
+        """
+        Drop the cached storage statistics once the current transaction commits.
+        
+        Deleting the entry before the commit would let a concurrent read
+        cache the old figures again until the TTL runs out.
+        """
+        self.db.info[STORAGE_STATS_STALE_FLAG] = True
+
+    async def _aggregate_storage_statistics(self) -> Dict[str, Any]:
+        """Compute storage statistics from the files table."""
         # Total files and size
         total_query = select(
             func.count(File.id),
@@ -260,15 +355,15 @@ class FileRepository(BaseRepository[File]):
         total_files = total_row[0] or 0
         total_size = total_row[1] or 0
         
-        # Files by content type
+        # Files by top-level type; served by idx_file_type_major_size
         type_query = (
             select(
-                func.substr(File.content_type, 1, func.position('/' in File.content_type) - 1).label('type'),
-                func.count(File.id).label('count'),
+                File.content_type_major,
+                func.count().label('count'),
                 func.sum(File.size).label('size')
             )
             .where(File.is_deleted == False)
-            .group_by('type')
+            .group_by(File.content_type_major)
         )
         
         type_result = await self.db.execute(type_query)
@@ -329,30 +424,114 @@ class FileRepository(BaseRepository[File]):
         result = await self.db.execute(query)
         return result.scalars().all()
 
-    async def update_download_count(self, file_id: UUID) -> bool:
+    async def record_download(self, file_id: UUID) -> Optional[File]:
         """
-        Increment download count for a file.
+        Count a download of a file and return its record.
+        
+        With Redis the increment is buffered there (see
+        flush_download_counts), so a download costs a primary key read
+        instead of a row write; download_count lags by at most one flush
+        interval. Without Redis the increment happens server-side in a
+        single UPDATE ... RETURNING.
         
         Args:
             file_id: File UUID
             
         Returns:
-            True if updated successfully
+            File or None if not found
         """
-        from sqlalchemy import update
-        from datetime import datetime
+        redis = get_redis()
+        if redis is not None:
+            file_record = await self.get_by_id(file_id)
+            if file_record is None:
+                return None
+            try:
+                async with redis.pipeline(transaction=False) as pipe:
+                    pipe.hincrby(DOWNLOAD_COUNTS_KEY, str(file_id), 1)
+                    pipe.hset(DOWNLOAD_ACCESS_KEY, str(file_id), time.time())
+                    await pipe.execute()
+                return file_record
+            except RedisError as e:
+                logger.warning("Download count buffering failed, writing through: %s", e)
         
         query = (
             update(File)
             .where(and_(File.id == file_id, File.is_deleted == False))
             .values(
                 download_count=File.download_count + 1,
-                last_accessed=datetime.utcnow()
+                last_accessed=func.now()
             )
+            .returning(File)
         )
         
         result = await self.db.execute(query)
-        return result.rowcount > 0
+        return result.scalar_one_or_none()
+
+    async def flush_download_counts(self) -> int:
+        """
+        Apply the download counts buffered in Redis with one UPDATE.
+        
+        The pending hashes are read and cleared in one MULTI/EXEC, so
+        downloads recorded meanwhile land in the next flush. The UPDATE is
+        committed here: if it or the commit fails, or the flush is cancelled
+        before the commit lands, the counts are put back.
+        
+        Returns:
+            Number of files whose counts were buffered
+        """
+        redis = get_redis()
+        if redis is None:
+            return 0
+        
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.hgetall(DOWNLOAD_COUNTS_KEY)
+            pipe.hgetall(DOWNLOAD_ACCESS_KEY)
+            pipe.delete(DOWNLOAD_COUNTS_KEY, DOWNLOAD_ACCESS_KEY)
+            counts, accessed, _ = await pipe.execute()
+        
+        if not counts:
+            return 0
+        
+        now = time.time()
+        rows = [
+            (
+                UUID(file_id.decode()),
+                int(delta),
+                datetime.fromtimestamp(float(accessed.get(file_id, now)), tz=timezone.utc)
+            )
+            for file_id, delta in counts.items()
+        ]
+        pending = values(
+            column("id", PG_UUID(as_uuid=True)),
+            column("delta", Integer),
+            column("accessed", DateTime(timezone=True)),
+            name="pending"
+        ).data(rows)
+        
+        query = (
+            update(File)
+            .where(File.id == pending.c.id)
+            .values(
+                download_count=File.download_count + pending.c.delta,
+                last_accessed=func.greatest(File.last_accessed, pending.c.accessed)
+            )
+            .execution_options(synchronize_session=False)
+        )
+        
+        try:
+            await self.db.execute(query)
+            await self.db.commit()
+        except BaseException:
+            # Includes CancelledError from the shutdown cancel()
+            async with redis.pipeline(transaction=False) as pipe:
+                for file_id, delta in counts.items():
+                    pipe.hincrby(DOWNLOAD_COUNTS_KEY, file_id, int(delta))
+                if accessed:
+                    pipe.hset(DOWNLOAD_ACCESS_KEY, mapping=accessed)
+                await pipe.execute()
+            raise
+        
+        return len(rows)
 
     async def cleanup_deleted_files(self, days_old: int = 30) -> List[File]:
         """
@@ -379,3 +558,33 @@ class FileRepository(BaseRepository[File]):
         
         result = await self.db.execute(query)
         return result.scalars().all()
+
+
+async def _drop_storage_statistics() -> None:
+    """Delete the cached storage statistics entry."""
+    redis = get_redis()
+    if redis is None:
+        return
+    try:
+        await redis.delete(STORAGE_STATS_CACHE_KEY)
+    except RedisError as e:
+        logger.warning("Storage statistics cache invalidation failed: %s", e)
+
+
+def _drop_storage_statistics_after_commit(session: Session) -> None:
+    # Releasing a SAVEPOINT also fires after_commit; wait for the real commit
+    if session.in_nested_transaction():
+        return
+    if session.info.pop(STORAGE_STATS_STALE_FLAG, False):
+        # Runs inside the AsyncSession's commit, so the DEL can be awaited here
+        await_only(_drop_storage_statistics())
+
+
+def _forget_storage_statistics_flag(session: Session, transaction: SessionTransaction) -> None:
+    # A rolled back transaction changed nothing, so there is nothing to drop
+    if transaction.parent is None:
+        session.info.pop(STORAGE_STATS_STALE_FLAG, None)
+
+
+event.listen(Session, "after_commit", _drop_storage_statistics_after_commit)
+event.listen(Session, "after_transaction_end", _forget_storage_statistics_flag)
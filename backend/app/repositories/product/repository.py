@@ -5,10 +5,11 @@ Data access layer for Product entity.
 Contains only data access logic, no business rules.
 """
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
-from sqlalchemy import select, and_
-from sqlalchemy.orm import selectinload, joinedload
+from sqlalchemy import select, insert, and_, or_, exists, lambda_stmt, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import selectinload, joinedload, defer, undefer
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.product.product import Product
@@ -17,7 +18,57 @@ from app.models.product.image import ProductImage
 from app.models.product.technical_specification import TechnicalSpecification
 from app.models.product.technical_drawing import TechnicalDrawing
 from app.models.product.size_chart import SizeChart
-from app.repositories.base import BaseRepository
+from app.repositories.base import BaseRepository, RAISELOAD_OPTIONS
+
+# Long text and JSONB payload columns that product summaries never render;
+# listing queries skip them so list pages don't pull (possibly TOASTed)
+# payloads over the wire. Deferred per query rather than on the mapper,
+# since a deferred column cannot lazy-load on access under asyncio.
+_DEFER_PAYLOAD = tuple(
+    defer(column) for column in (
+        Product.description,
+        Product.short_description,
+        Product.material_composition,
+        Product.fit_notes,
+        Product.seo_description,
+        Product.features,
+        Product.care_instructions,
+        Product.sustainability_features,
+        Product.extra_data,
+    )
+)
+
+# SQL-computed columns rendered by ProductSummaryResponse
+SUMMARY_COLUMN_OPTIONS = (
+    undefer(Product.variant_count),
+    undefer(Product.main_image_url),
+)
+
+# Relationships and deferred columns rendered by the product detail response
+_FULL_DETAIL_OPTIONS = (
+    undefer(Product.variant_count),
+    undefer(Product.available_colors),
+    undefer(Product.price_range_min),
+    undefer(Product.price_range_max),
+    selectinload(Product.variants).selectinload(ProductVariant.images),
+    selectinload(Product.images),
+    selectinload(Product.specifications),
+    selectinload(Product.technical_drawings),
+    joinedload(Product.size_chart),
+    joinedload(Product.collection),
+    # Anything not listed above raises instead of lazy loading (when enabled)
+    *RAISELOAD_OPTIONS,
+)
+
+# Hot-path statements are built once at import; per-call queries only add
+# their filters, and the lambda_stmt wrappers below skip rebuilding the
+# statement entirely, hitting the compiled cache on every call
+_PRODUCT_DETAIL_SELECT = select(Product).options(*_FULL_DETAIL_OPTIONS)
+_PRODUCT_SUMMARY_SELECT = (
+    select(Product)
+    .options(*_DEFER_PAYLOAD, *SUMMARY_COLUMN_OPTIONS, *RAISELOAD_OPTIONS)
+    .where(Product.is_deleted == False)
+)
 
 
 class ProductRepository(BaseRepository[Product]):
@@ -42,20 +93,17 @@ class ProductRepository(BaseRepository[Product]):
         Returns:
             Product with all relationships loaded, or None
         """
-        query = (
-            select(Product)
-            .options(
-                selectinload(Product.variants).selectinload(ProductVariant.images),
-                selectinload(Product.images),
-                selectinload(Product.specifications),
-                selectinload(Product.technical_drawings),
-                joinedload(Product.size_chart),
-                joinedload(Product.collection)
+        query = lambda_stmt(
+            lambda: _PRODUCT_DETAIL_SELECT.where(
+                and_(Product.id == product_id, Product.is_deleted == False)
             )
-            .where(and_(Product.id == product_id, Product.is_deleted == False))
         )
         
-        result = await self.db.execute(query)
+        # Refresh SQL-computed counts/prices if the product is already in
+        # the session (e.g. right after its variants were created)
+        result = await self.db.execute(
+            query, execution_options={"populate_existing": True}
+        )
         return result.scalar_one_or_none()
 
     async def get_by_collection(
@@ -73,17 +121,7 @@ class ProductRepository(BaseRepository[Product]):
         Returns:
             List of products in the collection
         """
-        query = (
-            select(Product)
-            .options(
-                selectinload(Product.variants).selectinload(ProductVariant.images),
-                selectinload(Product.images)
-            )
-            .where(and_(
-                Product.collection_id == collection_id,
-                Product.is_deleted == False
-            ))
-        )
+        query = _PRODUCT_SUMMARY_SELECT.where(Product.collection_id == collection_id)
         
         if not include_inactive:
             query = query.where(Product.status == "active")
@@ -95,7 +133,7 @@ class ProductRepository(BaseRepository[Product]):
 
     async def get_by_sku(self, sku: str) -> Optional[Product]:
         """
-        Get product by SKU.
+        Get product by SKU with the detail relationships loaded.
         
         Args:
             sku: Product SKU
@@ -103,7 +141,12 @@ class ProductRepository(BaseRepository[Product]):
         Returns:
             Product or None if not found
         """
-        return await self.get_by_field("sku", sku)
+        query = _PRODUCT_DETAIL_SELECT.where(
+            and_(Product.sku == sku, Product.is_deleted == False)
+        )
+        
+        result = await self.db.execute(query)
+        return result.scalar_one_or_none()
 
     async def search_products(
         self,
@@ -111,7 +154,8 @@ class ProductRepository(BaseRepository[Product]):
         category: Optional[str] = None,
         collection_id: Optional[UUID] = None,
         skip: int = 0,
-        limit: int = 20
+        limit: int = 20,
+        after: Optional[Tuple[str, UUID]] = None
     ) -> List[Product]:
         """
         Search products by name or description.
@@ -120,23 +164,14 @@ class ProductRepository(BaseRepository[Product]):
             search_term: Text to search for
             category: Optional category filter
             collection_id: Optional collection filter
-            skip: Number of records to skip
+            skip: Number of records to skip (ignored when after is given)
             limit: Maximum records to return
+            after: (name, id) of the last product of the previous page
             
         Returns:
             List of matching products
         """
-        query = (
-            select(Product)
-            .options(
-                selectinload(Product.variants).selectinload(ProductVariant.images),
-                selectinload(Product.images)
-            )
-            .where(and_(
-                Product.is_deleted == False,
-                Product.status == "active"
-            ))
-        )
+        query = _PRODUCT_SUMMARY_SELECT.where(Product.status == "active")
         
         # Text search
         if search_term:
@@ -157,8 +192,13 @@ class ProductRepository(BaseRepository[Product]):
         if collection_id:
             query = query.where(Product.collection_id == collection_id)
         
-        # Pagination and ordering
-        query = query.order_by(Product.name).offset(skip).limit(limit)
+        # Pagination and ordering; id breaks name ties for keyset pages
+        query = query.order_by(Product.name, Product.id)
+        if after is not None:
+            query = query.where(tuple_(Product.name, Product.id) > tuple_(*after))
+        else:
+            query = query.offset(skip)
+        query = query.limit(limit)
         
         result = await self.db.execute(query)
         return result.scalars().all()
@@ -173,16 +213,11 @@ class ProductRepository(BaseRepository[Product]):
         Returns:
             List of featured products
         """
-        query = (
-            select(Product)
-            .options(
-                selectinload(Product.variants).selectinload(ProductVariant.images),
-                selectinload(Product.images)
-            )
+        query = lambda_stmt(
+            lambda: _PRODUCT_SUMMARY_SELECT
             .where(and_(
                 Product.is_featured == True,
-                Product.status == "active",
-                Product.is_deleted == False
+                Product.status == "active"
             ))
             .order_by(Product.created_at.desc())
             .limit(limit)
@@ -195,34 +230,37 @@ class ProductRepository(BaseRepository[Product]):
         self,
         category: str,
         skip: int = 0,
-        limit: int = 20
+        limit: int = 20,
+        after: Optional[Tuple[str, UUID]] = None
     ) -> List[Product]:
         """
         Get products by category.
         
         Args:
             category: Product category
-            skip: Number of records to skip
+            skip: Number of records to skip (ignored when after is given)
             limit: Maximum records to return
+            after: (name, id) of the last product of the previous page
             
         Returns:
             List of products in category
         """
-        query = (
-            select(Product)
-            .options(
-                selectinload(Product.variants).selectinload(ProductVariant.images),
-                selectinload(Product.images)
-            )
+        query = lambda_stmt(
+            lambda: _PRODUCT_SUMMARY_SELECT
             .where(and_(
                 Product.category == category,
-                Product.status == "active",
-                Product.is_deleted == False
+                Product.status == "active"
             ))
-            .order_by(Product.name)
-            .offset(skip)
+            .order_by(Product.name, Product.id)
             .limit(limit)
         )
+        if after is not None:
+            after_name, after_id = after
+            query += lambda s: s.where(
+                tuple_(Product.name, Product.id) > tuple_(after_name, after_id)
+            )
+        else:
+            query += lambda s: s.offset(skip)
         
         result = await self.db.execute(query)
         return result.scalars().all()
@@ -238,16 +276,11 @@ class ProductRepository(BaseRepository[Product]):
         Returns:
             True if SKU exists, False otherwise
         """
-        query = select(Product).where(and_(
-            Product.sku == sku,
-            Product.is_deleted == False
-        ))
-        
+        conditions = [Product.sku == sku, Product.is_deleted == False]
         if exclude_id:
-            query = query.where(Product.id != exclude_id)
+            conditions.append(Product.id != exclude_id)
         
-        result = await self.db.execute(query)
-        return result.scalar_one_or_none() is not None
+        return await self.db.scalar(select(exists().where(and_(*conditions))))
 
     async def get_products_needing_images(self) -> List[Product]:
         """
@@ -257,25 +290,69 @@ class ProductRepository(BaseRepository[Product]):
         Returns:
             List of products without images
         """
-        query = (
-            select(Product)
-            .outerjoin(ProductImage)
+        # Anti-join: each product probes idx_product_image_type_order
+        # (leading product_id) and stops at its first live image
+        has_image = (
+            select(ProductImage.id)
             .where(and_(
-                Product.is_deleted == False,
-                ProductImage.id.is_(None)
+                ProductImage.product_id == Product.id,
+                ProductImage.is_deleted == False
             ))
+            .exists()
+        )
+        
+        query = (
+            _PRODUCT_SUMMARY_SELECT
+            .where(~has_image)
             .order_by(Product.created_at.desc())
         )
         
         result = await self.db.execute(query)
         return result.scalars().all()
 
+    async def bulk_upsert(
+        self,
+        products: List[Dict[str, Any]],
+        user_id: Optional[str] = None
+    ) -> List[UUID]:
+        """
+        Insert many products, skipping any whose SKU already exists.
+        
+        Meant for catalog imports and seeding: rows bypass the unit of work
+        and are sent as multi-row INSERTs. SQLAlchemy's insertmanyvalues
+        packs as many rows per statement as the driver's bind parameter
+        limit allows, so large imports take a handful of round trips.
+        
+        Args:
+            products: Column values per product; all rows share the same keys
+            user_id: ID of user importing the products
+            
+        Returns:
+            IDs of the products that were inserted
+        """
+        if not products:
+            return []
+        
+        if user_id:
+            for row in products:
+                row["created_by"] = user_id
+        
+        stmt = (
+            pg_insert(Product)
+            .on_conflict_do_nothing(index_elements=[Product.sku])
+            .returning(Product.id)
+            # Let the parameter limit, not the default 1000 rows, size batches
+            .execution_options(insertmanyvalues_page_size=len(products))
+        )
+        result = await self.db.execute(stmt, products)
+        return result.scalars().all()
+
 
 class ProductVariantRepository(BaseRepository[ProductVariant]):
     """Repository for ProductVariant model."""
     
     def __init__(self, db: AsyncSession):
-        super().__init__(ProductVariant, db)
+        super().__init__(db, ProductVariant)
     
     async def get_by_product(
         self, 
@@ -321,7 +398,7 @@ class ProductImageRepository(BaseRepository[ProductImage]):
     """Repository for ProductImage model."""
     
     def __init__(self, db: AsyncSession):
-        super().__init__(ProductImage, db)
+        super().__init__(db, ProductImage)
     
     async def get_by_product(
         self, 
@@ -366,7 +443,7 @@ class TechnicalSpecificationRepository(BaseRepository[TechnicalSpecification]):
     """Repository for TechnicalSpecification model."""
     
     def __init__(self, db: AsyncSession):
-        super().__init__(TechnicalSpecification, db)
+        super().__init__(db, TechnicalSpecification)
     
     async def get_by_product(
         self, 
@@ -392,7 +469,7 @@ class TechnicalDrawingRepository(BaseRepository[TechnicalDrawing]):
     """Repository for TechnicalDrawing model."""
     
     def __init__(self, db: AsyncSession):
-        super().__init__(TechnicalDrawing, db)
+        super().__init__(db, TechnicalDrawing)
     
     async def get_by_product(
         self, 
@@ -412,10 +489,57 @@ class TechnicalDrawingRepository(BaseRepository[TechnicalDrawing]):
         
         result = await self.db.execute(query)
         return result.scalars().all()
+    
+    async def bulk_create_standard_views(
+        self,
+        product_ids: List[UUID],
+        base_url: str,
+        user_id: Optional[str] = None
+    ) -> None:
+        """
+        Insert the standard front/back/side drawings for many products.
+        
+        Uses a single multi-row INSERT instead of the unit of work.
+        """
+        rows = [
+            row
+            for product_id in product_ids
+            for row in TechnicalDrawing.standard_view_rows(product_id, base_url)
+        ]
+        if not rows:
+            return
+        
+        if user_id:
+            for row in rows:
+                row["created_by"] = user_id
+        
+        await self.db.execute(insert(TechnicalDrawing), rows)
 
 
 class SizeChartRepository(BaseRepository[SizeChart]):
     """Repository for SizeChart model."""
     
     def __init__(self, db: AsyncSession):
-        super().__init__(SizeChart, db)
\ No newline at end of file
+        super().__init__(db, SizeChart)
+    
+    async def bulk_create_standard_charts(
+        self,
+        product_ids: List[UUID],
+        user_id: Optional[str] = None
+    ) -> List[UUID]:
+        """
+        Insert the standard size chart for many products in one statement.
+        
+        Returns:
+            IDs of the created size charts
+        """
+        rows = [SizeChart.standard_chart_row(product_id) for product_id in product_ids]
+        if not rows:
+            return []
+        
+        if user_id:
+            for row in rows:
+                row["created_by"] = user_id
+        
+        result = await self.db.execute(insert(SizeChart).returning(SizeChart.id), rows)
+        return result.scalars().all()
@@ -8,7 +8,7 @@ Handles user authentication and management operations.
 from typing import List, Optional, Dict, Any
 from uuid import UUID
 from datetime import datetime, timedelta
-from sqlalchemy import select, and_, or_, func, desc
+from sqlalchemy import select, and_, or_, exists, func, desc
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.user import User
@@ -59,16 +59,11 @@ class UserRepository(BaseRepository[User]):
         Returns:
             True if email exists, False otherwise
         """
-        query = select(User).where(and_(
-            User.email == email.lower(),
-            User.is_deleted == False
-        ))
-        
+        conditions = [User.email == email.lower(), User.is_deleted == False]
         if exclude_id:
-            query = query.where(User.id != exclude_id)
+            conditions.append(User.id != exclude_id)
         
-        result = await self.db.execute(query)
-        return result.scalar_one_or_none() is not None
+        return await self.db.scalar(select(exists().where(and_(*conditions))))
 
     async def get_active_users(
         self,
@@ -74,6 +74,7 @@ class PaginatedResponse(BaseSchema, Generic[T]):
     has_prev: bool = Field(description="Whether there are previous items")
     page: int = Field(description="Current page number (1-based)")
     total_pages: int = Field(description="Total number of pages")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, when cursor paging")
     
     @classmethod
     def create(
@@ -81,7 +82,8 @@ class PaginatedResponse(BaseSchema, Generic[T]):
         items: List[T],
         total: int,
         skip: int,
-        limit: int
+        limit: int,
+        next_cursor: Optional[str] = None
     ) -> "PaginatedResponse[T]":
         """Create a paginated response from items and parameters."""
         page = (skip // limit) + 1
@@ -95,7 +97,8 @@ class PaginatedResponse(BaseSchema, Generic[T]):
             has_next=skip + limit < total,
             has_prev=skip > 0,
             page=page,
-            total_pages=total_pages
+            total_pages=total_pages,
+            next_cursor=next_cursor
         )
 
 
@@ -8,7 +8,7 @@ from datetime import date
 from typing import List, Optional, Dict, Any
 from uuid import UUID
 
-from pydantic import Field, field_validator
+from pydantic import AliasChoices, Field, field_validator
 
 from .base import (
     BaseSchema, BaseResponseSchema, BaseCreateSchema, BaseUpdateSchema,
@@ -56,8 +56,10 @@ class CollectionBase(BaseSchema):
         max_length=500,
         description="SEO meta description"
     )
-    metadata: Optional[Dict[str, Any]] = Field(
+    extra_data: Optional[Dict[str, Any]] = Field(
         default_factory=dict,
+        validation_alias=AliasChoices("extra_data", "metadata"),
+        serialization_alias="metadata",
         description="Additional collection metadata"
     )
     
@@ -167,8 +169,10 @@ class CollectionUpdate(BaseUpdateSchema):
         max_length=500,
         description="SEO meta description"
     )
-    metadata: Optional[Dict[str, Any]] = Field(
+    extra_data: Optional[Dict[str, Any]] = Field(
         None,
+        validation_alias=AliasChoices("extra_data", "metadata"),
+        serialization_alias="metadata",
         description="Additional metadata"
     )
     
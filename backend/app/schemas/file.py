@@ -4,10 +4,11 @@ File Management Pydantic Schemas
 Schemas for file uploads, management, and metadata.
 """
 
+from datetime import datetime
 from typing import Optional, List, Dict, Any, Union
 from uuid import UUID
 
-from pydantic import Field, field_validator
+from pydantic import AliasChoices, Field, field_validator
 
 from .base import BaseSchema, BaseResponseSchema, BaseCreateSchema, BaseUpdateSchema
 
@@ -23,7 +24,12 @@ class FileBase(BaseSchema):
     size: int = Field(..., gt=0, description="File size in bytes")
     description: Optional[str] = Field(None, max_length=500, description="File description")
     tags: Optional[List[str]] = Field(default_factory=list, description="File tags")
-    metadata: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Additional metadata")
+    extra_data: Optional[Dict[str, Any]] = Field(
+        default_factory=dict,
+        validation_alias=AliasChoices("extra_data", "metadata"),
+        serialization_alias="metadata",
+        description="Additional metadata"
+    )
     
     @field_validator('content_type')
     @classmethod
@@ -49,8 +55,8 @@ class FileCreate(FileBase, BaseCreateSchema):
     
     url: str = Field(..., description="File URL")
     storage_path: str = Field(..., description="Storage path")
-    hash_md5: Optional[str] = Field(None, description="MD5 hash of file content")
-    hash_sha256: Optional[str] = Field(None, description="SHA256 hash of file content")
+    hash_md5: Optional[bytes] = Field(None, description="MD5 digest of file content")
+    hash_sha256: Optional[bytes] = Field(None, description="SHA256 digest of file content")
     
     # Optional relationships
     collection_id: Optional[UUID] = Field(None, description="Associated collection")
@@ -58,18 +64,18 @@ class FileCreate(FileBase, BaseCreateSchema):
     
     @field_validator('hash_md5')
     @classmethod
-    def validate_md5_hash(cls, v: Optional[str]) -> Optional[str]:
-        """Validate MD5 hash format."""
-        if v and len(v) != 32:
-            raise ValueError("MD5 hash must be 32 characters long")
+    def validate_md5_hash(cls, v: Optional[bytes]) -> Optional[bytes]:
+        """Validate MD5 digest length."""
+        if v and len(v) != 16:
+            raise ValueError("MD5 digest must be 16 bytes long")
         return v
     
     @field_validator('hash_sha256')
     @classmethod
-    def validate_sha256_hash(cls, v: Optional[str]) -> Optional[str]:
-        """Validate SHA256 hash format."""
-        if v and len(v) != 64:
-            raise ValueError("SHA256 hash must be 64 characters long")
+    def validate_sha256_hash(cls, v: Optional[bytes]) -> Optional[bytes]:
+        """Validate SHA256 digest length."""
+        if v and len(v) != 32:
+            raise ValueError("SHA256 digest must be 32 bytes long")
         return v
 
 
@@ -79,7 +85,12 @@ class FileUpdate(BaseUpdateSchema):
     filename: Optional[str] = Field(None, min_length=1, max_length=255, description="File name")
     description: Optional[str] = Field(None, max_length=500, description="File description")
     tags: Optional[List[str]] = Field(None, description="File tags")
-    metadata: Optional[Dict[str, Any]] = Field(None, description="Additional metadata")
+    extra_data: Optional[Dict[str, Any]] = Field(
+        None,
+        validation_alias=AliasChoices("extra_data", "metadata"),
+        serialization_alias="metadata",
+        description="Additional metadata"
+    )
     collection_id: Optional[UUID] = Field(None, description="Associated collection")
     product_id: Optional[UUID] = Field(None, description="Associated product")
 
@@ -92,7 +103,7 @@ class FileResponse(FileBase, BaseResponseSchema):
     hash_md5: Optional[str]
     hash_sha256: Optional[str]
     download_count: int = Field(default=0, description="Number of downloads")
-    last_accessed: Optional[str] = Field(None, description="Last access timestamp")
+    last_accessed: Optional[datetime] = Field(None, description="Last access timestamp")
     
     # Relationships
     collection_id: Optional[UUID] = None
@@ -105,6 +116,14 @@ class FileResponse(FileBase, BaseResponseSchema):
     is_image: bool = Field(description="Whether file is an image")
     is_document: bool = Field(description="Whether file is a document")
     human_readable_size: str = Field(description="Human readable file size")
+    
+    @field_validator('hash_md5', 'hash_sha256', mode='before')
+    @classmethod
+    def hash_to_hex(cls, v: Any) -> Any:
+        """Render stored digests as hex strings."""
+        if isinstance(v, (bytes, memoryview)):
+            return bytes(v).hex()
+        return v
 
 
 # File Upload Schemas
@@ -8,7 +8,7 @@ from decimal import Decimal
 from typing import List, Optional, Dict, Any, Union
 from uuid import UUID
 
-from pydantic import Field, field_validator, model_validator
+from pydantic import AliasChoices, Field, field_validator, model_validator
 
 from .base import (
     BaseSchema, BaseResponseSchema, BaseCreateSchema, BaseUpdateSchema,
@@ -36,7 +36,12 @@ class ProductVariantBase(BaseSchema):
     sort_order: int = Field(default=0, ge=0, description="Display order")
     is_available: bool = Field(default=True, description="Whether variant is available")
     stock_quantity: Optional[int] = Field(None, ge=0, description="Stock quantity")
-    metadata: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Additional variant data")
+    extra_data: Optional[Dict[str, Any]] = Field(
+        default_factory=dict,
+        validation_alias=AliasChoices("extra_data", "metadata"),
+        serialization_alias="metadata",
+        description="Additional variant data"
+    )
 
 
 class ProductVariantCreate(ProductVariantBase, BaseCreateSchema):
@@ -56,7 +61,12 @@ class ProductVariantUpdate(BaseUpdateSchema):
     sort_order: Optional[int] = Field(None, ge=0, description="Display order")
     is_available: Optional[bool] = Field(None, description="Whether variant is available")
     stock_quantity: Optional[int] = Field(None, ge=0, description="Stock quantity")
-    metadata: Optional[Dict[str, Any]] = Field(None, description="Additional variant data")
+    extra_data: Optional[Dict[str, Any]] = Field(
+        None,
+        validation_alias=AliasChoices("extra_data", "metadata"),
+        serialization_alias="metadata",
+        description="Additional variant data"
+    )
 
 
 class ProductVariantResponse(ProductVariantBase, BaseResponseSchema):
@@ -218,7 +228,12 @@ class ProductBase(BaseSchema):
     fit_notes: Optional[str] = Field(None, max_length=500, description="Fit information")
     seo_title: Optional[str] = Field(None, max_length=200, description="SEO page title")
     seo_description: Optional[str] = Field(None, max_length=500, description="SEO meta description")
-    metadata: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Additional metadata")
+    extra_data: Optional[Dict[str, Any]] = Field(
+        default_factory=dict,
+        validation_alias=AliasChoices("extra_data", "metadata"),
+        serialization_alias="metadata",
+        description="Additional metadata"
+    )
     
     @field_validator('category')
     @classmethod
@@ -306,7 +321,12 @@ class ProductUpdate(BaseUpdateSchema):
     is_featured: Optional[bool] = Field(None, description="Whether product is featured")
     seo_title: Optional[str] = Field(None, max_length=200, description="SEO title")
     seo_description: Optional[str] = Field(None, max_length=500, description="SEO description")
-    metadata: Optional[Dict[str, Any]] = Field(None, description="Additional metadata")
+    extra_data: Optional[Dict[str, Any]] = Field(
+        None,
+        validation_alias=AliasChoices("extra_data", "metadata"),
+        serialization_alias="metadata",
+        description="Additional metadata"
+    )
     
     @field_validator('category')
     @classmethod
@@ -13,6 +13,7 @@ from app.repositories.collection import CollectionRepository
 from app.repositories.product.repository import ProductRepository
 from app.repositories.file import FileRepository
 from app.repositories.user import UserRepository
+from app.core.database import gather_with_sessions
 from app.core.exceptions import ValidationError, NotFoundError
 from app.schemas.admin import (
     DashboardStats, CollectionStats, ProductStats, FileStats, UserStats, SystemStats,
@@ -41,8 +42,14 @@ class AdminService:
         Returns:
             Dashboard statistics
         """
+        # Collection and user stats don't depend on each other; read them
+        # concurrently on separate sessions
+        collections_data, user_analytics = await gather_with_sessions(
+            lambda session: CollectionRepository(session).get_collections_with_stats(),
+            lambda session: UserRepository(session).get_user_statistics(),
+        )
+        
         # Get collection stats
-        collections_data = await self.collection_repository.get_collections_with_stats()
         collection_analytics = await self._calculate_collection_stats(collections_data)
         
         # Get product stats  
@@ -51,9 +58,6 @@ class AdminService:
         # Get file stats
         file_analytics = await self._calculate_file_stats()
         
-        # Get user stats
-        user_analytics = await self.user_repository.get_user_statistics()
-        
         # Get system stats
         system_analytics = await self._calculate_system_stats()
         
@@ -336,7 +340,7 @@ class AdminService:
             by_category[category] = by_category.get(category, 0) + 1
         
         # Calculate other metrics
-        with_variants = sum(1 for p in all_products if p.variants)
+        with_variants = sum(1 for p in all_products if p.variant_count)
         with_images = sum(1 for p in all_products if p.images)
         with_specifications = sum(1 for p in all_products if p.specifications)
         
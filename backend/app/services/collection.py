@@ -20,6 +20,9 @@ from app.schemas.collection import (
     CollectionListFilters, CollectionAnalytics
 )
 
+# Relationships rendered by the collection detail response
+COLLECTION_DETAIL_RELATIONS = ["products", "files"]
+
 
 class CollectionService(BaseService[Collection, CollectionRepository]):
     """
@@ -54,13 +57,17 @@ class CollectionService(BaseService[Collection, CollectionRepository]):
         
         # Validate and process data
         await self._validate_create_data(collection_data, user_id)
-        await self._check_create_conflicts(collection_data)
         
         # Process data
         processed_data = await self._process_create_data(collection_data, user_id)
         
-        # Create collection
-        collection = await self.repository.create(processed_data, user_id)
+        # Create collection; the slug check is part of the INSERT
+        collection = await self.repository.create_unless_slug_taken(processed_data, user_id)
+        if collection is None:
+            raise ConflictError(
+                detail=f"Collection with slug '{processed_data['slug']}' already exists",
+                error_code="SLUG_ALREADY_EXISTS"
+            )
         
         # Post-creation actions
         await self._post_create_actions(collection, user_id)
@@ -123,7 +130,9 @@ class CollectionService(BaseService[Collection, CollectionRepository]):
         Returns:
             Collection
         """
-        collection = await self.repository.get_by_slug(slug)
+        collection = await self.repository.get_by_slug(
+            slug, load_relations=COLLECTION_DETAIL_RELATIONS
+        )
         if not collection:
             raise NotFoundError(
                 detail=f"Collection with slug '{slug}' not found",
@@ -136,7 +145,8 @@ class CollectionService(BaseService[Collection, CollectionRepository]):
         filters: CollectionListFilters,
         skip: int = 0,
         limit: int = 20,
-        user_id: Optional[str] = None  # Firebase UID
+        user_id: Optional[str] = None,  # Firebase UID
+        after: Optional[Tuple[datetime, UUID]] = None
     ) -> Tuple[List[Collection], int]:
         """
         List collections with filtering and pagination.
@@ -146,6 +156,7 @@ class CollectionService(BaseService[Collection, CollectionRepository]):
             skip: Number of records to skip
             limit: Maximum records to return
             user_id: ID of requesting user
+            after: (created_at, id) of the last collection already returned
             
         Returns:
             Tuple of (collections, total_count)
@@ -157,12 +168,12 @@ class CollectionService(BaseService[Collection, CollectionRepository]):
             # Apply business logic filters
             business_filters = await self._apply_business_filters(filter_dict, user_id)
             
-            # Get collections using repository with products loaded for count
+            # product_count is a SQL column property, so products aren't loaded
             collections = await self.repository.get_all(
                 skip=skip,
                 limit=limit,
                 filters=business_filters,
-                load_relations=['products']
+                after=after
             )
             
         except Exception as e:
@@ -266,7 +277,8 @@ class CollectionService(BaseService[Collection, CollectionRepository]):
         query: str,
         published_only: bool = True,
         skip: int = 0,
-        limit: int = 20
+        limit: int = 20,
+        after: Optional[Tuple[int, str, UUID]] = None
     ) -> List[Collection]:
         """
         Search collections by text query.
@@ -276,6 +288,7 @@ class CollectionService(BaseService[Collection, CollectionRepository]):
             published_only: Whether to only search published collections
             skip: Number of records to skip
             limit: Maximum records to return
+            after: (year, name, id) of the last collection already returned
             
         Returns:
             List of matching collections
@@ -287,7 +300,7 @@ class CollectionService(BaseService[Collection, CollectionRepository]):
             )
         
         return await self.repository.search_collections(
-            query.strip(), published_only, skip, limit
+            query.strip(), published_only, skip, limit, after
         )
 
     async def get_featured_collections(self, limit: int = 6) -> List[Collection]:
@@ -369,12 +382,12 @@ class CollectionService(BaseService[Collection, CollectionRepository]):
             data['slug'] = self._normalize_slug(data['slug'])
         
         # Set default metadata
-        if 'metadata' not in data:
-            data['metadata'] = {}
+        if not data.get('extra_data'):
+            data['extra_data'] = {}
         
         # Add creation metadata
-        data['metadata']['created_by_service'] = True
-        data['metadata']['creation_source'] = 'api'
+        data['extra_data']['created_by_service'] = True
+        data['extra_data']['creation_source'] = 'api'
         
         return data
 
@@ -390,10 +403,10 @@ class CollectionService(BaseService[Collection, CollectionRepository]):
             data['slug'] = self._normalize_slug(data['slug'])
         
         # Update metadata
-        if 'metadata' in data:
+        if data.get('extra_data') is not None:
             # Merge with existing metadata
-            existing_metadata = collection.metadata or {}
-            data['metadata'] = {**existing_metadata, **data['metadata']}
+            existing_metadata = collection.extra_data or {}
+            data['extra_data'] = {**existing_metadata, **data['extra_data']}
         
         return data
 
@@ -5,6 +5,8 @@ Business logic for File entity.
 Handles file upload, processing, and management operations.
 """
 
+import asyncio
+import logging
 import os
 import hashlib
 import mimetypes
@@ -17,6 +19,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.file import File
 from app.repositories.file import FileRepository
 from app.services.base import BaseService
+from app.core.database import AsyncSessionLocal
 from app.core.exceptions import ValidationError, NotFoundError, BadRequestError
 from app.schemas.file import (
     FileCreate, FileUpdate, FileResponse,
@@ -28,6 +31,40 @@ from app.schemas.file import (
     FileAnalytics
 )
 
+logger = logging.getLogger(__name__)
+
+
+async def flush_download_counts() -> int:
+    """
+    Write buffered download counts to the database in its own transaction.
+    
+    The repository commits the flush itself, so buffered counts are only
+    dropped from Redis once they are durable.
+    
+    Returns:
+        Number of files updated
+    """
+    async with AsyncSessionLocal() as session:
+        return await FileRepository(session).flush_download_counts()
+
+
+async def run_download_count_flusher(interval_seconds: int) -> None:
+    """
+    Flush buffered download counts every interval until cancelled.
+    
+    Started from the application lifespan; the final flush on shutdown
+    happens there too, after this task is cancelled.
+    
+    Args:
+        interval_seconds: Seconds between flushes
+    """
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await flush_download_counts()
+        except Exception as e:
+            logger.error(f"Failed to flush download counts: {str(e)}")
+
 
 class FileService(BaseService[File, FileRepository]):
     """
@@ -84,8 +121,8 @@ class FileService(BaseService[File, FileRepository]):
         unique_filename = f"{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}_{original_filename}"
         
         # Calculate file hashes
-        md5_hash = hashlib.md5(content).hexdigest()
-        sha256_hash = hashlib.sha256(content).hexdigest()
+        md5_hash = hashlib.md5(content).digest()
+        sha256_hash = hashlib.sha256(content).digest()
         
         # Check for duplicate files
         existing_file = await self.repository.get_by_hash(md5_hash, "md5")
@@ -201,16 +238,14 @@ class FileService(BaseService[File, FileRepository]):
         Returns:
             File record
         """
-        file_record = await self.repository.get_by_id(file_id)
+        # Count the download (buffered in Redis when available) and fetch the record
+        file_record = await self.repository.record_download(file_id)
         if not file_record:
             raise NotFoundError(
                 detail=f"File with ID {file_id} not found",
                 error_code="FILE_NOT_FOUND"
             )
         
-        # Update download count
-        await self.repository.update_download_count(file_id)
-        
         return file_record
 
     async def list_files(
@@ -372,6 +407,11 @@ class FileService(BaseService[File, FileRepository]):
         results = []
         errors = []
         
+        # Fetch every file to tag in one query rather than one per ID
+        files_by_id = {}
+        if operation.operation == "tag":
+            files_by_id = await self.repository.get_many_by_ids(operation.file_ids)
+        
         for file_id in operation.file_ids:
             try:
                 if operation.operation == "delete":
@@ -386,7 +426,7 @@ class FileService(BaseService[File, FileRepository]):
                 elif operation.operation == "tag":
                     # Add tags to file
                     tags = operation.parameters.get("tags", [])
-                    file_record = await self.repository.get_by_id(file_id)
+                    file_record = files_by_id.get(file_id)
                     if file_record:
                         existing_tags = file_record.tags or []
                         new_tags = list(set(existing_tags + tags))
@@ -132,7 +132,7 @@ class ProductService(BaseService[Product, ProductRepository]):
         update_data = data.model_dump(exclude_unset=True)
         
         if not update_data:
-            return existing
+            return await self.repository.get_with_full_details(product_id)
         
         # Validate collection if being updated
         if 'collection_id' in update_data:
@@ -156,7 +156,8 @@ class ProductService(BaseService[Product, ProductRepository]):
         # Post-update actions
         await self._post_update_actions(existing, updated_product, user_id)
         
-        return updated_product
+        # Reload with the relationships the product response renders
+        return await self.repository.get_with_full_details(product_id)
 
     async def get_product_with_details(self, product_id: UUID) -> Product:
         """
@@ -659,8 +660,8 @@ class ProductService(BaseService[Product, ProductRepository]):
             data['currency'] = data['currency'].upper()
         
         # Set default metadata
-        if 'metadata' not in data:
-            data['metadata'] = {}
+        if not data.get('extra_data'):
+            data['extra_data'] = {}
         
         return data
 
@@ -0,0 +1,43 @@
+"""
+Tests for collection data access.
+"""
+
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import inspect
+
+from app.repositories.collection import CollectionRepository
+
+pytestmark = pytest.mark.anyio
+
+
+def _collection_data(slug: str) -> dict:
+    """Minimal column values for a new collection."""
+    return {"name": "Slug Test", "slug": slug, "season": "Winter", "year": 1903}
+
+
+async def test_create_unless_slug_taken_returns_loaded_collection(db_session):
+    repository = CollectionRepository(db_session)
+
+    collection = await repository.create_unless_slug_taken(
+        _collection_data(f"slug-test-{uuid4().hex}"), user_id="creator"
+    )
+
+    assert "product_count" not in inspect(collection).unloaded
+    assert collection.product_count == 0
+    assert collection.created_by == "creator"
+
+
+async def test_create_unless_slug_taken_rejects_live_duplicates_only(db_session):
+    repository = CollectionRepository(db_session)
+    slug = f"slug-test-{uuid4().hex}"
+
+    first = await repository.create_unless_slug_taken(_collection_data(slug))
+    assert await repository.create_unless_slug_taken(_collection_data(slug)) is None
+
+    # The slug frees up once the collection holding it is soft deleted
+    assert await repository.delete(first.id)
+    second = await repository.create_unless_slug_taken(_collection_data(slug))
+    assert second is not None
+    assert second.id != first.id
@@ -0,0 +1,32 @@
+"""
+Tests for the async engine's connection settings.
+"""
+
+import pytest
+from sqlalchemy import text
+
+from app.core.config import settings
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_connections_run_with_configured_server_settings(db_session):
+    assert await db_session.scalar(text("SHOW jit")) == "off"
+    application_name = await db_session.scalar(text("SHOW application_name"))
+    assert application_name == settings.DB_APPLICATION_NAME
+
+
+async def test_repeated_statements_are_prepared_once(db_session):
+    if settings.DB_USE_PGBOUNCER:
+        pytest.skip("Statement caching is disabled behind PgBouncer")
+
+    statement = text("SELECT 1 + :n AS prepared_probe")
+    for n in range(3):
+        await db_session.execute(statement, {"n": n})
+
+    prepared = await db_session.scalar(text(
+        "SELECT count(*) FROM pg_prepared_statements"
+        " WHERE statement LIKE 'SELECT 1 + %'"
+    ))
+    # The cached statement is reused instead of being prepared per execution
+    assert prepared == 1
@@ -0,0 +1,222 @@
+"""
+Tests for the response caching and rate limiting decorators.
+"""
+
+import inspect
+import time
+from types import SimpleNamespace
+from typing import List, Optional
+
+import pytest
+from fastapi import Request
+from pydantic import BaseModel
+
+from app.core.decorators import (
+    _cache_key,
+    _cached_json_response,
+    _rate_limit_identity,
+    _response_adapter,
+    _response_body,
+    cache_response,
+    rate_limit,
+)
+from app.core.exceptions import TooManyRequestsError
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+
+
+def _request(
+    path: str = "/items",
+    query: bytes = b"",
+    headers: Optional[dict] = None,
+    client: Optional[tuple] = ("203.0.113.1", 50000)
+) -> Request:
+    """Build a bare GET request for the given path and query string."""
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "query_string": query,
+        "headers": [
+            (name.lower().encode(), value.encode())
+            for name, value in (headers or {}).items()
+        ],
+        "client": client,
+    })
+
+
+async def _endpoint():
+    pass
+
+
+def test_cache_key_covers_the_full_query_string():
+    def key(path="/items", query=b"", user="anon"):
+        return _cache_key(_endpoint, _request(path, query), user)
+
+    assert key(query=b"tags=a") == key(query=b"tags=a")
+    assert key(query=b"tags=a") != key(query=b"tags=b")
+    assert key(query=b"tags=a") != key(query=b"tags=a&tags=b")
+    assert key(query=b"day=2024-01-01") != key(query=b"day=2024-01-02")
+    assert key(query=b"price=9.90") != key(query=b"price=9.99")
+    assert key(path="/items") != key(path="/other")
+    assert key(user="u1") != key(user="u2")
+
+
+def test_body_is_filtered_through_the_response_model():
+    adapter = _response_adapter(_endpoint, List[Item])
+    rows = [
+        SimpleNamespace(id=1, name="Tee", secret="hidden"),
+        {"id": 2, "name": "Cap", "secret": "hidden"},
+    ]
+    expected = b'[{"id":1,"name":"Tee"},{"id":2,"name":"Cap"}]'
+    assert _response_body(rows, adapter) == expected
+
+
+def test_response_model_defaults_to_the_return_annotation():
+    async def get_item() -> Item:
+        pass
+
+    adapter = _response_adapter(get_item, None)
+    body = _response_body(SimpleNamespace(id=1, name="Tee", secret="hidden"), adapter)
+    assert body == b'{"id":1,"name":"Tee"}'
+
+
+def test_unannotated_endpoint_is_encoded_as_is():
+    assert _response_adapter(_endpoint, None) is None
+    assert _response_body({"id": 1}, None) == b'{"id":1}'
+
+
+def test_matching_if_none_match_gets_304():
+    body = b'{"id":1}'
+    etag = _cached_json_response(body, _request()).headers["etag"]
+
+    for header in (etag, f"W/{etag}", f'"other", {etag}', "*"):
+        request = _request(headers={"If-None-Match": header})
+        response = _cached_json_response(body, request)
+        assert response.status_code == 304
+        assert response.body == b""
+        assert response.headers["etag"] == etag
+
+    request = _request(headers={"If-None-Match": '"other"'})
+    response = _cached_json_response(body, request)
+    assert response.status_code == 200
+    assert response.body == body
+
+
+def test_wrapper_asks_fastapi_for_the_request():
+    @cache_response(ttl_seconds=60)
+    async def list_items(tags: Optional[List[str]] = None) -> List[Item]:
+        pass
+
+    parameters = inspect.signature(list_items).parameters
+    assert list(parameters) == ["tags", "_cache_request"]
+    assert parameters["_cache_request"].annotation is Request
+    assert parameters["_cache_request"].kind is inspect.Parameter.KEYWORD_ONLY
+
+
+@pytest.mark.anyio
+async def test_cache_entries_are_separated_by_query(redis_client):
+    calls = []
+
+    @cache_response(ttl_seconds=60)
+    async def list_items(tags: Optional[List[str]] = None) -> List[Item]:
+        calls.append(tags)
+        return [{"id": len(calls), "name": ",".join(tags), "secret": "hidden"}]
+
+    first = await list_items(tags=["a"], _cache_request=_request(query=b"tags=a"))
+    again = await list_items(tags=["a"], _cache_request=_request(query=b"tags=a"))
+    other = await list_items(
+        tags=["a", "b"], _cache_request=_request(query=b"tags=a&tags=b")
+    )
+
+    assert calls == [["a"], ["a", "b"]]
+    assert first.body == again.body == b'[{"id":1,"name":"a"}]'
+    assert other.body == b'[{"id":2,"name":"a,b"}]'
+
+
+@pytest.mark.anyio
+async def test_cache_hit_honors_if_none_match(redis_client):
+    @cache_response(ttl_seconds=60)
+    async def get_item() -> Item:
+        return Item(id=1, name="Tee")
+
+    first = await get_item(_cache_request=_request())
+    etag = first.headers["etag"]
+    cached = await get_item(_cache_request=_request(headers={"If-None-Match": etag}))
+
+    assert first.status_code == 200
+    assert cached.status_code == 304
+
+
+@pytest.mark.anyio
+async def test_authenticated_calls_are_not_shared(redis_client):
+    calls = []
+
+    @cache_response(ttl_seconds=60)
+    async def get_item(current_user: Optional[dict] = None) -> Item:
+        calls.append(current_user)
+        return Item(id=1, name="Tee")
+
+    user = {"uid": "user-1"}
+    await get_item(current_user=user, _cache_request=_request())
+    await get_item(current_user=user, _cache_request=_request())
+
+    assert calls == [user, user]
+
+
+def test_rate_limit_identity_prefers_user_then_client_address():
+    def identity(current_user=None, client=("203.0.113.1", 1)):
+        kwargs = {"current_user": current_user} if current_user else {}
+        return _rate_limit_identity(kwargs, _request(client=client))
+
+    assert identity(current_user={"uid": "u1"}) == "user:u1"
+    assert identity(client=("203.0.113.1", 1)) == "ip:203.0.113.1"
+    assert identity(client=("203.0.113.2", 1)) == "ip:203.0.113.2"
+    assert identity(client=None) == "anon"
+
+
+def test_rate_limit_wrapper_asks_fastapi_for_the_request():
+    @rate_limit(requests_per_minute=5)
+    async def create_item():
+        pass
+
+    parameter = inspect.signature(create_item).parameters["_rate_limit_request"]
+    assert parameter.annotation is Request
+
+
+@pytest.mark.anyio
+async def test_rate_limit_buckets_callers_separately(redis_client):
+    @rate_limit(requests_per_minute=3)
+    async def create_item(current_user: Optional[dict] = None):
+        return "ok"
+
+    first_client = _request(client=("203.0.113.1", 1))
+    for _ in range(3):
+        assert await create_item(_rate_limit_request=first_client) == "ok"
+    with pytest.raises(TooManyRequestsError):
+        await create_item(_rate_limit_request=first_client)
+
+    second_client = _request(client=("203.0.113.2", 1))
+    assert await create_item(_rate_limit_request=second_client) == "ok"
+    # An authenticated caller is counted by user, not by address
+    user = {"uid": "u1"}
+    result = await create_item(current_user=user, _rate_limit_request=first_client)
+    assert result == "ok"
+
+
+@pytest.mark.anyio
+async def test_rate_limit_window_slides_over_the_previous_minute(redis_client):
+    @rate_limit(requests_per_minute=3)
+    async def create_item():
+        return "ok"
+
+    # A burst at the end of the previous minute still counts against this one
+    endpoint = f"{create_item.__module__}.{create_item.__qualname__}"
+    previous_key = f"rl:{endpoint}:ip:203.0.113.1:{int(time.time()) // 60 - 1}"
+    await redis_client.set(previous_key, 10_000, ex=120)
+
+    with pytest.raises(TooManyRequestsError):
+        await create_item(_rate_limit_request=_request(client=("203.0.113.1", 1)))
@@ -0,0 +1,69 @@
+"""
+Tests for file data access.
+"""
+
+from uuid import uuid4
+
+import pytest
+
+from app.repositories.file import STORAGE_STATS_CACHE_KEY, FileRepository
+
+pytestmark = pytest.mark.anyio
+
+
+def _file_data() -> dict:
+    """Minimal column values for a new file."""
+    name = f"stats-test-{uuid4().hex}.png"
+    return {
+        "filename": name,
+        "original_filename": name,
+        "content_type": "image/png",
+        "size": 1024,
+        "url": f"https://example.com/{name}",
+        "storage_path": f"uploads/{name}",
+    }
+
+
+@pytest.fixture
+async def cached_statistics(redis_client):
+    """Seed the storage statistics entry and remove it afterwards."""
+    await redis_client.set(STORAGE_STATS_CACHE_KEY, b"{}")
+    try:
+        yield redis_client
+    finally:
+        await redis_client.delete(STORAGE_STATS_CACHE_KEY)
+
+
+async def test_statistics_are_dropped_after_create_commits(
+    db_session, cached_statistics
+):
+    await FileRepository(db_session).create(_file_data())
+
+    # Until the commit other requests still see the old files
+    assert await cached_statistics.exists(STORAGE_STATS_CACHE_KEY)
+    await db_session.commit()
+    assert not await cached_statistics.exists(STORAGE_STATS_CACHE_KEY)
+
+
+async def test_statistics_are_dropped_after_delete_commits(
+    db_session, cached_statistics
+):
+    repository = FileRepository(db_session)
+    file_record = await repository.create(_file_data())
+    await db_session.commit()
+    await cached_statistics.set(STORAGE_STATS_CACHE_KEY, b"{}")
+
+    assert await repository.delete(file_record.id)
+    assert await cached_statistics.exists(STORAGE_STATS_CACHE_KEY)
+    await db_session.commit()
+    assert not await cached_statistics.exists(STORAGE_STATS_CACHE_KEY)
+
+
+async def test_statistics_are_kept_when_the_write_rolls_back(
+    db_session, cached_statistics
+):
+    await FileRepository(db_session).create(_file_data())
+    await db_session.rollback()
+    await db_session.commit()
+
+    assert await cached_statistics.exists(STORAGE_STATS_CACHE_KEY)
@@ -0,0 +1,92 @@
+"""
+Tests for pagination cursors and keyset paging in BaseRepository.get_all.
+"""
+
+from datetime import datetime, timedelta, timezone
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.repositories.collection import CollectionRepository
+from app.utils.pagination import decode_cursor, encode_cursor
+
+# Year no real collection uses, so pages only see the rows created here
+TEST_YEAR = 1901
+
+
+def test_cursor_round_trip():
+    created_at = datetime(2024, 5, 17, 9, 30, 12, 123456, tzinfo=timezone.utc)
+    id = uuid4()
+    assert decode_cursor(encode_cursor(created_at, id)) == (created_at, id)
+
+
+def test_cursor_treats_naive_timestamps_as_utc():
+    naive = datetime(2024, 5, 17, 9, 30, 12, 123456)
+    created_at, _ = decode_cursor(encode_cursor(naive, uuid4()))
+    assert created_at == naive.replace(tzinfo=timezone.utc)
+
+
+def test_cursor_keeps_the_instant_of_other_offsets():
+    local = datetime(2024, 5, 17, 11, 30, tzinfo=timezone(timedelta(hours=2)))
+    created_at, _ = decode_cursor(encode_cursor(local, uuid4()))
+    assert created_at == local
+
+
+def test_cursor_before_epoch_round_trips():
+    created_at = datetime(1960, 1, 1, tzinfo=timezone.utc)
+    id = UUID(int=1)
+    assert decode_cursor(encode_cursor(created_at, id)) == (created_at, id)
+
+
+def test_cursor_is_url_safe():
+    cursor = encode_cursor(datetime.now(timezone.utc), UUID(int=(1 << 128) - 1))
+    assert not set(cursor) & set("+/=")
+
+
+@pytest.mark.parametrize("cursor", [
+    "",
+    "not a cursor",
+    "AAAA",
+    encode_cursor(datetime.now(timezone.utc), uuid4())[:-4],
+])
+def test_malformed_cursor_raises_value_error(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+@pytest.mark.anyio
+async def test_keyset_pages_walk_every_row_once_newest_first(db_session):
+    repository = CollectionRepository(db_session)
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    # Two rows share a timestamp, so the id has to break the tie
+    offsets = [0, 1, 1, 2, 3, 4, 5]
+    created = await repository.bulk_create([
+        {
+            "name": f"Keyset {i}",
+            "slug": f"keyset-test-{uuid4().hex}",
+            "season": "Spring",
+            "year": TEST_YEAR,
+            "created_at": base + timedelta(minutes=offset),
+        }
+        for i, offset in enumerate(offsets)
+    ])
+    expected = [
+        collection.id for collection in
+        sorted(created, key=lambda c: (c.created_at, c.id), reverse=True)
+    ]
+
+    filters = {"year": TEST_YEAR}
+    first_page = await repository.get_all(limit=3, filters=filters)
+    seen = [collection.id for collection in first_page]
+    page = first_page
+    while page:
+        last = page[-1]
+        after = decode_cursor(encode_cursor(last.created_at, last.id))
+        page = await repository.get_all(limit=3, filters=filters, after=after)
+        seen.extend(collection.id for collection in page)
+
+    assert seen == expected
+
+    # The first offset page lines up with the cursor pages
+    offset_page = await repository.get_all(skip=3, limit=3, filters=filters)
+    assert [collection.id for collection in offset_page] == expected[3:6]
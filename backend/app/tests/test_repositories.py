@@ -0,0 +1,164 @@
+"""
+Tests for BaseRepository write paths, run against Collection.
+"""
+
+from contextlib import contextmanager
+from typing import List
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event, inspect
+
+from app.repositories.base import COPY_THRESHOLD
+from app.repositories.collection import CollectionRepository
+
+pytestmark = pytest.mark.anyio
+
+# Year no real collection uses, so counts only see the rows created here
+TEST_YEAR = 1902
+
+
+def _collection_data(name: str, **extra) -> dict:
+    """Minimal column values for a new collection."""
+    return {
+        "name": name,
+        "slug": f"repository-test-{uuid4().hex}",
+        "season": "Fall",
+        "year": TEST_YEAR,
+        **extra,
+    }
+
+
+def _unloaded(instance, *names: str) -> set:
+    """Names among the given attributes that would need a lazy load to read."""
+    return set(names) & inspect(instance).unloaded
+
+
+@contextmanager
+def _statements(session):
+    """Collect the SQL statements executed on the session's connection."""
+    statements: List[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+async def test_bulk_create_copies_large_batches(db_session):
+    repository = CollectionRepository(db_session)
+    rows = [
+        _collection_data(f"Copy {i}", extra_data={"position": i})
+        for i in range(COPY_THRESHOLD)
+    ]
+
+    with _statements(db_session) as statements:
+        created = await repository.bulk_create(rows, user_id="firebase-uid")
+
+    # Rows were streamed with COPY; only the reload SELECT went through SQL
+    assert not [s for s in statements if s.lstrip().upper().startswith("INSERT")]
+
+    assert [c.slug for c in created] == [row["slug"] for row in rows]
+    assert [c.extra_data["position"] for c in created] == list(range(COPY_THRESHOLD))
+    for collection in created:
+        assert collection.id is not None
+        assert collection.created_at is not None
+        assert collection.created_by == "firebase-uid"
+        assert collection.status == "draft"
+        assert collection.product_count == 0
+
+    assert await repository.count(filters={"year": TEST_YEAR}) == COPY_THRESHOLD
+
+
+async def test_bulk_create_inserts_small_batches(db_session):
+    repository = CollectionRepository(db_session)
+    rows = [_collection_data(f"Insert {i}") for i in range(3)]
+
+    with _statements(db_session) as statements:
+        created = await repository.bulk_create(rows)
+
+    assert [s for s in statements if s.lstrip().upper().startswith("INSERT")]
+    assert [c.slug for c in created] == [row["slug"] for row in rows]
+
+
+async def test_create_returns_server_values_and_column_properties(db_session):
+    repository = CollectionRepository(db_session)
+
+    collection = await repository.create(_collection_data("Created"), user_id="creator")
+
+    assert not _unloaded(collection, "id", "created_at", "status", "product_count")
+    assert collection.created_at is not None
+    assert collection.created_by == "creator"
+    assert collection.status == "draft"
+    assert collection.product_count == 0
+
+
+async def test_small_bulk_create_loads_column_properties(db_session):
+    repository = CollectionRepository(db_session)
+
+    rows = [_collection_data(f"Bulk {i}") for i in range(3)]
+    created = await repository.bulk_create(rows)
+
+    for collection in created:
+        assert not _unloaded(collection, "created_at", "product_count")
+        assert collection.product_count == 0
+
+
+async def test_update_returns_the_row_with_column_properties_loaded(db_session):
+    repository = CollectionRepository(db_session)
+    collection = await repository.create(_collection_data("Before"))
+
+    updated = await repository.update(collection.id, {"name": "After"}, "editor")
+
+    assert updated is collection
+    assert not _unloaded(updated, "name", "updated_at", "updated_by", "product_count")
+    assert updated.name == "After"
+    assert updated.updated_by == "editor"
+    assert updated.product_count == 0
+
+
+async def test_update_skips_missing_and_deleted_rows(db_session):
+    repository = CollectionRepository(db_session)
+    assert await repository.update(uuid4(), {"name": "Nobody"}) is None
+
+    collection = await repository.create(_collection_data("Deleted"))
+    assert await repository.delete(collection.id)
+    assert await repository.update(collection.id, {"name": "Nobody"}) is None
+
+
+async def test_restore_returns_the_row_with_column_properties_loaded(db_session):
+    repository = CollectionRepository(db_session)
+    collection = await repository.create(_collection_data("Restored"))
+    assert await repository.delete(collection.id)
+
+    restored = await repository.restore(collection.id, user_id="editor")
+
+    assert not _unloaded(restored, "is_deleted", "deleted_at", "product_count")
+    assert restored.is_deleted is False
+    assert restored.deleted_at is None
+    assert restored.product_count == 0
+    # Only soft-deleted rows can be restored
+    assert await repository.restore(collection.id) is None
+
+
+async def test_iter_all_streams_rows_and_closes_when_stopped_early(db_session):
+    repository = CollectionRepository(db_session)
+    rows = [_collection_data(f"Stream {i}") for i in range(5)]
+    await repository.bulk_create(rows)
+    filters = {"year": TEST_YEAR}
+
+    stream = repository.iter_all(filters=filters, order_by="slug", batch_size=2)
+    streamed = [collection.slug async for collection in stream]
+    assert streamed == sorted(row["slug"] for row in rows)
+
+    stream = repository.iter_all(filters=filters, batch_size=2)
+    async for _ in stream:
+        break
+    # Closing mid-batch releases the cursor, leaving the session usable
+    await stream.aclose()
+    assert await repository.count(filters=filters) == len(rows)
@@ -0,0 +1,105 @@
+"""
+Tests for InputSanitizationMiddleware's streaming body scan.
+"""
+
+from typing import List
+
+import pytest
+
+from app.core.exceptions import BadRequestError
+from app.core.validation_middleware import InputSanitizationMiddleware
+
+pytestmark = pytest.mark.anyio
+
+
+async def _send(
+    chunks: List[bytes],
+    method: str = "POST",
+    content_type: bytes = b"application/json"
+) -> bytes:
+    """Stream chunks through the middleware and return the body the app read."""
+    messages = [
+        {"type": "http.request", "body": chunk, "more_body": i < len(chunks) - 1}
+        for i, chunk in enumerate(chunks)
+    ]
+    received = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def app(scope, receive, send):
+        while True:
+            message = await receive()
+            received.append(message.get("body", b""))
+            if not message.get("more_body"):
+                break
+
+    scope = {
+        "type": "http",
+        "method": method,
+        "headers": [(b"content-type", content_type)],
+    }
+    await InputSanitizationMiddleware(app)(scope, receive, None)
+    return b"".join(received)
+
+
+async def test_clean_body_passes_through_unchanged():
+    chunks = [b'{"name": "Summer', b' Breeze", "year": ', b"2024}"]
+    assert await _send(chunks) == b"".join(chunks)
+
+
+async def test_pattern_in_single_chunk_is_rejected():
+    with pytest.raises(BadRequestError):
+        await _send([b'{"q": "1 UNION SELECT password"}'])
+
+
+async def test_keyword_split_across_chunks_is_rejected():
+    with pytest.raises(BadRequestError):
+        await _send([b'{"q": "1; DRO', b'P TABLE users"}'])
+
+
+async def test_entity_split_across_chunks_is_rejected():
+    with pytest.raises(BadRequestError):
+        await _send([b'{"q": "a &l', b't; b"}'])
+
+
+async def test_script_split_across_chunks_is_rejected():
+    with pytest.raises(BadRequestError):
+        await _send([b'{"q": "java', b'script:alert(1)"}'])
+
+
+async def test_word_boundary_is_kept_across_chunks():
+    # "selected" after "un" is one word, so \bselect\b must not match
+    chunks = [b'{"name": "un', b'selected", "tag": "re', b'create"}']
+    assert await _send(chunks) == b"".join(chunks)
+
+
+async def test_keyword_ending_a_chunk_waits_for_the_next_one():
+    # "create" and "update" only look like whole words until the next chunk
+    for chunks in (
+        [b'{"create', b'd_at": 1}'],
+        [b'{"note": "update', b's welcome"}'],
+    ):
+        assert await _send(chunks) == b"".join(chunks)
+
+
+async def test_keyword_ending_a_chunk_before_a_boundary_is_rejected():
+    with pytest.raises(BadRequestError):
+        await _send([b'{"q": "drop', b' table users"}'])
+
+
+async def test_keyword_ending_the_body_is_rejected():
+    for chunks in ([b'{"q": "x', b'", "a": "drop'], [b'{"q": "1; drop', b""]):
+        with pytest.raises(BadRequestError):
+            await _send(chunks)
+
+
+async def test_binary_bodies_are_not_scanned():
+    chunks = [b"--boundary\r\n<select>", b"</select>\r\n--boundary--"]
+    content_type = b"multipart/form-data; boundary=boundary"
+    assert await _send(chunks, content_type=content_type) == b"".join(chunks)
+
+
+async def test_non_mutating_methods_are_not_scanned():
+    chunks = [b"<select>"]
+    assert await _send(chunks, method="GET") == b"".join(chunks)
@@ -0,0 +1,61 @@
+"""
+Pagination helpers
+
+Opaque cursors for keyset pagination over (created_at, id).
+"""
+
+import base64
+import binascii
+import struct
+from datetime import datetime, timedelta, timezone
+from typing import Tuple
+from uuid import UUID
+
+# Deepest OFFSET accepted; beyond this clients must paginate with a cursor
+MAX_OFFSET = 10_000
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# Microseconds since the epoch (signed 64-bit) followed by the 16 UUID bytes
+_CURSOR_STRUCT = struct.Struct(">q16s")
+
+
+def encode_cursor(created_at: datetime, id: UUID) -> str:
+    """
+    Encode the last-seen row position as an opaque cursor.
+
+    Args:
+        created_at: Creation timestamp of the last row on the page
+        id: ID of the last row on the page
+
+    Returns:
+        URL-safe cursor string
+    """
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    micros = (created_at - _EPOCH) // timedelta(microseconds=1)
+    raw = _CURSOR_STRUCT.pack(micros, id.bytes)
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string
+
+    Returns:
+        Tuple of (created_at, id) of the last row already returned
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        micros, id_bytes = _CURSOR_STRUCT.unpack(base64.urlsafe_b64decode(padded))
+        created_at = _EPOCH + timedelta(microseconds=micros)
+    except (binascii.Error, struct.error, ValueError, OverflowError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+
+    return created_at, UUID(bytes=id_bytes)